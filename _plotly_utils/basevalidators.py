@@ -1079,9 +1079,7 @@ class ColorValidator(BaseValidator):
                 # All good
                 v = v_array
             else:
-                validated_v = [
-                    self.validate_coerce(e, should_raise=False)
-                    for e in v]
+                validated_v = self.validate_coerce_elements(v)
 
                 invalid_els = self.find_invalid_els(v, validated_v)
 
@@ -1096,9 +1094,7 @@ class ColorValidator(BaseValidator):
                     v = copy_to_readonly_numpy_array(
                         validated_v, kind='U')
         elif self.array_ok and is_simple_array(v):
-            validated_v = [
-                self.validate_coerce(e, should_raise=False)
-                for e in v]
+            validated_v = self.validate_coerce_elements(v)
 
             invalid_els = self.find_invalid_els(v, validated_v)
 
@@ -1116,6 +1112,26 @@ class ColorValidator(BaseValidator):
 
         return v
 
+    def validate_coerce_elements(self, v):
+        """
+        Helper to validate/coerce the elements of a color array.
+
+        Arrays of colors typically repeat a small set of color strings
+        (e.g. colors looked up from a colormap), so each distinct string
+        is only validated once.
+        """
+        validated_strs = {}
+        validated_v = []
+        for e in v:
+            if isinstance(e, string_types):
+                if e not in validated_strs:
+                    validated_strs[e] = self.validate_coerce(
+                        e, should_raise=False)
+                validated_v.append(validated_strs[e])
+            else:
+                validated_v.append(self.validate_coerce(e, should_raise=False))
+        return validated_v
+
     def find_invalid_els(self, orig, validated, invalid_els=None):
         """
         Helper method to find invalid elements in orig array.
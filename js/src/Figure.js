@@ -170,6 +170,27 @@ var FigureModel = widgets.DOMWidgetModel.extend({
          */
         _py2js_animate: null,
 
+        /**
+         * @typedef {null|Object} Py2JsAnimationQueueMsg
+         * @property {Number} queue_id
+         *  ID of the Python animation queue that the steps belong to
+         * @property {Array.<Object>} steps
+         *  Array of steps to play after the steps that are already queued.
+         *  Each step has the style_data, layout_data and style_traces
+         *  properties of a Py2JsAnimateMsg
+         * @property {Object} animation_opts
+         *  Animation options as accepted by Plotly.animate, used to play
+         *  each step. animation_opts.frame.duration is the interval between
+         *  steps
+         * @property {Number} trace_edit_id
+         *  Edit ID to use when returning trace deltas using
+         *  the _js2py_traceDeltas message
+         * @property {Number} layout_edit_id
+         *  Edit ID to use when returning layout deltas using
+         *  the _js2py_layoutDelta message
+         */
+        _py2js_animationQueue: null,
+
         /**
          * @typedef {null|Object} Py2JsRemoveLayoutPropsMsg
          * @property {Array.<Array.<String|Number>>} remove_props
@@ -259,7 +280,8 @@ var FigureModel = widgets.DOMWidgetModel.extend({
         /**
          * @typedef {null|Object} Js2PyTraceDeltasMsg
          * @property {Array.<Object>} trace_deltas
-         *  Array of trace delta objects. Each trace delta contains the
+         *  Array of trace delta objects, for the traces touched by the
+         *  trace edit. Each trace delta contains the
          *  trace's uid along with all of the properties of _fullData that
          *  are not identical to those in the FigureModel's _data property
          * @property {Number} trace_edit_id
@@ -267,6 +289,17 @@ var FigureModel = widgets.DOMWidgetModel.extend({
          */
         _js2py_traceDeltas: null,
 
+        /**
+         * @typedef {null|Object} Js2PyAnimationQueueMsg
+         * @property {Number} queue_id
+         *  ID of the Python animation queue
+         * @property {Number} played_steps
+         *  Number of steps of the queue played so far
+         * @property {Number} dropped_steps
+         *  Number of steps of the queue dropped so far because playback
+         *  fell behind the frame rate
+         */
+        _js2py_animationQueue: null,
 
         /**
          * Object representing a collection of points for use in click, hover,
@@ -401,6 +434,8 @@ var FigureModel = widgets.DOMWidgetModel.extend({
         this.on("change:_py2js_relayout", this.do_relayout, this);
         this.on("change:_py2js_update", this.do_update, this);
         this.on("change:_py2js_animate", this.do_animate, this);
+        this.on("change:_py2js_animationQueue",
+            this.do_animationQueue, this);
         this.on("change:_py2js_removeLayoutProps",
             this.do_removeLayoutProps, this);
         this.on("change:_py2js_removeTraceProps",
@@ -602,6 +637,32 @@ var FigureModel = widgets.DOMWidgetModel.extend({
         }
     },
 
+    /**
+     * Handle animationQueue message
+     */
+    do_animationQueue: function () {
+        console.log("FigureModel: do_animationQueue");
+
+        /** @type {Py2JsAnimationQueueMsg} */
+        var msgData = this.get("_py2js_animationQueue");
+        if (msgData !== null) {
+            var steps = msgData.steps;
+            for (var i = 0; i < steps.length; i++) {
+                var styles = steps[i].style_data;
+                var trace_indexes = this._normalize_trace_indexes(
+                    steps[i].style_traces);
+
+                for (var j = 0; j < styles.length; j++) {
+                    var trace = this.get("_data")[trace_indexes[j]];
+                    performRelayoutLike(trace, styles[j]);
+                }
+
+                performRelayoutLike(this.get("_layout"),
+                    steps[i].layout_data);
+            }
+        }
+    },
+
     /**
      * Handle removeLayoutProps message
      */
@@ -659,6 +720,8 @@ var FigureModel = widgets.DOMWidgetModel.extend({
             serialize: js2py_serializer},
         _py2js_animate: { deserialize: py2js_deserializer,
             serialize: js2py_serializer},
+        _py2js_animationQueue: { deserialize: py2js_deserializer,
+            serialize: js2py_serializer},
         _py2js_removeLayoutProps: { deserialize: py2js_deserializer,
             serialize: js2py_serializer},
         _py2js_removeTraceProps: { deserialize: py2js_deserializer,
@@ -674,6 +737,8 @@ var FigureModel = widgets.DOMWidgetModel.extend({
         _js2py_traceDeltas: { deserialize: py2js_deserializer,
             serialize: js2py_serializer},
         _js2py_pointsCallback: { deserialize: py2js_deserializer,
+            serialize: js2py_serializer},
+        _js2py_animationQueue: { deserialize: py2js_deserializer,
             serialize: js2py_serializer}
     }, widgets.DOMWidgetModel.serializers)
 });
@@ -719,12 +784,29 @@ var FigureView = widgets.DOMWidgetView.extend({
             this.do_update, this);
         this.model.on("change:_py2js_animate",
             this.do_animate, this);
+        this.model.on("change:_py2js_animationQueue",
+            this.do_animationQueue, this);
 
         // Get message ids
         // ---------------------
         var layout_edit_id = this.model.get("_last_layout_edit_id");
         var trace_edit_id = this.model.get("_last_trace_edit_id");
 
+        // Initialize pending trace deltas
+        // -------------------------------
+        // Object used as a set of the uids of the traces touched by trace
+        // edits whose deltas haven't been sent yet (See _sendTraceDeltas)
+        this._pendingTraceDeltaUids = {};
+
+        // Initialize animation queue playback
+        // -----------------------------------
+        // Steps of animation queues waiting to be played, the time at
+        // which the next step is due (null when playback is idle), and the
+        // played / dropped step counts of each animation queue
+        this._queuedSteps = [];
+        this._nextStepTime = null;
+        this._animationQueueStats = {};
+
         // Set view UID
         // ------------
         this.viewID = PlotlyIndex.randstr();
@@ -1184,7 +1266,10 @@ var FigureView = widgets.DOMWidgetView.extend({
             Plotly.addTraces(this.el, msgData.trace_data).then(function () {
 
                 // ### Send trace deltas ###
-                that._sendTraceDeltas(msgData.trace_edit_id);
+                // We create an array of deltas corresponding to the new
+                // traces.
+                that._sendTraceDeltas(msgData.trace_edit_id,
+                    _.range(prevNumTraces, that.el.data.length));
 
                 // ### Send layout delta ###
                 var layout_edit_id = msgData.layout_edit_id;
@@ -1208,8 +1293,10 @@ var FigureView = widgets.DOMWidgetView.extend({
             Plotly.deleteTraces(this.el, delete_inds).then(function () {
 
                 // ### Send trace deltas ###
+                // No remaining trace was touched, but the message still
+                // completes the trace edit on the Python side
                 var trace_edit_id = msgData.trace_edit_id;
-                that._sendTraceDeltas(trace_edit_id);
+                that._sendTraceDeltas(trace_edit_id, []);
 
                 // ### Send layout delta ###
                 var layout_edit_id = msgData.layout_edit_id;
@@ -1262,7 +1349,7 @@ var FigureView = widgets.DOMWidgetView.extend({
             // ### Send trace deltas ###
             // We create an array of deltas corresponding to the restyled
             // traces.
-            this._sendTraceDeltas(msgData.trace_edit_id);
+            this._sendTraceDeltas(msgData.trace_edit_id, traceIndexes);
 
             // ### Send layout delta ###
             var layout_edit_id = msgData.layout_edit_id;
@@ -1306,13 +1393,17 @@ var FigureView = widgets.DOMWidgetView.extend({
             var traceIndexes = this.model._normalize_trace_indexes(
                 msgData.style_traces);
 
+            // Only the styled traces are touched, none for a layout-only
+            // update
+            var styledTraces = _.isEmpty(style) ? [] : traceIndexes;
+
             style["_doNotReportToPy"] = true;
                 Plotly.update(this.el, style, layout, traceIndexes);
 
             // ### Send trace deltas ###
             // We create an array of deltas corresponding to the updated
             // traces.
-            this._sendTraceDeltas(msgData.trace_edit_id);
+            this._sendTraceDeltas(msgData.trace_edit_id, styledTraces);
 
             // ### Send layout delta ###
             var layout_edit_id = msgData.layout_edit_id;
@@ -1355,7 +1446,8 @@ var FigureView = widgets.DOMWidgetView.extend({
                     // ### Send trace deltas ###
                     // We create an array of deltas corresponding to the
                     // animated traces.
-                    that._sendTraceDeltas(msgData.trace_edit_id);
+                    that._sendTraceDeltas(msgData.trace_edit_id,
+                        traceIndexes);
 
                     // ### Send layout delta ###
                     var layout_edit_id = msgData.layout_edit_id;
@@ -1365,6 +1457,168 @@ var FigureView = widgets.DOMWidgetView.extend({
         }
     },
 
+    /**
+     * Handle animationQueue request
+     *
+     * The steps are appended to the steps already queued by this view,
+     * and playback is started if it is idle
+     */
+    do_animationQueue: function() {
+        console.log("FigureView: do_animationQueue");
+
+        /** @type {Py2JsAnimationQueueMsg} */
+        var msgData = this.model.get("_py2js_animationQueue");
+
+        if (msgData !== null) {
+            var steps = msgData.steps;
+
+            // The edit ids of the chunk are reported back once its last
+            // step has been played, along with the traces the chunk
+            // touched
+            var chunkTraces = _.uniq(_.flatten(_.map(steps, function (step) {
+                return step.style_data.length > 0 ? step.style_traces : [];
+            })));
+            var chunkEnd = {
+                queue_id: msgData.queue_id,
+                trace_edit_id: msgData.trace_edit_id,
+                layout_edit_id: msgData.layout_edit_id,
+                trace_indexes: chunkTraces
+            };
+
+            for (var i = 0; i < steps.length; i++) {
+                this._queuedSteps.push({
+                    queue_id: msgData.queue_id,
+                    style_data: steps[i].style_data,
+                    layout_data: steps[i].layout_data,
+                    style_traces: steps[i].style_traces,
+                    animation_opts: msgData.animation_opts,
+                    chunk_ends: i === steps.length - 1 ? [chunkEnd] : []
+                });
+            }
+
+            if (this._nextStepTime === null) {
+                this._nextStepTime = performance.now();
+                this._playQueuedSteps();
+            }
+        }
+    },
+
+    /**
+     * Play the next queued animation step, then schedule the following
+     * one at the next frame interval
+     *
+     * When playback has fallen behind, so that the step after the next
+     * one is already due, the next step is dropped and its updates are
+     * merged into the step after it
+     * @private
+     */
+    _playQueuedSteps: function() {
+        var queuedSteps = this._queuedSteps;
+        if (queuedSteps.length === 0) {
+            this._nextStepTime = null;
+            return;
+        }
+
+        var now = performance.now();
+        var step = queuedSteps.shift();
+        var interval = step.animation_opts.frame.duration;
+
+        // ### Drop late steps ###
+        while (queuedSteps.length > 0 &&
+               now >= this._nextStepTime + interval) {
+            this._queueStats(step.queue_id).dropped_steps += 1;
+            step = mergeAnimationSteps(step, queuedSteps.shift());
+            this._nextStepTime += interval;
+        }
+        this._queueStats(step.queue_id).played_steps += 1;
+
+        var animationData = {
+            data: step.style_data,
+            layout: step.layout_data,
+            traces: step.style_traces
+        };
+
+        animationData["_doNotReportToPy"] = true;
+        var that = this;
+
+        /**
+         * Report the chunks that end with this step, then schedule the
+         * next step
+         */
+        function onStepDone() {
+
+            // ### Report completed chunks ###
+            for (var i = 0; i < step.chunk_ends.length; i++) {
+                var chunkEnd = step.chunk_ends[i];
+                that._sendTraceDeltas(chunkEnd.trace_edit_id,
+                    chunkEnd.trace_indexes);
+                that._sendLayoutDelta(chunkEnd.layout_edit_id);
+                that._sendAnimationQueueStats(chunkEnd.queue_id);
+            }
+
+            // ### Schedule next step ###
+            that._nextStepTime += interval;
+            var delay = Math.max(0, that._nextStepTime - performance.now());
+            setTimeout(function () {
+                that._playQueuedSteps();
+            }, delay);
+        }
+
+        /**
+         * The animation was interrupted (e.g. by another animation). The
+         * step counts as dropped, and playback resumes from now, so that
+         * the interruption doesn't cause the following steps to be
+         * dropped as late
+         */
+        function onStepInterrupted() {
+            var stats = that._queueStats(step.queue_id);
+            stats.played_steps -= 1;
+            stats.dropped_steps += 1;
+            that._nextStepTime = performance.now();
+            onStepDone();
+        }
+
+        Plotly.animate(this.el, animationData, step.animation_opts).then(
+            onStepDone, onStepInterrupted);
+    },
+
+    /**
+     * Return the played / dropped step counts of an animation queue
+     *
+     * @param {Number} queue_id
+     * @returns {{played_steps: Number, dropped_steps: Number}}
+     * @private
+     */
+    _queueStats: function(queue_id) {
+        if (!this._animationQueueStats.hasOwnProperty(queue_id)) {
+            this._animationQueueStats[queue_id] = {
+                played_steps: 0,
+                dropped_steps: 0
+            };
+        }
+        return this._animationQueueStats[queue_id];
+    },
+
+    /**
+     * Send the played / dropped step counts of an animation queue to the
+     * Python side
+     *
+     * @param {Number} queue_id
+     * @private
+     */
+    _sendAnimationQueueStats: function(queue_id) {
+        var stats = this._queueStats(queue_id);
+
+        /** @type{Js2PyAnimationQueueMsg} */
+        var animationQueueMsg = {
+            queue_id: queue_id,
+            played_steps: stats.played_steps,
+            dropped_steps: stats.dropped_steps};
+
+        this.model.set("_js2py_animationQueue", animationQueueMsg);
+        this.touch();
+    },
+
     /**
      * Construct layout delta object and send layoutDelta message to the
      * Python side
@@ -1389,26 +1643,47 @@ var FigureView = widgets.DOMWidgetView.extend({
     },
 
     /**
-     * Construct trace deltas array for the requested trace indexes and
-     * send traceDeltas message to the Python side
-     *  Array of indexes of traces for which to compute deltas
+     * Construct trace deltas array for the traces touched by a trace edit
+     * and send traceDeltas message to the Python side
+     *
      * @param trace_edit_id
      *  Edit ID of message that triggered the creation of trace deltas
+     * @param {undefined|Array.<Number>} traceIndexes
+     *  Array of indexes of the traces touched by the edit, for which to
+     *  compute deltas. Defaults to all traces
      * @private
      */
-    _sendTraceDeltas: function (trace_edit_id) {
+    _sendTraceDeltas: function (trace_edit_id, traceIndexes) {
 
         var trace_data = this.model.get("_data");
-        var traceIndexes = _.range(trace_data.length);
-        var trace_deltas = new Array(traceIndexes.length);
-
         var fullData = this.getFullData();
+        if (traceIndexes === undefined) {
+            traceIndexes = _.range(trace_data.length);
+        }
+
+        // ### Collect touched traces ###
+        // The Python side only applies the deltas of its most recent trace
+        // edit. So the traces touched by an edit that has been superseded
+        // by a newer one stay pending, and their deltas are sent along
+        // with those of the newer edit.
+        var pendingUids = this._pendingTraceDeltaUids;
         for (var i = 0; i < traceIndexes.length; i++) {
-            var traceInd = traceIndexes[i];
-            trace_deltas[i] = createDeltaObject(
-                fullData[traceInd], trace_data[traceInd]);
+            pendingUids[fullData[traceIndexes[i]].uid] = true;
+        }
+
+        if (trace_edit_id !== this.model.get("_last_trace_edit_id")) {
+            return;
         }
 
+        var trace_deltas = [];
+        for (var traceInd = 0; traceInd < fullData.length; traceInd++) {
+            if (pendingUids.hasOwnProperty(fullData[traceInd].uid)) {
+                trace_deltas.push(createDeltaObject(
+                    fullData[traceInd], trace_data[traceInd]));
+            }
+        }
+        this._pendingTraceDeltaUids = {};
+
         /** @type{Js2PyTraceDeltasMsg} */
         var traceDeltasMsg = {
             trace_deltas: trace_deltas,
@@ -1848,6 +2123,44 @@ function createDeltaObject(fullObj, removeObj) {
     return res
 }
 
+/**
+ * Merge two consecutive animation queue steps into a single step, whose
+ * updates are those of the first step overridden by those of the second
+ *
+ * @param {Object} step
+ *  The earlier step
+ * @param {Object} nextStep
+ *  The later step
+ * @returns {Object}
+ *  The merged step
+ */
+function mergeAnimationSteps(step, nextStep) {
+    var traceStyles = {};
+    var traceIndexes = [];
+
+    _.forEach([step, nextStep], function (s) {
+        for (var i = 0; i < s.style_data.length; i++) {
+            var traceIndex = s.style_traces[i];
+            if (!traceStyles.hasOwnProperty(traceIndex)) {
+                traceStyles[traceIndex] = {};
+                traceIndexes.push(traceIndex);
+            }
+            _.assign(traceStyles[traceIndex], s.style_data[i]);
+        }
+    });
+
+    return {
+        queue_id: nextStep.queue_id,
+        style_data: _.map(traceIndexes, function (traceIndex) {
+            return traceStyles[traceIndex];
+        }),
+        layout_data: _.assign({}, step.layout_data, nextStep.layout_data),
+        style_traces: traceIndexes,
+        animation_opts: nextStep.animation_opts,
+        chunk_ends: step.chunk_ends.concat(nextStep.chunk_ends)
+    };
+}
+
 module.exports = {
     FigureView : FigureView,
     FigureModel: FigureModel
@@ -1,4 +1,15 @@
-from _plotly_utils.basevalidators import EnumeratedValidator, NumberValidator
+import itertools
+from contextlib import contextmanager
+
+from six import string_types
+
+from _plotly_utils.basevalidators import (EnumeratedValidator,
+                                          NumberValidator,
+                                          copy_to_readonly_numpy_array,
+                                          is_array)
+from plotly.optional_imports import get_module
+
+np = get_module('numpy')
 
 
 class EasingValidator(EnumeratedValidator):
@@ -53,3 +64,529 @@ class DurationValidator(NumberValidator):
         super(DurationValidator, self).__init__(plotly_name=plotly_name,
                                                 parent_name='batch_animate',
                                                 min=0)
+
+
+class ColumnarFrames(object):
+    """
+    Animation frames stored column-wise: each animated trace property is a
+    stacked numpy array, with one element (row) per frame.
+
+    A ColumnarFrames instance can be assigned to the `frames` property of a
+    figure in place of a list of frames. The frames are only materialized
+    when the figure is exported (e.g. by `to_dict`), as dicts that share
+    memory with the stacked arrays, and the JSON writers of plotly.io
+    serialize them one frame at a time.
+
+    Only the first frame is validated. The other frames hold the other
+    rows of the same stacked arrays.
+
+    Usage example: animate the y values of the first trace of a figure
+    ```
+    import numpy as np
+    import plotly.graph_objs as go
+    from plotly.animation import ColumnarFrames
+
+    x = np.linspace(0, 10, 50000)
+    ys = np.sin(x + 0.01 * np.arange(2000)[:, None])  # frames x points
+    fig = go.Figure(data=[go.Scatter(x=x, y=ys[0])])
+    fig.frames = ColumnarFrames({'y': ys})
+    ```
+    """
+    def __init__(self, data, traces=None, names=None, constants=None):
+        """
+        Construct columnar frames
+
+        Parameters
+        ----------
+        data : dict|list[dict]
+            For each animated trace, a dict from property path strings
+            (e.g. 'y' or 'marker.color') to stacked arrays of per frame
+            values (numpy arrays or array-likes), element i being the
+            property value in frame i. The arrays are copied.
+        traces : list[int]|None
+            Indexes of the animated traces, one per element of `data`. If
+            None, the elements of `data` apply to the first traces of the
+            figure.
+        names : list[str]|None
+            Frame names, one per frame
+        constants : dict|list[dict]|None
+            For each animated trace, a dict from property path strings to
+            property values used in every frame (e.g. the trace 'type', or
+            a two dimensional 'z' array that doesn't change), one per
+            element of `data`
+
+        Raises
+        ------
+        ValueError
+            If there are no stacked arrays, or if the stacked arrays don't
+            all have the same number of frames, or if the first frame is
+            invalid
+        """
+        if np is None:
+            raise ImportError('ColumnarFrames requires numpy')
+
+        # Import here to avoid circular imports
+        from plotly.basedatatypes import BaseFigure, _copy_props
+
+        if isinstance(data, dict):
+            data = [data]
+
+        if constants is None:
+            constants = [{} for _ in data]
+        elif isinstance(constants, dict):
+            constants = [constants]
+
+        if len(constants) != len(data):
+            raise ValueError(
+                'The constants argument must have one dict per element of '
+                'data ({num_traces})\n'
+                '    Received {num_constants} dicts'.format(
+                    num_traces=len(data), num_constants=len(constants)))
+
+        def validate_path(path_str):
+            path = BaseFigure._str_to_dict_path(path_str)
+            if not all(isinstance(p, string_types) for p in path):
+                raise ValueError(
+                    'Invalid property path: {path_str}\n'
+                    '    Paths to elements of compound array properties '
+                    'are not supported by ColumnarFrames'.format(
+                        path_str=path_str))
+            return path
+
+        # Copy stacked arrays
+        # -------------------
+        num_frames = None
+        columns = []
+        first_traces = []
+        for trace_data, trace_constants in zip(data, constants):
+            trace_columns = []
+            first_trace = {}
+            for path_str, val in trace_constants.items():
+                _set_path(first_trace, validate_path(path_str), val)
+
+            for path_str, val in trace_data.items():
+                path = validate_path(path_str)
+
+                if not is_array(val):
+                    raise ValueError(
+                        'The data values of ColumnarFrames must be arrays of '
+                        'per frame values\n'
+                        '    Received {val} for {path_str}. Pass values used '
+                        'in every frame as constants'.format(
+                            val=repr(val), path_str=path_str))
+
+                # The frames share the rows of a read-only copy, so the
+                # caller's array can't change them
+                stacked = copy_to_readonly_numpy_array(val)
+                if num_frames is None:
+                    num_frames = stacked.shape[0]
+                elif stacked.shape[0] != num_frames:
+                    raise ValueError(
+                        'The stacked arrays must all have one element per '
+                        'frame ({num_frames} frames)\n'
+                        '    Received {rows} elements for {path_str}'.format(
+                            num_frames=num_frames,
+                            rows=stacked.shape[0],
+                            path_str=path_str))
+
+                trace_columns.append((path, stacked))
+
+            columns.append(trace_columns)
+            first_traces.append(first_trace)
+
+        if not num_frames:
+            raise ValueError('ColumnarFrames requires at least one array of '
+                             'per frame values')
+
+        if traces is not None and len(traces) != len(data):
+            raise ValueError(
+                'The traces argument must have one trace index per element '
+                'of data ({num_traces})\n'
+                '    Received: {traces}'.format(num_traces=len(data),
+                                                traces=traces))
+
+        if names is not None and len(names) != num_frames:
+            raise ValueError(
+                'The names argument must have one name per frame '
+                '({num_frames})\n'
+                '    Received {num_names} names'.format(
+                    num_frames=num_frames, num_names=len(names)))
+
+        self._num_frames = num_frames
+        self._columns = columns
+        self._traces = list(traces) if traces is not None else None
+        self._names = list(names) if names is not None else None
+
+        # Validate first frame
+        # --------------------
+        # The validated constant properties (and trace type) of each trace
+        # are the templates of the traces of every frame. The templates
+        # keep the validated read-only arrays, which the frames share
+        first_frame = self._build_frame_dict(0, first_traces)
+        from plotly.validators import FramesValidator
+        first_frame = FramesValidator().validate_coerce([first_frame])[0]
+
+        self._templates = []
+        for trace_props, trace_columns in zip(
+                _copy_props(first_frame._props)['data'], columns):
+            for path, _ in trace_columns:
+                _pop_path(trace_props, path)
+            self._templates.append(trace_props)
+
+    def __setstate__(self, state):
+        # Import here to avoid circular imports
+        from plotly.basedatatypes import _set_arrays_readonly
+
+        # numpy arrays are writeable again after being unpickled
+        self.__dict__.update(state)
+        _set_arrays_readonly(self._templates)
+        for trace_columns in self._columns:
+            _set_arrays_readonly([stacked for _, stacked in trace_columns])
+
+    def __len__(self):
+        return self._num_frames
+
+    def __getitem__(self, index):
+        """
+        Materialize a frame
+
+        Parameters
+        ----------
+        index : int
+            Frame index
+
+        Returns
+        -------
+        plotly.graph_objs.Frame
+            New frame object, changes to it are not reflected in the
+            columnar frames
+        """
+        from plotly.graph_objs import Frame
+        return Frame(self.frame_dict(index))
+
+    def __iter__(self):
+        for index in range(self._num_frames):
+            yield self[index]
+
+    def __repr__(self):
+        return ('ColumnarFrames(<{num_frames} frames, {num_traces} '
+                'traces>)'.format(num_frames=self._num_frames,
+                                  num_traces=len(self._columns)))
+
+    def frame_dict(self, index):
+        """
+        Materialize a frame as a dict
+
+        Arrays are not copied: the frame holds read-only views of the rows
+        of the stacked arrays, and shares the read-only arrays of the
+        constant properties with the other frames
+
+        Parameters
+        ----------
+        index : int
+            Frame index
+
+        Returns
+        -------
+        dict
+        """
+        # Import here to avoid circular imports
+        from plotly.basedatatypes import _copy_props
+
+        if index < 0:
+            index += self._num_frames
+        if not 0 <= index < self._num_frames:
+            raise IndexError('frame index out of range')
+
+        return self._build_frame_dict(
+            index, [_copy_props(template) for template in self._templates])
+
+    def _build_frame_dict(self, index, traces):
+        """
+        Build frame dict from the traces of the frame, filling in the rows
+        of the stacked arrays
+        """
+        for trace, trace_columns in zip(traces, self._columns):
+            for path, stacked in trace_columns:
+                _set_path(trace, path, stacked[index])
+
+        frame = {'data': traces}
+        if self._traces is not None:
+            frame['traces'] = list(self._traces)
+        if self._names is not None:
+            frame['name'] = self._names[index]
+        return frame
+
+    def to_plotly_json(self):
+        """
+        Materialize all frames as dicts, see `frame_dict`
+
+        Returns
+        -------
+        list[dict]
+        """
+        return [self.frame_dict(index) for index in range(self._num_frames)]
+
+
+class AnimationQueue(object):
+    """
+    A sequence of batched animation steps, queued for playback by the
+    front end of a figure at a fixed frame rate.
+
+    Animation queues are created by the `animation_queue` context manager
+    of figures, and steps are added with the `step` context manager of the
+    queue.
+    """
+    _queue_ids = itertools.count(1)
+
+    def __init__(self,
+                 figure,
+                 frame_rate=30,
+                 easing='linear',
+                 chunk_size=30,
+                 on_playback=None):
+        """
+        Construct an animation queue
+
+        Parameters
+        ----------
+        figure : plotly.basedatatypes.BaseFigure
+            The figure that is animated
+        frame_rate : number
+            The target number of steps played per second
+        easing : string
+            The easing function used for the transition of each step
+        chunk_size : int
+            The number of steps sent to the front end per message
+        on_playback : callable|None
+            Function of one argument, the queue, called each time the front
+            end reports the playback of a chunk of steps
+        """
+        if not frame_rate > 0:
+            raise ValueError(
+                'The frame_rate argument to animation_queue must be a '
+                'positive number.\n    Received: {val}'.format(val=frame_rate))
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError(
+                'The chunk_size argument to animation_queue must be a '
+                'positive integer.\n    Received: {val}'.format(
+                    val=repr(chunk_size)))
+
+        easing = figure._animation_easing_validator.validate_coerce(easing)
+        frame_duration = 1000.0 / frame_rate
+
+        self._figure = figure
+        self._queue_id = next(AnimationQueue._queue_ids)
+        self._frame_rate = frame_rate
+        self._chunk_size = chunk_size
+        self._on_playback = on_playback
+        self._animation_opts = {
+            'transition': {
+                'duration': frame_duration,
+                'easing': easing
+            },
+            'frame': {
+                'duration': frame_duration
+            }
+        }
+
+        # Steps recorded but not yet sent to the front end
+        self._pending_steps = []
+        self._num_steps = 0
+        self._closed = False
+
+        # Playback state, as reported by the front end
+        self._played_steps = 0
+        self._dropped_steps = 0
+
+    @property
+    def queue_id(self):
+        """
+        Identifier of the queue in the messages exchanged with the front end
+
+        Returns
+        -------
+        int
+        """
+        return self._queue_id
+
+    @property
+    def frame_rate(self):
+        """
+        The target number of steps played per second
+
+        Returns
+        -------
+        number
+        """
+        return self._frame_rate
+
+    @property
+    def animation_opts(self):
+        """
+        Animation options, as accepted by Plotly.animate, used to play each
+        step
+
+        Returns
+        -------
+        dict
+        """
+        return self._animation_opts
+
+    @property
+    def num_steps(self):
+        """
+        The number of steps recorded in the queue
+
+        Returns
+        -------
+        int
+        """
+        return self._num_steps
+
+    @property
+    def played_steps(self):
+        """
+        The number of steps reported as played by the front end
+
+        Returns
+        -------
+        int
+        """
+        return self._played_steps
+
+    @property
+    def dropped_steps(self):
+        """
+        The number of steps the front end reported as dropped because
+        playback fell behind the frame rate. The updates of dropped steps
+        are merged into the next step that is played.
+
+        Returns
+        -------
+        int
+        """
+        return self._dropped_steps
+
+    @property
+    def closed(self):
+        """
+        Whether the queue is closed to new steps
+
+        Returns
+        -------
+        bool
+        """
+        return self._closed
+
+    @contextmanager
+    def step(self):
+        """
+        Context manager to record one step of the animation
+
+        The trace and layout updates made in the context are applied to the
+        figure when the context exits, and queued for playback as a single
+        animation step.
+
+        Raises
+        ------
+        ValueError
+            If the queue is closed, or if the figure is already in a
+            batch_update, batch_animate or step context
+        """
+        figure = self._figure
+        if self._closed:
+            raise ValueError('Steps may not be added to a closed '
+                             'animation queue')
+        if figure._in_batch_mode is True:
+            raise ValueError(
+                'Animation queue steps may not be nested in a batch_update, '
+                'batch_animate or step context')
+
+        try:
+            figure._in_batch_mode = True
+            yield
+        finally:
+            figure._in_batch_mode = False
+            figure._perform_batch_animate(self._animation_opts,
+                                          send_animate=self._add_step)
+
+    def flush(self):
+        """
+        Send the steps recorded since the last flush to the front end
+
+        Returns
+        -------
+        None
+        """
+        if self._pending_steps:
+            steps, self._pending_steps = self._pending_steps, []
+            self._figure._send_animation_queue_msg(self, steps)
+
+    def close(self):
+        """
+        Flush the recorded steps and close the queue to new steps
+
+        Returns
+        -------
+        None
+        """
+        if not self._closed:
+            self.flush()
+            self._closed = True
+
+    def _add_step(self,
+                  styles_data,
+                  relayout_data,
+                  trace_indexes,
+                  animation_opts):
+        """
+        Record an animate operation as a step. Accepts the arguments of
+        the `_send_animate_msg` method of figures.
+        """
+        self._pending_steps.append({
+            'style_data': styles_data,
+            'layout_data': relayout_data,
+            'style_traces': trace_indexes
+        })
+        self._num_steps += 1
+
+        if len(self._pending_steps) >= self._chunk_size:
+            self.flush()
+
+    def _report_playback(self, played_steps, dropped_steps):
+        """
+        Update the playback state with the totals reported by the front end
+        and call the on_playback callback
+        """
+        self._played_steps = played_steps
+        self._dropped_steps = dropped_steps
+        if self._on_playback is not None:
+            self._on_playback(self)
+
+    def __repr__(self):
+        return ('AnimationQueue(queue_id={queue_id}, frame_rate={frame_rate}, '
+                'steps={num_steps}, played={played}, dropped={dropped})'
+                ).format(queue_id=self._queue_id,
+                         frame_rate=self._frame_rate,
+                         num_steps=self._num_steps,
+                         played=self._played_steps,
+                         dropped=self._dropped_steps)
+
+
+def _set_path(props, path, val):
+    """
+    Set a nested property value, creating the parent dicts as needed
+    """
+    for p in path[:-1]:
+        props = props.setdefault(p, {})
+    props[path[-1]] = val
+
+
+def _pop_path(props, path):
+    """
+    Remove a nested property value, if present
+    """
+    for p in path[:-1]:
+        props = props.get(p, {})
+    props.pop(path[-1], None)
@@ -1,6 +1,8 @@
 """Interface to Plotly's /v2/grids endpoints."""
 from __future__ import absolute_import
 
+import six
+
 from plotly.api.v2.utils import build_url, make_params, request
 
 RESOURCE = 'grids'
@@ -10,12 +12,13 @@ def create(body):
     """
     Create a new grid.
 
-    :param (dict) body: A mapping of body param names to values.
+    :param (dict|str) body: A mapping of body param names to values, or its
+        JSON encoding.
     :returns: (requests.Response) Returns response directly from requests.
 
     """
     url = build_url(RESOURCE)
-    return request('post', url, json=body)
+    return request('post', url, **_body_kwargs(body))
 
 
 def retrieve(fid, share_key=None):
@@ -116,12 +119,13 @@ def col_create(fid, body):
     Create a new column (or columns) inside a grid.
 
     :param (str) fid: The `{username}:{idlocal}` identifier. E.g. `foo:88`.
-    :param (dict) body: A mapping of body param names to values.
+    :param (dict|str) body: A mapping of body param names to values, or its
+        JSON encoding.
     :returns: (requests.Response) Returns response directly from requests.
 
     """
     url = build_url(RESOURCE, id=fid, route='col')
-    return request('post', url, json=body)
+    return request('post', url, **_body_kwargs(body))
 
 
 def col_retrieve(fid, uid):
@@ -172,9 +176,23 @@ def row(fid, body):
     Append rows to a grid.
 
     :param (str) fid: The `{username}:{idlocal}` identifier. E.g. `foo:88`.
-    :param (dict) body: A mapping of body param names to values.
+    :param (dict|str) body: A mapping of body param names to values, or its
+        JSON encoding.
     :returns: (requests.Response) Returns response directly from requests.
 
     """
     url = build_url(RESOURCE, id=fid, route='row')
-    return request('post', url, json=body)
+    return request('post', url, **_body_kwargs(body))
+
+
+def _body_kwargs(body):
+    """
+    Request kwargs for a body that may already be JSON-encoded.
+
+    Chunked grid uploads encode each chunk up front to bound its size, so
+    those bodies are passed through as-is instead of being encoded again.
+
+    """
+    if isinstance(body, six.string_types):
+        return {'data': body}
+    return {'json': body}
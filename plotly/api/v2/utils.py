@@ -1,12 +1,24 @@
 from __future__ import absolute_import
 
+import threading
+from multiprocessing.pool import ThreadPool
+
 import requests
+from requests.adapters import HTTPAdapter
 from requests.compat import json as _json
 from requests.exceptions import RequestException
 from retrying import retry
+from six.moves import http_cookiejar
 from plotly import config, exceptions, version, utils
 from plotly.api.utils import basic_auth
 
+DEFAULT_POOL_SIZE = 10
+
+# The session shared by all api requests, see `get_session`.
+_session = None
+_session_pool_size = None
+_session_lock = threading.Lock()
+
 
 def make_params(**kwargs):
     """
@@ -123,6 +135,71 @@ def should_retry(exception):
     return False
 
 
+def get_session(pool_size=None):
+    """
+    Get the `requests.Session` shared by all api v2 requests.
+
+    The session keeps connections alive and pools up to `pool_size`
+    connections per host, so consecutive requests reuse an open (TLS)
+    connection. The session is rebuilt if the pool size changes. Cookies
+    are never stored, requests are authorized by their headers only.
+
+    :param (int) pool_size: Connections to keep per host. Defaults to the
+        `plotly_api_pool_size` config setting.
+    :returns: (requests.Session)
+
+    """
+    global _session, _session_pool_size
+
+    if pool_size is None:
+        pool_size = config.get_config().get('plotly_api_pool_size',
+                                            DEFAULT_POOL_SIZE)
+    with _session_lock:
+        if _session is None or _session_pool_size != pool_size:
+            session = requests.Session()
+            session.cookies.set_policy(
+                http_cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            )
+            adapter = HTTPAdapter(pool_connections=pool_size,
+                                  pool_maxsize=pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session, _session_pool_size = session, pool_size
+        return _session
+
+
+def request_all(calls, max_workers=None):
+    """
+    Make independent api requests concurrently.
+
+    Each call is a function taking no arguments that makes one request,
+    e.g., `functools.partial(v2.plots.create, body)` or
+    `functools.partial(request, 'get', url)`. The calls run on a pool of
+    up to `max_workers` threads which share the pooled connections of
+    `get_session`, and each call is retried on its own like any request.
+
+    :param (list) calls: Functions that each make one request.
+    :param (int) max_workers: The number of threads, defaults to the
+        `plotly_api_pool_size` config setting.
+    :returns: (list) The results of the calls, in the order of `calls`.
+    :raises: The first error raised by a call, once all calls are done.
+
+    """
+    calls = list(calls)
+    if not calls:
+        return []
+    if max_workers is None:
+        max_workers = config.get_config().get('plotly_api_pool_size',
+                                              DEFAULT_POOL_SIZE)
+
+    pool = ThreadPool(min(max_workers, len(calls)))
+    try:
+        return pool.map(lambda call: call(), calls, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
 @retry(wait_exponential_multiplier=1000, wait_exponential_max=16000,
        stop_max_delay=180000, retry_on_exception=should_retry)
 def request(method, url, **kwargs):
@@ -153,10 +230,12 @@ def request(method, url, **kwargs):
                                      cls=utils.PlotlyJSONEncoder)
 
     # The config file determines whether reuqests should *verify*.
-    kwargs['verify'] = config.get_config()['plotly_ssl_verification']
+    cfg = config.get_config()
+    kwargs['verify'] = cfg['plotly_ssl_verification']
+    session = get_session(cfg.get('plotly_api_pool_size', DEFAULT_POOL_SIZE))
 
     try:
-        response = requests.request(method, url, **kwargs)
+        response = session.request(method, url, **kwargs)
     except RequestException as e:
         # The message can be an exception. E.g., MaxRetryError.
         message = str(getattr(e, 'message', 'No message'))
@@ -1,8 +1,13 @@
 import collections
+import hashlib
+import json
 import re
 import six
+import uuid
 from six import string_types
 import warnings
+import weakref
+import zlib
 from contextlib import contextmanager
 from copy import deepcopy, copy
 from pprint import PrettyPrinter
@@ -17,7 +22,7 @@ from _plotly_utils.basevalidators import (
 from . import animation
 from .callbacks import (Points, BoxSelector, LassoSelector,
                         InputDeviceState)
-from .utils import ElidedPrettyPrinter
+from .utils import ElidedPrettyPrinter, PlotlyJSONEncoder
 from .validators import (DataValidator, LayoutValidator, FramesValidator)
 
 
@@ -31,12 +36,244 @@ np = get_module('numpy')
 Undefined = object()
 
 
+# Pickle support
+# --------------
+# Figures and plotly objects pickle (and copy) their already validated
+# properties dicts, numpy arrays included, and are restored by these
+# functions without running the properties through the validators again.
+def _restore_figure(fig_class, fig_props):
+    """
+    Construct a figure from the validated properties of a pickled figure
+
+    Parameters
+    ----------
+    fig_class : type
+        BaseFigure subclass
+    fig_props : dict
+        Dict with 'data', 'layout', 'frames', '_grid_str', and '_grid_ref'
+        keys, see BaseFigure.__reduce__
+
+    Returns
+    -------
+    BaseFigure
+    """
+    for key in ('data', 'layout', 'frames'):
+        _set_arrays_readonly(fig_props[key])
+
+    fig = fig_class()
+    fig._restore_props(fig_props)
+    return fig
+
+
+def _restore_plotly_obj(obj_class, props):
+    """
+    Construct a plotly object from the validated properties of a pickled
+    object
+
+    Parameters
+    ----------
+    obj_class : type
+        BasePlotlyType subclass
+    props : dict
+        Properties dict, see BasePlotlyType.__reduce__
+
+    Returns
+    -------
+    BasePlotlyType
+    """
+    _set_arrays_readonly(props)
+
+    obj = obj_class._new_empty()
+    obj._orphan_props.clear()
+    obj._orphan_props.update(props)
+    obj._restore_children()
+    return obj
+
+
+def _set_arrays_readonly(v):
+    """
+    Clear the writeable flag of the numpy arrays in a restored properties
+    dict / list / value
+
+    Validated arrays are read-only (see copy_to_readonly_numpy_array), but
+    numpy arrays are writeable again after being unpickled
+
+    Parameters
+    ----------
+    v :
+        Properties dict / list / value
+
+    Returns
+    -------
+    None
+    """
+    if isinstance(v, dict):
+        for e in v.values():
+            _set_arrays_readonly(e)
+    elif isinstance(v, (list, tuple)):
+        for e in v:
+            _set_arrays_readonly(e)
+    elif np is not None and isinstance(v, np.ndarray):
+        v.flags.writeable = False
+        if v.dtype.kind == 'O':
+            for e in v.flat:
+                _set_arrays_readonly(e)
+
+
+# Array digests
+# -------------
+# Validated numpy arrays are read-only copies (see
+# copy_to_readonly_numpy_array), so a digest of their contents can be
+# computed once and reused by every later equality check involving the same
+# array object. Computing a digest costs about as much as one direct
+# comparison, so arrays are only digested the second time they are
+# compared. Digests (None for arrays compared once) are cached by array id,
+# along with a weak reference used to detect reuse of the id by another
+# array.
+_array_digests = {}
+_array_digests_max_size = 1024
+
+# Arrays with fewer elements are compared directly
+_array_digest_min_size = 1000
+
+
+def _array_digest(v):
+    """
+    Return a digest of the contents of a read-only numeric numpy array that
+    has already been compared before
+
+    Arrays with the same dtype and shape but different digests are not
+    equal. Float arrays are digested with -0.0 replaced by 0.0, and equal
+    digests don't imply equal arrays.
+
+    Parameters
+    ----------
+    v :
+        Value to digest
+
+    Returns
+    -------
+    tuple|None
+        Tuple of the array's dtype, shape and content checksum, or None if
+        the value is not a large, read-only, contiguous numeric array or if
+        this is the first time it is compared
+    """
+    if (not isinstance(v, np.ndarray) or
+            v.size < _array_digest_min_size or
+            v.flags.writeable or
+            not v.flags.c_contiguous or
+            v.dtype.kind not in 'biuf'):
+        return None
+
+    entry = _array_digests.get(id(v), None)
+    if entry is None or entry[0]() is not v:
+        # First comparison
+        digest = None
+    elif entry[1] is not None:
+        return entry[1]
+    else:
+        data = v + 0.0 if v.dtype.kind == 'f' else v
+        digest = (v.dtype.str, v.shape, zlib.crc32(data.data))
+
+    if len(_array_digests) >= _array_digests_max_size:
+        _array_digests.clear()
+    _array_digests[id(v)] = (weakref.ref(v), digest)
+
+    return digest
+
+
+# Content hashes
+# --------------
+def _props_hash(props):
+    """
+    Return a digest of a properties dict / list / value, see
+    BaseFigure.content_hash
+
+    Parameters
+    ----------
+    props :
+        Value to hash
+
+    Returns
+    -------
+    bytes
+    """
+    h = hashlib.md5()
+    _update_props_hash(h, props, PlotlyJSONEncoder())
+    return h.digest()
+
+
+def _update_props_hash(h, v, encoder):
+    """
+    Feed a canonical encoding of a value to a hash object: dicts by sorted
+    keys, numeric numpy arrays by dtype, shape and buffer, and other values
+    as JSON
+    """
+    if isinstance(v, dict):
+        h.update(b'{')
+        for k in sorted(v):
+            _update_props_hash(h, k, encoder)
+            _update_props_hash(h, v[k], encoder)
+        h.update(b'}')
+    elif (np is not None and
+          isinstance(v, np.ndarray) and
+          v.dtype.kind in 'biuf'):
+        v = np.ascontiguousarray(v)
+        h.update('<{dtype}{shape}>'.format(
+            dtype=v.dtype.str, shape=v.shape).encode('utf-8'))
+        h.update(v.data)
+    else:
+        h.update(json.dumps(
+            v, sort_keys=True, default=encoder.default).encode('utf-8'))
+
+
+# Types of the values that are copied by reference
+_atomic_prop_types = six.string_types + six.integer_types + (float, bool)
+
+
+def _copy_props(v):
+    """
+    Deep copy a properties dict / list / value, sharing the read-only numpy
+    arrays in it
+
+    Read-only arrays are never modified in place, so copies can share them,
+    and equality checks between the copies short-circuit on identity.
+
+    Parameters
+    ----------
+    v :
+        Value to copy
+
+    Returns
+    -------
+    Copy of v
+    """
+    if isinstance(v, dict):
+        return {k: _copy_props(e) for k, e in v.items()}
+    elif isinstance(v, list):
+        return [e if isinstance(e, _atomic_prop_types) else _copy_props(e)
+                for e in v]
+    elif (np is not None and
+          isinstance(v, np.ndarray) and
+          not v.flags.writeable):
+        return v
+    else:
+        return deepcopy(v)
+
+
 class BaseFigure(object):
     """
     Base class for all figure types (both widget and non-widget)
     """
     _bracket_re = re.compile('^(.*)\[(\d+)\]$')
 
+    # Parsed key path strings and their dispatch entries, shared by all
+    # figures. A small set of distinct paths is typically parsed over and
+    # over, see _str_to_dict_path and _dict_path_dispatch_entries.
+    _dict_path_cache = {}
+    _dict_path_dispatch_cache = {}
+    _max_dict_path_cache_size = 10000
+
     # Constructor
     # -----------
     def __init__(self,
@@ -72,7 +309,8 @@ class BaseFigure(object):
             contains a 'layout' key, then this property is ignored.
         frames
             A list or tuple of `plotly.graph_objs.Frame` objects (or dicts
-            that can be coerced into Frame objects)
+            that can be coerced into Frame objects), or a
+            `plotly.animation.ColumnarFrames` instance
 
             If the `data` property is a BaseFigure instance, or a dict that
             contains a 'frames' key, then this property is ignored.
@@ -144,7 +382,7 @@ class BaseFigure(object):
         # ### Import clone of trace properties ###
         # The _data property is a list of dicts containing the properties
         # explicitly set by the user for each trace.
-        self._data = [deepcopy(trace._props) for trace in data]
+        self._data = [_copy_props(trace._props) for trace in data]
 
         # ### Create data defaults ###
         # _data_defaults is a tuple of dicts, one for each trace. When
@@ -181,7 +419,7 @@ class BaseFigure(object):
             layout, skip_invalid=skip_invalid)
 
         # ### Import clone of layout properties ###
-        self._layout = deepcopy(self._layout_obj._props)
+        self._layout = _copy_props(self._layout_obj._props)
 
         # ### Initialize layout defaults dict ###
         self._layout_defaults = {}
@@ -199,7 +437,7 @@ class BaseFigure(object):
         self._frames_validator = FramesValidator()
 
         # ### Import frames ###
-        self._frame_objs = self._frames_validator.validate_coerce(
+        self._frame_objs = self._validate_frames(
             frames, skip_invalid=skip_invalid)
 
         # Note: Because frames are not currently supported in the widget
@@ -230,6 +468,24 @@ class BaseFigure(object):
         # type: typ.Dict[str, typ.Any]
         self._batch_layout_edits = {}
 
+        # ### Content hashes ###
+        # Digests of the trace and layout dicts used by content_hash.
+        # _trace_hashes maps the id of trace dicts to (trace dict, digest)
+        # pairs, and _layout_hash is None until computed. They are
+        # invalidated by the restyle / relayout operations that all
+        # property changes go through.
+        self._trace_hashes = {}
+        self._layout_hash = None
+
+        # ### Deferred change callbacks ###
+        # Ordered dict from object ids to (object, changed paths) pairs for
+        # the change callbacks that are held back by a
+        # `batch_update(defer_callbacks=True)` context, or None when
+        # callbacks are dispatched right away.
+        # type: typ.Optional[typ.Dict[int, typ.Tuple[
+        #     BasePlotlyType, typ.Set[typ.Tuple[str|int]]]]]
+        self._deferred_change_callbacks = None
+
         # Animation property validators
         # -----------------------------
         self._animation_duration_validator = animation.DurationValidator()
@@ -240,13 +496,95 @@ class BaseFigure(object):
     def __reduce__(self):
         """
         Custom implementation of reduce is used to support deep copying
-        and pickling
+        and pickling.
+
+        The validated data, layout, and frames properties are pickled as
+        they are, numpy arrays included, and are not validated again when
+        unpickled (see _restore_figure)
+        """
+        return (_restore_figure,
+                (self.__class__, self._validated_props()))
+
+    def __copy__(self):
+        # Figures never share properties dicts, so a copy is a deep copy
+        return self.__deepcopy__({})
+
+    def __deepcopy__(self, memo):
+        return _restore_figure(self.__class__,
+                               _copy_props(self._validated_props()))
+
+    def _validated_props(self):
+        """
+        Return the figure's validated properties, without copying them
+
+        Returns
+        -------
+        dict
+        """
+        return {'data': self._data,
+                'layout': self._layout,
+                'frames': self._frames_props(),
+                '_grid_str': self._grid_str,
+                '_grid_ref': self._grid_ref}
+
+    def _restore_props(self, fig_props):
+        """
+        Install the validated properties of a pickled or copied figure on
+        this (empty) figure, without validating them again
+
+        Parameters
+        ----------
+        fig_props : dict
+            Dict as returned by _validated_props. The properties dicts are
+            used as they are, not copied.
+
+        Returns
+        -------
+        None
         """
-        props = self.to_dict()
-        props['_grid_str'] = self._grid_str
-        props['_grid_ref'] = self._grid_ref
-        return (self.__class__,
-                (props,))
+        self._grid_str = fig_props['_grid_str']
+        self._grid_ref = fig_props['_grid_ref']
+
+        # Traces
+        # ------
+        data = fig_props['data']
+        class_map = self._data_validator.class_map
+        traces = []
+        for trace_ind, trace_props in enumerate(data):
+            # New traces get new uids, as in the constructor
+            if self._data_validator.set_uid:
+                trace_props['uid'] = str(uuid.uuid1())
+
+            trace = class_map[trace_props['type']]._new_empty()
+            trace._orphan_props.clear()
+            trace._parent = self
+            trace._trace_ind = trace_ind
+            traces.append(trace)
+
+        self._data_objs = traces
+        self._data = data
+        self._data_defaults = [{} for _ in data]
+        for trace in traces:
+            trace._restore_children()
+
+        # Layout
+        # ------
+        self._layout = fig_props['layout']
+        self._layout_obj._restore_children()
+
+        self._trace_hashes = {}
+        self._layout_hash = None
+
+        # Frames
+        # ------
+        frames = fig_props['frames']
+        if isinstance(frames, animation.ColumnarFrames):
+            self._frame_objs = frames
+        else:
+            frame_class = self._frames_validator.data_class
+            self._frame_objs = [
+                _restore_plotly_obj(frame_class, frame_props)
+                for frame_props in frames]
 
     def __setitem__(self, prop, value):
 
@@ -326,6 +664,8 @@ class BaseFigure(object):
             elif prop == 'layout':
                 return self._layout_validator.present(self._layout_obj)
             elif prop == 'frames':
+                if isinstance(self._frame_objs, animation.ColumnarFrames):
+                    return self._frame_objs
                 return self._frames_validator.present(self._frame_objs)
             else:
                 raise KeyError(orig_prop)
@@ -351,20 +691,26 @@ class BaseFigure(object):
             # Require objects to both be BaseFigure instances
             return False
         else:
-            # Compare plotly_json representations
+            # Compare plotly_json representations, without copying them
 
             # Use _vals_equal instead of `==` to handle cases where
             # underlying dicts contain numpy arrays
-            return BasePlotlyType._vals_equal(self.to_plotly_json(),
-                                              other.to_plotly_json())
+            return BasePlotlyType._vals_equal(self._uncopied_plotly_json(),
+                                              other._uncopied_plotly_json())
 
     def __repr__(self):
         """
         Customize Figure representation when displayed in the
         terminal/notebook
         """
+        # The properties are not copied, they are elided by the pretty
+        # printer
+        props = {'data': self._data, 'layout': self._layout}
+        if self._frame_objs:
+            props['frames'] = self._frames_props()
+
         repr_str = BasePlotlyType._build_repr_for_class(
-            props=self.to_plotly_json(),
+            props=props,
             class_name=self.__class__.__name__)
 
         return repr_str
@@ -500,7 +846,7 @@ class BaseFigure(object):
 
                 # Unparent trace object to be removed
                 old_trace = self.data[i]
-                old_trace._orphan_props.update(deepcopy(old_trace._props))
+                old_trace._orphan_props.update(_copy_props(old_trace._props))
                 old_trace._parent = None
                 old_trace._trace_ind = None
 
@@ -700,6 +1046,8 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
                     val_changed = BaseFigure._set_in(self._data[trace_ind],
                                                      key_path_str,
                                                      trace_v)
+                    if val_changed:
+                        self._invalidate_trace_hash(trace_ind)
 
                     # Update any_vals_changed status
                     any_vals_changed = (any_vals_changed or val_changed)
@@ -735,6 +1083,7 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         # Compute trace index
         # -------------------
         trace_index = child._trace_ind
+        self._invalidate_trace_hash(trace_index)
 
         # Not in batch mode
         # -----------------
@@ -786,15 +1135,37 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         Returns
         -------
         tuple[str | int]
+            The same tuple object is returned for every call with the
+            same key path string
+        """
+        if isinstance(key_path_str, tuple):
+            # Nothing to do
+            return key_path_str
+
+        cache = BaseFigure._dict_path_cache
+        try:
+            return cache[key_path_str]
+        except (KeyError, TypeError):
+            pass
+
+        key_path = BaseFigure._parse_dict_path(key_path_str)
+        if isinstance(key_path_str, string_types):
+            if len(cache) >= BaseFigure._max_dict_path_cache_size:
+                cache.clear()
+            cache[key_path_str] = key_path
+        return key_path
+
+    @staticmethod
+    def _parse_dict_path(key_path_str):
+        """
+        Parse a key path string into a tuple of key path elements, without
+        caching. See _str_to_dict_path.
         """
         if isinstance(key_path_str, string_types) and \
                 '.' not in key_path_str and \
                 '[' not in key_path_str:
             # Fast path for common case that avoids regular expressions
             return (key_path_str,)
-        elif isinstance(key_path_str, tuple):
-            # Nothing to do
-            return key_path_str
         else:
             # Split string on periods. e.g. 'foo.bar[1]' -> ['foo', 'bar[1]']
             key_path = key_path_str.split('.')
@@ -1131,8 +1502,8 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
             for trace, row, col in zip(data, rows, cols):
                 self._set_trace_grid_position(trace, row, col)
 
-        # Make deep copy of trace data (Optimize later if needed)
-        new_traces_data = [deepcopy(trace._props) for trace in data]
+        # Make deep copy of trace data
+        new_traces_data = [_copy_props(trace._props) for trace in data]
 
         # Update trace parent
         for trace in data:
@@ -1342,18 +1713,19 @@ Please use the add_trace method with the row and col parameters.
         # Validate new layout
         # -------------------
         new_layout = self._layout_validator.validate_coerce(new_layout)
-        new_layout_data = deepcopy(new_layout._props)
+        new_layout_data = _copy_props(new_layout._props)
 
         # Unparent current layout
         # -----------------------
         if self._layout_obj:
-            old_layout_data = deepcopy(self._layout_obj._props)
+            old_layout_data = _copy_props(self._layout_obj._props)
             self._layout_obj._orphan_props.update(old_layout_data)
             self._layout_obj._parent = None
 
         # Parent new layout
         # -----------------
         self._layout = new_layout_data
+        self._layout_hash = None
         new_layout._parent = self
         new_layout._orphan_props.clear()
         self._layout_obj = new_layout
@@ -1443,6 +1815,7 @@ Invalid property path '{key_path_str}' for layout
 
             if val_changed:
                 relayout_changes[key_path_str] = v
+                self._layout_hash = None
 
         return relayout_changes
 
@@ -1489,6 +1862,7 @@ Invalid property path '{key_path_str}' for layout
         # Validate input
         # --------------
         assert child is self.layout
+        self._layout_hash = None
 
         # Not in batch mode
         # -------------
@@ -1551,23 +1925,57 @@ Invalid property path '{key_path_str}' for layout
         dispatch_plan = {}
 
         for key_path_str in key_path_strs:
-
             key_path = BaseFigure._str_to_dict_path(key_path_str)
-            key_path_so_far = ()
-            keys_left = key_path
-
-            # Iterate down the key path
-            for next_key in key_path:
+            for key_path_so_far, to_add in \
+                    BaseFigure._dict_path_dispatch_entries(key_path):
                 if key_path_so_far not in dispatch_plan:
-                    dispatch_plan[key_path_so_far] = set()
+                    dispatch_plan[key_path_so_far] = set(to_add)
+                else:
+                    dispatch_plan[key_path_so_far].update(to_add)
 
-                to_add = [keys_left[:i+1] for i in range(len(keys_left))]
-                dispatch_plan[key_path_so_far].update(to_add)
+        return dispatch_plan
 
-                key_path_so_far = key_path_so_far + (next_key, )
-                keys_left = keys_left[1:]
+    @staticmethod
+    def _dict_path_dispatch_entries(key_path):
+        """
+        Compute the dispatch plan entries of a single key path tuple
 
-        return dispatch_plan
+        Parameters
+        ----------
+        key_path : tuple[str|int]
+            Key path tuple as returned by _str_to_dict_path
+
+        Returns
+        -------
+        tuple[tuple[tuple[str|int], tuple[tuple[str|int]]]]
+            One (parent path, descendant paths) pair for each parent
+            path of `key_path`, where the descendant paths are relative to
+            the parent path. See _build_dispatch_plan.
+
+        Examples
+        --------
+        >>> BaseFigure._dict_path_dispatch_entries(('xaxis', 'range'))
+            (((), (('xaxis',), ('xaxis', 'range'))),
+             (('xaxis',), (('range',),)))
+        """
+        cache = BaseFigure._dict_path_dispatch_cache
+        try:
+            return cache[key_path]
+        except KeyError:
+            pass
+
+        entries = []
+        for i in range(len(key_path)):
+            keys_left = key_path[i:]
+            entries.append(
+                (key_path[:i],
+                 tuple([keys_left[:j+1] for j in range(len(keys_left))])))
+        entries = tuple(entries)
+
+        if len(cache) >= BaseFigure._max_dict_path_cache_size:
+            cache.clear()
+        cache[key_path] = entries
+        return entries
 
     def _dispatch_layout_change_callbacks(self, relayout_data):
         """
@@ -1593,7 +2001,8 @@ Invalid property path '{key_path_str}' for layout
             if path_tuple in self.layout:
                 dispatch_obj = self.layout[path_tuple]
                 if isinstance(dispatch_obj, BasePlotlyType):
-                    dispatch_obj._dispatch_change_callbacks(changed_paths)
+                    self._dispatch_obj_change_callbacks(dispatch_obj,
+                                                        changed_paths)
 
     def _dispatch_trace_change_callbacks(self, restyle_data, trace_indexes):
         """
@@ -1625,18 +2034,45 @@ Invalid property path '{key_path_str}' for layout
                 if path_tuple in trace:
                     dispatch_obj = trace[path_tuple]
                     if isinstance(dispatch_obj, BasePlotlyType):
-                        dispatch_obj._dispatch_change_callbacks(changed_paths)
+                        self._dispatch_obj_change_callbacks(dispatch_obj,
+                                                            changed_paths)
+
+    def _dispatch_obj_change_callbacks(self, dispatch_obj, changed_paths):
+        """
+        Dispatch the change callbacks of an object in the figure, or hold
+        them back until the end of a `batch_update(defer_callbacks=True)`
+        context
+
+        Parameters
+        ----------
+        dispatch_obj : BasePlotlyType
+            Object whose properties changed
+        changed_paths : set[tuple[int|str]]
+            Changed property paths, relative to `dispatch_obj`
+
+        Returns
+        -------
+        None
+        """
+        deferred = self._deferred_change_callbacks
+        if deferred is None:
+            dispatch_obj._dispatch_change_callbacks(changed_paths)
+        elif id(dispatch_obj) in deferred:
+            deferred[id(dispatch_obj)][1].update(changed_paths)
+        else:
+            deferred[id(dispatch_obj)] = (dispatch_obj, set(changed_paths))
 
     # Frames
     # ------
     @property
     def frames(self):
         """
-        The `frames` property is a tuple of the figure's frame objects
+        The `frames` property is a tuple of the figure's frame objects, or
+        the plotly.animation.ColumnarFrames instance assigned to it
 
         Returns
         -------
-        tuple[plotly.graph_objs.Frame]
+        tuple[plotly.graph_objs.Frame]|plotly.animation.ColumnarFrames
         """
         return self['frames']
 
@@ -1647,7 +2083,66 @@ Invalid property path '{key_path_str}' for layout
         # changes, and we don't reparent the frames.
 
         # Validate frames
-        self._frame_objs = self._frames_validator.validate_coerce(new_frames)
+        self._frame_objs = self._validate_frames(new_frames)
+
+    def _validate_frames(self, frames, skip_invalid=False):
+        """
+        Validate the frames of the figure
+
+        Columnar frames are kept as they are, and only materialized on
+        export
+
+        Parameters
+        ----------
+        frames : list|tuple|plotly.animation.ColumnarFrames|None
+            Frames to validate
+        skip_invalid : bool
+            If True, invalid properties are ignored, see the constructor
+
+        Returns
+        -------
+        tuple[plotly.graph_objs.Frame]|plotly.animation.ColumnarFrames
+        """
+        if isinstance(frames, animation.ColumnarFrames):
+            return frames
+        return self._frames_validator.validate_coerce(
+            frames, skip_invalid=skip_invalid)
+
+    def _frames_props(self):
+        """
+        Return the validated properties of the frames of the figure, without
+        copying them
+
+        Returns
+        -------
+        list[dict]|plotly.animation.ColumnarFrames
+            List of the properties dicts of the frame objects, or the
+            columnar frames assigned to the figure
+        """
+        if isinstance(self._frame_objs, animation.ColumnarFrames):
+            return self._frame_objs
+        return [frame._props for frame in self._frame_objs]
+
+    def _frames_as_dicts(self, copy=False):
+        """
+        Return the properties of the frames of the figure as a list of dicts
+
+        Parameters
+        ----------
+        copy : bool
+            If True, the properties dicts of frame objects are deep copied.
+            Columnar frames are always materialized as new dicts, holding
+            read-only rows of the stacked arrays and sharing the read-only
+            arrays of their constant properties
+
+        Returns
+        -------
+        list[dict]
+        """
+        frames = self._frames_props()
+        if isinstance(frames, animation.ColumnarFrames):
+            return frames.to_plotly_json()
+        return deepcopy(frames) if copy else frames
 
     # Update
     # ------
@@ -1788,15 +2283,27 @@ Invalid property path '{key_path_str}' for layout
                           animation_opts):
         pass
 
+    def _send_animation_queue_msg(self, animation_queue, steps):
+        pass
+
     # Context managers
     # ----------------
     @contextmanager
-    def batch_update(self):
+    def batch_update(self, defer_callbacks=False):
         """
         A context manager that batches up trace and layout assignment
         operations into a singe plotly_update message that is executed when
         the context exits.
 
+        Parameters
+        ----------
+        defer_callbacks : bool
+            If True, the `on_change` callbacks of all updates made in the
+            context, including explicit plotly_restyle / plotly_relayout /
+            plotly_update calls, are held back until the context exits.
+            Each callback is then invoked at most once per object, with
+            the final property values. Defaults to False.
+
         Examples
         --------
         For example, suppose we have a figure widget, `fig`, with a single
@@ -1830,7 +2337,17 @@ Invalid property path '{key_path_str}' for layout
         single update message, and they will be applied by the front end
         simultaneously.
         """
-        if self._in_batch_mode is True:
+        if defer_callbacks and self._deferred_change_callbacks is None:
+            self._deferred_change_callbacks = collections.OrderedDict()
+            try:
+                with self.batch_update():
+                    yield
+            finally:
+                deferred = self._deferred_change_callbacks
+                self._deferred_change_callbacks = None
+                for dispatch_obj, changed_paths in deferred.values():
+                    dispatch_obj._dispatch_change_callbacks(changed_paths)
+        elif self._in_batch_mode is True:
             yield
         else:
             try:
@@ -1997,7 +2514,76 @@ Invalid property path '{key_path_str}' for layout
                     }
                 })
 
-    def _perform_batch_animate(self, animation_opts):
+    @contextmanager
+    def animation_queue(self,
+                        frame_rate=30,
+                        easing='linear',
+                        chunk_size=30,
+                        on_playback=None):
+        """
+        Context manager to queue a sequence of animation steps, played back
+        by the front end at a fixed frame rate
+
+        Each step is a batch of trace / layout updates, recorded with the
+        `step()` context manager of the yielded queue. Steps are applied to
+        the figure immediately and sent to the front end in chunks of
+        `chunk_size` steps, so playback starts while later steps are still
+        being computed. The front end plays the queued steps one per frame
+        interval. When it falls behind, late steps are dropped and their
+        updates are merged into the next step that is played.
+
+        Parameters
+        ----------
+        frame_rate : number
+            The target number of steps played per second
+        easing : string
+            The easing function used for the transition of each step.
+            See `batch_animate` for the accepted values
+        chunk_size : int
+            The number of steps sent to the front end per message
+        on_playback : callable|None
+            Function of one argument, the queue, called each time the front
+            end reports the playback of a chunk of steps. The number of
+            played and dropped steps are available as the `played_steps`
+            and `dropped_steps` properties of the queue
+
+        Returns
+        -------
+        plotly.animation.AnimationQueue
+
+        Examples
+        --------
+        Suppose we have a figure widget, `fig`, with a single trace.
+
+        >>> import numpy as np
+        >>> import plotly.graph_objs as go
+        >>> x = np.linspace(0, 10, 200)
+        >>> fig = go.FigureWidget(data=[{'x': x, 'y': np.sin(x)}])
+
+        Play back 300 steps of a simulation at 30 frames per second
+
+        >>> with fig.animation_queue(frame_rate=30) as queue:
+        ...     for t in range(300):
+        ...         with queue.step():
+        ...             fig.data[0].y = np.sin(x + 0.1 * t)
+        """
+        if self._in_batch_mode is True:
+            raise ValueError(
+                'animation_queue may not be used inside of a batch_update '
+                'or batch_animate context')
+
+        animation_queue = animation.AnimationQueue(
+            self,
+            frame_rate=frame_rate,
+            easing=easing,
+            chunk_size=chunk_size,
+            on_playback=on_playback)
+        try:
+            yield animation_queue
+        finally:
+            animation_queue.close()
+
+    def _perform_batch_animate(self, animation_opts, send_animate=None):
         """
         Perform the batch animate operation
 
@@ -2008,11 +2594,18 @@ Invalid property path '{key_path_str}' for layout
         ----------
         animation_opts : dict
             Animation options as accepted by frontend Plotly.animation command
+        send_animate : callable|None
+            Function accepting the arguments of `_send_animate_msg`, that
+            the animate operation is handed to. Defaults to
+            `_send_animate_msg`
 
         Returns
         -------
         None
         """
+        if send_animate is None:
+            send_animate = self._send_animate_msg
+
         # Apply commands to internal dictionaries as an update
         # ----------------------------------------------------
         (restyle_data,
@@ -2039,7 +2632,7 @@ Invalid property path '{key_path_str}' for layout
         # Send animate message
         # --------------------
         # Sends animate message to the front end (if any)
-        self._send_animate_msg(
+        send_animate(
             styles_data=list(animate_styles),
             relayout_data=animate_layout,
             trace_indexes=list(animate_trace_indexes),
@@ -2086,7 +2679,7 @@ Invalid property path '{key_path_str}' for layout
         # -------------
         # Frame key is only added if there are any frames
         res = {'data': data, 'layout': layout}
-        frames = deepcopy([frame._props for frame in self._frame_objs])
+        frames = self._frames_as_dicts(copy=True)
         if frames:
             res['frames'] = frames
 
@@ -2102,6 +2695,86 @@ Invalid property path '{key_path_str}' for layout
         """
         return self.to_dict()
 
+    def content_hash(self):
+        """
+        Return a hash of the contents of the figure
+
+        The hash is computed from the properties of the traces, layout,
+        and frames of the figure, excluding trace uids. It doesn't depend
+        on the process or session, so it can be used to identify a figure
+        across runs (e.g. as a cache key). Figures built from the same
+        specification have the same hash. Note that numpy arrays and lists
+        with the same values don't hash the same.
+
+        Trace and layout hashes are cached, and only recomputed after their
+        properties change. Frames are hashed on each call.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest
+        """
+        h = hashlib.md5()
+
+        # Traces
+        # ------
+        trace_hashes = {}
+        for trace in self._data:
+            entry = self._trace_hashes.get(id(trace), None)
+            if entry is None or entry[0] is not trace:
+                trace_props = {k: v for k, v in trace.items() if k != 'uid'}
+                entry = (trace, _props_hash(trace_props))
+            trace_hashes[id(trace)] = entry
+            h.update(entry[1])
+
+        # Only keep the hashes of the current traces
+        self._trace_hashes = trace_hashes
+
+        # Layout
+        # ------
+        if self._layout_hash is None:
+            self._layout_hash = _props_hash(self._layout)
+        h.update(b'layout')
+        h.update(self._layout_hash)
+
+        # Frames
+        # ------
+        frames = self._frames_as_dicts()
+        if frames:
+            h.update(b'frames')
+            h.update(_props_hash(frames))
+
+        return h.hexdigest()
+
+    def _invalidate_trace_hash(self, trace_index):
+        """
+        Discard the cached content hash of a trace
+
+        Parameters
+        ----------
+        trace_index : int
+            Index of the trace
+        """
+        if trace_index is not None and trace_index < len(self._data):
+            self._trace_hashes.pop(id(self._data[trace_index]), None)
+
+    def _uncopied_plotly_json(self):
+        """
+        Return the JSON representation of the figure, as returned by
+        `to_plotly_json`, sharing the figure's own dicts instead of copying
+        them. The result must not be modified.
+
+        Returns
+        -------
+        dict
+        """
+        res = {'data': self._data, 'layout': self._layout}
+        frames = self._frames_as_dicts()
+        if frames:
+            res['frames'] = frames
+
+        return res
+
     @staticmethod
     def _to_ordered_dict(d, skip_uid=False):
         """
@@ -2145,8 +2818,8 @@ Invalid property path '{key_path_str}' for layout
         # Handle frames
         # -------------
         if self._frame_objs:
-            frames_props = [frame._props for frame in self._frame_objs]
-            result['frames'] = BaseFigure._to_ordered_dict(frames_props)
+            result['frames'] = BaseFigure._to_ordered_dict(
+                self._frames_as_dicts())
 
         return result
 
@@ -2275,6 +2948,9 @@ class BasePlotlyType(object):
     and frame object hierarchies
     """
 
+    # Empty instance of each plotly type, cloned by _new_empty
+    _empty_objs = {}
+
     def __init__(self, plotly_name, **kwargs):
         """
         Construct a new BasePlotlyType
@@ -2337,6 +3013,13 @@ class BasePlotlyType(object):
         # type: Dict[Tuple[Tuple[Union[str, int]]], List[Callable]]
         self._change_callbacks = {}
 
+        # ### _change_callbacks_index ###
+        # A dict from each child property path tuple to the
+        # (registration order, key of _change_callbacks) pairs that
+        # reference it, so that dispatch only visits matching callbacks
+        # type: Dict[Tuple[Union[str, int]], List[Tuple[int, Tuple]]]
+        self._change_callbacks_index = {}
+
     def _process_kwargs(self, **kwargs):
         """
         Process any extra kwargs that are not predefined as constructor params
@@ -2615,11 +3298,107 @@ class BasePlotlyType(object):
     def __reduce__(self):
         """
         Custom implementation of reduce is used to support deep copying
-        and pickling
+        and pickling.
+
+        The validated properties dict is pickled as it is, numpy arrays
+        included, and is not validated again when unpickled (see
+        _restore_plotly_obj)
+        """
+        props = self._props
+        return (_restore_plotly_obj,
+                (self.__class__, props if props is not None else {}))
+
+    def __copy__(self):
+        # Objects never share properties dicts, so a copy is a deep copy
+        return self.__deepcopy__({})
+
+    def __deepcopy__(self, memo):
+        props = self._props
+        return _restore_plotly_obj(
+            self.__class__, _copy_props(props) if props is not None else {})
+
+    @classmethod
+    def _new_empty(cls):
+        """
+        Return a new instance of this type without any properties.
+
+        This is equivalent to calling the constructor without arguments,
+        but rather than constructing the validators and (empty) compound
+        property objects from scratch, a cached empty instance is cloned.
+
+        Returns
+        -------
+        BasePlotlyType
+        """
+        empty_obj = BasePlotlyType._empty_objs.get(cls, None)
+        if empty_obj is None:
+            empty_obj = cls()
+            BasePlotlyType._empty_objs[cls] = empty_obj
+
+        return empty_obj._clone_empty()
+
+    def _clone_empty(self):
+        """
+        Clone an object that doesn't have any properties, see _new_empty
+
+        Returns
+        -------
+        BasePlotlyType
+        """
+        obj = self.__class__.__new__(self.__class__)
+
+        # Validators are shared, but not the dicts (lists, sets) holding
+        # them, or holding callbacks and child objects
+        obj_dict = obj.__dict__
+        for attr, val in self.__dict__.items():
+            if isinstance(val, (dict, list, set)):
+                val = type(val)(val)
+            obj_dict[attr] = val
+
+        for prop, child in self._compound_props.items():
+            child = child._clone_empty()
+            child._parent = obj
+            obj._compound_props[prop] = child
+
+        return obj
+
+    def _restore_children(self):
         """
-        props = self.to_plotly_json()
-        return (self.__class__,
-                (props,))
+        Create the child objects for the restored (validated) properties
+        dict of this object, see _restore_plotly_obj.
+
+        Compound property objects are created by the constructor, so only
+        the elements of compound array properties are created here
+
+        Returns
+        -------
+        None
+        """
+        props = self._props
+        if not props:
+            return
+
+        for prop, val in props.items():
+            if prop in self._compound_props:
+                self._compound_props[prop]._restore_children()
+
+            elif prop in self._compound_array_props:
+                validator = self._validators[prop]
+                children = []
+                for child_props in val:
+                    if isinstance(validator, BaseDataValidator):
+                        child_class = validator.class_map[child_props['type']]
+                    else:
+                        child_class = validator.data_class
+
+                    child = child_class._new_empty()
+                    child._orphan_props.clear()
+                    child._parent = self
+                    children.append(child)
+
+                self._compound_array_props[prop] = children
+                for child in children:
+                    child._restore_children()
 
     def __getitem__(self, prop):
         """
@@ -2966,6 +3745,39 @@ class BasePlotlyType(object):
             BaseFigure._perform_update(self, dict1)
             BaseFigure._perform_update(self, kwargs)
 
+    @classmethod
+    def compile_update(cls, dict1=None, **kwargs):
+        """
+        Compile an update for objects of this type, to apply it to many
+        objects or figures.
+
+        Property names are looked up, and values are validated, once when
+        the update is compiled, instead of every time it is applied.
+        Applying a compiled update has the same effect as calling
+        `update` with the same arguments.
+
+        Parameters
+        ----------
+        dict1 : dict
+            Dictionary of properties to be updated
+        kwargs :
+            Keyword/value pair of properties to be updated
+
+        Examples
+        --------
+        >>> import plotly.graph_objs as go
+        >>> theme = go.Layout.compile_update(
+        ...     font={'family': 'Courier New'},
+        ...     xaxis={'showgrid': False, 'zeroline': False})
+        >>> theme.apply(fig)  # updates fig.layout
+        >>> theme.apply(other_fig.layout)
+
+        Returns
+        -------
+        CompiledUpdate
+        """
+        return CompiledUpdate(cls, dict1, **kwargs)
+
     @property
     def _in_batch_mode(self):
         """
@@ -3010,6 +3822,25 @@ class BasePlotlyType(object):
             else:
                 raise err
 
+        return self._set_validated_prop(prop, val)
+
+    def _set_validated_prop(self, prop, val):
+        """
+        Set the value of a simple property to an already validated value
+
+        Parameters
+        ----------
+        prop : str
+            Name of a simple (non-compound, non-array) property
+        val
+            The new property value, as returned by the property validator
+
+        Returns
+        -------
+        Any
+            The assigned value
+        """
+
         # val is None
         # -----------
         if val is None:
@@ -3073,12 +3904,12 @@ class BasePlotlyType(object):
         # ------------------------------------------
         curr_val = self._compound_props.get(prop, None)
         if curr_val is not None:
-            curr_dict_val = deepcopy(curr_val._props)
+            curr_dict_val = _copy_props(curr_val._props)
         else:
             curr_dict_val = None
 
         if val is not None:
-            new_dict_val = deepcopy(val._props)
+            new_dict_val = _copy_props(val._props)
         else:
             new_dict_val = None
 
@@ -3147,12 +3978,12 @@ class BasePlotlyType(object):
         # ------------------------------------------
         curr_val = self._compound_array_props.get(prop, None)
         if curr_val is not None:
-            curr_dict_vals = [deepcopy(cv._props) for cv in curr_val]
+            curr_dict_vals = [_copy_props(cv._props) for cv in curr_val]
         else:
             curr_dict_vals = None
 
         if val is not None:
-            new_dict_vals = [deepcopy(nv._props) for nv in val]
+            new_dict_vals = [_copy_props(nv._props) for nv in val]
         else:
             new_dict_vals = None
 
@@ -3284,19 +4115,26 @@ class BasePlotlyType(object):
         -------
         None
         """
-        # Loop over registered callbacks
-        # ------------------------------
-        for prop_path_tuples, callbacks in self._change_callbacks.items():
-            # ### Compute callback paths that changed ###
-            common_paths = changed_paths.intersection(set(prop_path_tuples))
-            if common_paths:
-
-                # #### Invoke callback ####
-                callback_args = [self[cb_path]
-                                 for cb_path in prop_path_tuples]
+        if not self._change_callbacks:
+            return
 
-                for callback in callbacks:
-                    callback(self, *callback_args)
+        # Look up callbacks registered on changed paths
+        # ---------------------------------------------
+        matched = {}
+        for changed_path in changed_paths:
+            for order, prop_path_tuples in \
+                    self._change_callbacks_index.get(changed_path, ()):
+                matched[order] = prop_path_tuples
+
+        # Invoke callbacks in registration order
+        # --------------------------------------
+        for order in sorted(matched):
+            prop_path_tuples = matched[order]
+            callback_args = [self[cb_path]
+                             for cb_path in prop_path_tuples]
+
+            for callback in self._change_callbacks[prop_path_tuples]:
+                callback(self, *callback_args)
 
     def on_change(self, callback, *args, **kwargs):
         """
@@ -3380,7 +4218,13 @@ on_change callbacks are not supported in this case.
         # -------------------------
         # Initialize an empty callbacks list if there are no previously
         # defined callbacks for this collection of args, or if append is False
-        if arg_tuples not in self._change_callbacks or not append:
+        if arg_tuples not in self._change_callbacks:
+            order = len(self._change_callbacks)
+            for arg_tuple in set(arg_tuples):
+                self._change_callbacks_index.setdefault(
+                    arg_tuple, []).append((order, arg_tuples))
+            self._change_callbacks[arg_tuples] = []
+        elif not append:
             self._change_callbacks[arg_tuples] = []
 
         # Register callback
@@ -3413,8 +4257,16 @@ on_change callbacks are not supported in this case.
         bool
             True if v1 and v2 are equal, False otherwise
         """
-        if (np is not None and
+        if v1 is v2:
+            return True
+        elif (np is not None and
                 (isinstance(v1, np.ndarray) or isinstance(v2, np.ndarray))):
+            digest1 = _array_digest(v1)
+            digest2 = _array_digest(v2)
+            if (digest1 is not None and digest2 is not None and
+                    digest1[:2] == digest2[:2] and digest1 != digest2):
+                # Same dtype and shape, different contents
+                return False
             return np.array_equal(v1, v2)
         elif isinstance(v1, (list, tuple)):
             # Handle recursive equality on lists and tuples
@@ -3431,6 +4283,165 @@ on_change callbacks are not supported in this case.
             return v1 == v2
 
 
+class CompiledUpdate(object):
+    """
+    An update for objects of one plotly type, compiled by
+    `BasePlotlyType.compile_update` into a flat list of operations with
+    validated values.
+    """
+
+    def __init__(self, plotly_type, dict1=None, **kwargs):
+        """
+        Parameters
+        ----------
+        plotly_type : type
+            Subclass of BasePlotlyType that the update applies to
+        dict1 : dict
+            Dictionary of properties to be updated
+        kwargs :
+            Keyword/value pair of properties to be updated
+        """
+        self._plotly_type = plotly_type
+
+        # ### _ops ###
+        # Tuples of (kind, parent path, property name, ...), where kind is
+        #  - 'child': (..., child path, create) descend into a compound
+        #    property, creating the subplot property first if `create`
+        #  - 'prop': (..., value) set a simple property to a valid value
+        #  - 'array': (..., value, element updates) merge into a compound
+        #    array property, see BaseFigure._perform_update
+        # type: List[Tuple]
+        self._ops = []
+
+        # Templates are only used to look up validators, one per type
+        templates = {}
+        for d in [dict1, kwargs]:
+            self._compile(plotly_type, (), d, templates)
+
+    def _compile(self, plotly_type, path, update_obj, templates):
+        if update_obj is None:
+            return
+        elif isinstance(update_obj, BasePlotlyType):
+            update_obj = update_obj.to_plotly_json()
+
+        if plotly_type not in templates:
+            templates[plotly_type] = plotly_type()
+        template = templates[plotly_type]
+
+        for key in update_obj:
+            val = update_obj[key]
+
+            # Handle subplot ids that don't exist yet. e.g. xaxis2 is
+            # validated like xaxis, and is created when the update is applied
+            create = False
+            if key in template:
+                validator = template._get_prop_validator(key)
+            else:
+                match = (isinstance(template, BaseLayoutType) and
+                         template._subplotid_prop_re.match(key))
+                if not match or int(match.group(2)) < 2:
+                    template._raise_on_invalid_property_error(key)
+                validator = template._get_prop_validator(match.group(1))
+                create = True
+
+            if isinstance(validator, CompoundValidator):
+                if not isinstance(val, (dict, BasePlotlyType)):
+                    if val is None:
+                        continue
+                    validator.raise_invalid_val(val)
+                child_path = path + (key,)
+                self._ops.append(('child', path, key, child_path, create))
+                self._compile(validator.data_class, child_path, val,
+                              templates)
+            elif isinstance(validator, CompoundArrayValidator):
+                if val is None:
+                    continue
+                element_type = validator.data_class
+                if isinstance(val, dict):
+                    elements = {i: CompiledUpdate(element_type, el)
+                                for i, el in val.items()}
+                elif isinstance(val, (list, tuple)):
+                    elements = [CompiledUpdate(element_type, el)
+                                for el in val]
+                else:
+                    elements = None
+                self._ops.append(('array', path, key, val, elements))
+            elif val is not Undefined:
+                self._ops.append(
+                    ('prop', path, key, validator.validate_coerce(val)))
+
+    def apply(self, obj):
+        """
+        Apply the update to an object, or to a figure.
+
+        Parameters
+        ----------
+        obj : BasePlotlyType|BaseFigure
+            An object of the compiled type, or a figure. For a figure,
+            a compiled layout update is applied to the figure's layout
+            and a compiled trace update to each trace of the compiled
+            type.
+
+        Returns
+        -------
+        BasePlotlyType|BaseFigure
+            The updated object
+        """
+        if isinstance(obj, BaseFigure):
+            with obj.batch_update():
+                if issubclass(self._plotly_type, BaseLayoutType):
+                    self._apply_to(obj.layout)
+                else:
+                    for trace in obj.data:
+                        if isinstance(trace, self._plotly_type):
+                            self._apply_to(trace)
+        elif isinstance(obj, self._plotly_type):
+            if obj.figure:
+                with obj.figure.batch_update():
+                    self._apply_to(obj)
+            else:
+                self._apply_to(obj)
+        else:
+            raise ValueError(
+                'Update compiled for {typ} cannot be applied to {obj_typ}'
+                .format(typ=self._plotly_type.__name__,
+                        obj_typ=type(obj).__name__))
+        return obj
+
+    def _apply_to(self, obj):
+        objs = {(): obj}
+        for op in self._ops:
+            kind, path, key = op[:3]
+            parent = objs[path]
+            if kind == 'prop':
+                val = op[3]
+                if isinstance(val, (list, dict)):
+                    # Don't share mutable values between objects
+                    val = _copy_props(val)
+                parent._set_validated_prop(key, val)
+            elif kind == 'child':
+                child_path, create = op[3:]
+                if create and key not in parent:
+                    parent[key] = {}
+                objs[child_path] = parent[key]
+            else:
+                val, elements = op[3:]
+                existing = parent[key]
+                if not existing or elements is None:
+                    # Accept val as is, just like BaseFigure._perform_update
+                    parent[key] = val
+                elif len(elements) == 0:
+                    continue
+                else:
+                    for i, element in enumerate(existing):
+                        if isinstance(elements, dict):
+                            if i not in elements:
+                                continue
+                            elements[i]._apply_to(element)
+                        else:
+                            elements[i % len(elements)]._apply_to(element)
+
+
 class BaseLayoutHierarchyType(BasePlotlyType):
     """
     Base class for all types in the layout hierarchy
@@ -3599,6 +4610,32 @@ class BaseLayoutType(BaseLayoutHierarchyType):
         self._set_compound_prop(prop, value)
         self._subplotid_props.add(prop)
 
+    def _restore_children(self):
+        """
+        Create the subplot objects (xaxis2, geo3, etc.) of the restored
+        properties dict before creating the other child objects, see
+        BasePlotlyType._restore_children
+
+        Returns
+        -------
+        None
+        """
+        for prop in (self._props or ()):
+            match = self._subplotid_prop_re.match(prop)
+            if match and prop not in self._validators:
+                validator_class = self._subplotid_validators[match.group(1)]
+                validator = validator_class(plotly_name=prop)
+                self._validators[prop] = validator
+
+                subplot = validator.data_class._new_empty()
+                subplot._plotly_name = prop
+                subplot._orphan_props.clear()
+                subplot._parent = self
+                self._compound_props[prop] = subplot
+                self._subplotid_props.add(prop)
+
+        super(BaseLayoutType, self)._restore_children()
+
     def _strip_subplot_suffix_of_1(self, prop):
         """
         Strip the suffix for subplot property names that have a suffix of 1.
@@ -65,6 +65,8 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
                                               **custom_serializers)
     _py2js_animate = Dict(allow_none=True).tag(sync=True,
                                                **custom_serializers)
+    _py2js_animationQueue = Dict(allow_none=True).tag(sync=True,
+                                                      **custom_serializers)
 
     _py2js_deleteTraces = Dict(allow_none=True).tag(sync=True,
                                                     **custom_serializers)
@@ -98,6 +100,8 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
                                               **custom_serializers)
     _js2py_pointsCallback = Dict(allow_none=True).tag(sync=True,
                                                       **custom_serializers)
+    _js2py_animationQueue = Dict(allow_none=True).tag(sync=True,
+                                                      **custom_serializers)
 
     # ### Message tracking properties ###
     # The _last_layout_edit_id and _last_trace_edit_id properties are used
@@ -161,6 +165,12 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         # completed yet.
         self._trace_edit_in_process = False
 
+        # ### Animation queues ###
+        # _animation_queues maps the queue_id of animation queues that have
+        # sent steps to the frontend to the queue, until the playback of
+        # all of their steps has been reported
+        self._animation_queues = {}
+
         # View count
         # ----------
         # ipywidget property that stores the number of active frontend
@@ -409,6 +419,55 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         self._py2js_animate = animate_msg
         self._py2js_animate = None
 
+    def _send_animation_queue_msg(self, animation_queue, steps):
+        """
+        Send a chunk of animation queue steps to the frontend, to be
+        played after the steps already queued
+
+        Parameters
+        ----------
+        animation_queue : plotly.animation.AnimationQueue
+            The queue that the steps belong to
+        steps : list[dict]
+            List of steps, each with the style_data, layout_data and
+            style_traces of a Plotly.animate operation
+        """
+
+        # Validate / normalize inputs
+        # ---------------------------
+        for step in steps:
+            step['style_traces'] = self._normalize_trace_indexes(
+                step['style_traces'])
+
+        # Increment layout/trace edit message IDs
+        # ---------------------------------------
+        trace_edit_id = self._last_trace_edit_id + 1
+        self._last_trace_edit_id = trace_edit_id
+        self._trace_edit_in_process = True
+
+        layout_edit_id = self._last_layout_edit_id + 1
+        self._last_layout_edit_id = layout_edit_id
+        self._layout_edit_in_process = True
+
+        # Track queue
+        # -----------
+        self._animation_queues[animation_queue.queue_id] = animation_queue
+
+        # Build message
+        # -------------
+        animation_queue_msg = {
+            'queue_id': animation_queue.queue_id,
+            'steps': steps,
+            'animation_opts': animation_queue.animation_opts,
+            'trace_edit_id': trace_edit_id,
+            'layout_edit_id': layout_edit_id
+        }
+
+        # Send message
+        # ------------
+        self._py2js_animationQueue = animation_queue_msg
+        self._py2js_animationQueue = None
+
     def _send_deleteTraces_msg(self, delete_inds):
         """
         Send Plotly.deleteTraces message to the frontend
@@ -466,13 +525,18 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
         # recent trace edit operation
         if trace_edit_id == self._last_trace_edit_id:
 
+            # ### Index traces by uid ###
+            # The frontend only sends deltas for the traces touched by the
+            # edit, in no particular order
+            trace_indexes_by_uid = {trace.uid: trace_index
+                                    for trace_index, trace
+                                    in enumerate(self.data)}
+
             # ### Loop over deltas ###
             for delta in trace_deltas:
 
                 # #### Find existing trace for uid ###
-                trace_uid = delta['uid']
-                trace_uids = [trace.uid for trace in self.data]
-                trace_index = trace_uids.index(trace_uid)
+                trace_index = trace_indexes_by_uid[delta['uid']]
                 uid_trace = self.data[trace_index]
 
                 # #### Transform defaults to delta ####
@@ -736,6 +800,36 @@ class BaseFigureWidget(BaseFigure, widgets.DOMWidget):
 
         self._js2py_pointsCallback = None
 
+    @observe('_js2py_animationQueue')
+    def _handler_js2py_animationQueue(self, change):
+        """
+        Process animation queue playback message from the frontend
+        """
+
+        # Receive message
+        # ---------------
+        msg_data = change['new']
+        if not msg_data:
+            self._js2py_animationQueue = None
+            return
+
+        queue_id = msg_data['queue_id']
+        animation_queue = self._animation_queues.get(queue_id, None)
+
+        if animation_queue is not None:
+            played_steps = msg_data['played_steps']
+            dropped_steps = msg_data['dropped_steps']
+
+            # Stop tracking queues once all of their steps are accounted
+            # for
+            if (animation_queue.closed and
+                    played_steps + dropped_steps >= animation_queue.num_steps):
+                self._animation_queues.pop(queue_id)
+
+            animation_queue._report_playback(played_steps, dropped_steps)
+
+        self._js2py_animationQueue = None
+
     # Callbacks
     # ---------
     def on_edits_completed(self, fn):
@@ -78,7 +78,14 @@ from __future__ import absolute_import
 import decimal
 from numbers import Number
 
-from plotly import exceptions
+from plotly import exceptions, optional_imports
+
+# Optional imports, may be None for users that only use our core functionality.
+np = optional_imports.get_module('numpy')
+
+# parsed colorscales, keyed by a hashable form of the colorscale
+_PARSED_COLORSCALES = {}
+_MAX_PARSED_COLORSCALES = 128
 
 DEFAULT_PLOTLY_COLORS = ['rgb(31, 119, 180)', 'rgb(255, 127, 14)',
                          'rgb(44, 160, 44)', 'rgb(214, 39, 40)',
@@ -689,3 +696,183 @@ def convert_colorscale_to_rgb(colorscale):
     for color in colorscale:
         color[1] = label_rgb(color[1])
     return colorscale
+
+
+def _parse_color(color):
+    """
+    Returns a color as a tuple of floats (r, g, b) or (r, g, b, a)
+
+    The r, g and b components are between 0 and 255 and the optional alpha
+    component is between 0 and 1. Accepts rgb, rgba, hex and tuple colors.
+    """
+    if isinstance(color, str):
+        if 'rgb' in color:
+            components = color[color.index('(') + 1:color.rindex(')')]
+            return tuple(float(c) for c in components.split(','))
+        elif '#' in color:
+            return tuple(float(c) for c in hex_to_rgb(color))
+    elif isinstance(color, (tuple, list)) and len(color) in (3, 4):
+        rgb = tuple(float(c) * 255.0 for c in color[:3])
+        return rgb + tuple(float(c) for c in color[3:])
+    raise exceptions.PlotlyError(
+        'Whoops! {} is not a valid rgb, rgba, hex or tuple '
+        'color.'.format(color)
+    )
+
+
+def _hashable_colorscale(colorscale):
+    """
+    Returns a hashable version of a colorscale to be used as a cache key
+    """
+    if isinstance(colorscale, str):
+        return colorscale
+    return tuple(
+        tuple(tuple(i) if isinstance(i, list) else i for i in item)
+        if isinstance(item, (tuple, list)) else item
+        for item in colorscale
+    )
+
+
+def _parse_colorscale(colorscale):
+    """
+    Returns a (scale, colors, rgb_factor) triple for a colorscale
+
+    Takes a Plotly scale name, a colorscale of [value, color] pairs or a
+    list of colors (evenly spread over [0, 1]). scale is a read-only float
+    array of the scale values, or None for evenly spread colors. colors is
+    a read-only Nx3 (or Nx4 if any color has an alpha component) float
+    array of the parsed colors, whose r, g and b components are multiplied
+    by rgb_factor to get them between 0 and 255. Results are cached since
+    the same colorscale is typically sampled many times.
+    """
+    key = _hashable_colorscale(colorscale)
+    try:
+        return _PARSED_COLORSCALES[key]
+    except (KeyError, TypeError):
+        pass
+
+    if isinstance(colorscale, str):
+        if colorscale not in PLOTLY_SCALES:
+            raise exceptions.PlotlyError(
+                'If your colorscale is a string, it must be a Plotly scale.'
+            )
+        colorscale = PLOTLY_SCALES[colorscale]
+
+    if len(colorscale) < 1:
+        raise exceptions.PlotlyError('Your colorscale must contain at '
+                                     'least one color.')
+
+    first = colorscale[0]
+    if (isinstance(first, (tuple, list)) and len(first) == 2 and
+            isinstance(first[0], Number)):
+        scale = colorscale_to_scale(colorscale)
+        color_list = colorscale_to_colors(colorscale)
+        if len(scale) > 1:
+            validate_scale_values(scale)
+    else:
+        color_list = list(colorscale)
+        scale = None
+
+    # tuple-only colorscales are interpolated in tuple space, like
+    # find_intermediate_color, and only then scaled to 0-255
+    if all(isinstance(color, tuple) for color in color_list):
+        parsed = [tuple(float(c) for c in color) for color in color_list]
+        rgb_factor = 255.0
+    else:
+        parsed = [_parse_color(color) for color in color_list]
+        rgb_factor = 1.0
+    if any(len(color) == 4 for color in parsed):
+        parsed = [color + (1.0,) * (4 - len(color)) for color in parsed]
+
+    if scale is not None:
+        scale = np.array(scale, dtype=float)
+        scale.flags.writeable = False
+    parsed = np.array(parsed, dtype=float)
+    parsed.flags.writeable = False
+
+    if len(_PARSED_COLORSCALES) >= _MAX_PARSED_COLORSCALES:
+        _PARSED_COLORSCALES.clear()
+    try:
+        _PARSED_COLORSCALES[key] = (scale, parsed, rgb_factor)
+    except TypeError:
+        pass
+    return scale, parsed, rgb_factor
+
+
+def sample_colorscale(colorscale, samplepoints, low=0.0, high=1.0,
+                      colortype='rgb'):
+    """
+    Samples a colorscale at an array of values in one vectorized pass
+
+    Each value is normalized from [low, high] to [0, 1] (values outside are
+    clamped), located in the colorscale and linearly interpolated between
+    the two neighbouring colors. The parsed colorscale is cached, so
+    repeatedly sampling the same colorscale only parses it once.
+
+    :param (str|list) colorscale: a Plotly scale name, a colorscale of
+        [value, color] pairs or a list of colors evenly spread over [0, 1].
+        Colors can be rgb, rgba, hex or tuple colors
+    :param (list|array) samplepoints: 1-dimensional sequence of the values
+        at which the colorscale is sampled
+    :param (float) low: the value mapped to the start of the colorscale
+    :param (float) high: the value mapped to the end of the colorscale
+    :param (str) colortype: 'rgb' to return a list of 'rgb(a, b, c)' (or
+        'rgba(a, b, c, d)') strings, 'array' to return an Nx3 (or Nx4) uint8
+        numpy array or 'float' to return the unrounded Nx3 (or Nx4) float
+        numpy array. r, g and b components are between 0 and 255 and the
+        alpha component is between 0 and 1 (or 0 and 255 for 'array')
+    """
+    if np is None:
+        raise ImportError("sample_colorscale requires numpy")
+    if colortype not in ('rgb', 'array', 'float'):
+        raise exceptions.PlotlyError("colortype must be one of 'rgb', "
+                                     "'array' or 'float'.")
+    if low >= high:
+        raise exceptions.PlotlyError("Incorrect relation between low and "
+                                     "high. low must be smaller than high.")
+
+    scale, scale_colors, rgb_factor = _parse_colorscale(colorscale)
+    t = (np.asarray(samplepoints, dtype=float).ravel() - low) / \
+        float(high - low)
+    t = np.clip(t, 0., 1.)
+
+    num_colors = len(scale_colors)
+    if num_colors == 1:
+        sampled = np.repeat(scale_colors, len(t), axis=0)
+    else:
+        if scale is None:
+            index = (t / (1. / (num_colors - 1))).astype(int)
+            index = np.clip(index, 0, num_colors - 2)
+            intermed = t * (num_colors - 1) - index
+        else:
+            index = np.searchsorted(scale, t, side='right') - 1
+            index = np.clip(index, 0, num_colors - 2)
+            low_values = scale[index]
+            intermed = (t - low_values) / (scale[index + 1] - low_values)
+        low_colors = scale_colors[index]
+        sampled = low_colors + intermed[:, None] * (scale_colors[index + 1] -
+                                                    low_colors)
+        # the end of the colorscale is its last color, exactly
+        sampled[t == 1.] = scale_colors[-1]
+    sampled[:, :3] *= rgb_factor
+
+    if colortype == 'float':
+        return sampled
+
+    if colortype == 'array':
+        if sampled.shape[1] == 4:
+            sampled[:, 3] *= 255.0
+        # np.round rounds half to even, like convert_to_RGB_255
+        return np.round(sampled).astype(np.uint8)
+
+    sampled[:, :3] = np.round(sampled[:, :3])
+    # format each distinct color only once
+    unique_colors, inverse = np.unique(sampled, axis=0, return_inverse=True)
+    labels = []
+    for color in unique_colors.tolist():
+        rgb = tuple(int(c) for c in color[:3])
+        if len(color) == 4:
+            labels.append('rgba(%s, %s, %s, %s)' % (rgb + (color[3],)))
+        else:
+            labels.append(label_rgb(rgb))
+    return [labels[i] for i in inverse]
@@ -223,26 +223,50 @@ class _AnnotatedHeatmap(object):
         z_mid = (z_max+z_min) / 2
         return z_mid
 
+    def get_font_colors(self, min_text_color, max_text_color):
+        """
+        Get the font color of every cell of the heatmap
+
+        Cells with values < the mid value of z get min_text_color, all others
+        get max_text_color. The comparison is done in a single numpy
+        operation when z is a rectangular numeric matrix.
+
+        :rtype (list[list]) font_colors: font color for each cell of z
+        """
+        z_mid = _AnnotatedHeatmap.get_z_mid(self)
+        if np:
+            z = np.asarray(self.z)
+            if z.ndim == 2 and z.dtype.kind in 'biuf':
+                return np.where(z < z_mid, min_text_color,
+                                max_text_color).tolist()
+        return [[min_text_color if val < z_mid else max_text_color
+                 for val in row] for row in self.z]
+
     def make_annotations(self):
         """
-        Get annotations for each cell of the heatmap with graph_objs.Annotation
+        Get annotations for each cell of the heatmap
+
+        Annotations are returned as plain dicts so that they are validated
+        only once, when they are assigned to the figure layout.
 
         :rtype (list[dict]) annotations: list of annotations for each cell of
             the heatmap
         """
         min_text_color, max_text_color = _AnnotatedHeatmap.get_text_color(self)
-        z_mid = _AnnotatedHeatmap.get_z_mid(self)
-        annotations = []
-        for n, row in enumerate(self.z):
-            for m, val in enumerate(row):
-                font_color = min_text_color if val < z_mid else max_text_color
-                annotations.append(
-                    graph_objs.layout.Annotation(
-                        text=str(self.annotation_text[n][m]),
-                        x=self.x[m],
-                        y=self.y[n],
-                        xref='x1',
-                        yref='y1',
-                        font=dict(color=font_color),
-                        showarrow=False))
+        font_colors = _AnnotatedHeatmap.get_font_colors(
+            self, min_text_color, max_text_color
+        )
+        x = list(self.x)
+        annotations = [
+            dict(text=str(text),
+                 x=x[m],
+                 y=y,
+                 xref='x1',
+                 yref='y1',
+                 font=dict(color=font_color),
+                 showarrow=False)
+            for text_row, color_row, y in zip(self.annotation_text,
+                                              font_colors, self.y)
+            for m, (text, font_color) in enumerate(zip(text_row, color_row))
+        ]
         return annotations
@@ -1,11 +1,16 @@
 from __future__ import absolute_import
 
+from plotly import optional_imports
 from plotly.figure_factory import utils
 from plotly.figure_factory._ohlc import (_DEFAULT_INCREASING_COLOR,
                                          _DEFAULT_DECREASING_COLOR,
+                                         _dates_array, _ohlc_arrays,
                                          validate_ohlc)
 from plotly.graph_objs import graph_objs
 
+# Optional imports, may be None for users that only use our core functionality.
+np = optional_imports.get_module('numpy')
+
 
 def make_increasing_candle(open, high, low, close, dates, **kwargs):
     """
@@ -243,7 +248,24 @@ class _Candlestick(object):
             self.x = dates
         else:
             self.x = [x for x in range(len(self.open))]
-        self.get_candle_increase()
+
+        self.arrays = _ohlc_arrays(open, high, low, close)
+        self.x_array = (_dates_array(dates, len(open))
+                        if self.arrays is not None else None)
+
+    def get_candle_arrays(self, mask):
+        """
+        Build the box x and y values of the candles selected by mask.
+
+        Each candle is drawn by six y values: low, open, close, close,
+        close and high, all at the candle's x value.
+
+        :rtype (ndarray, ndarray) x, y: flat box x and y values
+        """
+        open_values, high_values, low_values, close_values = self.arrays
+        y = np.column_stack([low_values, open_values, close_values,
+                             close_values, close_values, high_values])
+        return np.repeat(self.x_array[mask], 6), y[mask].ravel()
 
     def get_candle_increase(self):
         """
@@ -252,6 +274,11 @@ class _Candlestick(object):
         The data is increasing when close value > open value
         and decreasing when the close value <= open value.
         """
+        if self.x_array is not None:
+            open_values, _, _, close_values = self.arrays
+            with np.errstate(invalid='ignore'):
+                return self.get_candle_arrays(close_values > open_values)
+
         increase_y = []
         increase_x = []
         for index in range(len(self.open)):
@@ -276,6 +303,11 @@ class _Candlestick(object):
         The data is increasing when close value > open value
         and decreasing when the close value <= open value.
         """
+        if self.x_array is not None:
+            open_values, _, _, close_values = self.arrays
+            with np.errstate(invalid='ignore'):
+                return self.get_candle_arrays(close_values <= open_values)
+
         decrease_y = []
         decrease_x = []
         for index in range(len(self.open)):
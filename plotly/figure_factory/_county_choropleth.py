@@ -9,7 +9,6 @@ import pandas as pd
 import warnings
 
 from math import log, floor
-from numbers import Number
 
 pd.options.mode.chained_assignment = None
 
@@ -300,60 +299,217 @@ def _intervals_as_labels(array_of_intervals, round_legend_values, exponent_forma
     return string_intervals
 
 
-def _calculations(df, fips, values, index, f, simplify_county, level,
-                  x_centroids, y_centroids, centroid_text, x_traces,
-                  y_traces, fips_polygon_map):
-    # 0-pad FIPS code to ensure exactly 5 digits
-    padded_f = str(f).zfill(5)
-    if fips_polygon_map[f].type == 'Polygon':
-        x = fips_polygon_map[f].simplify(
-            simplify_county
-        ).exterior.xy[0].tolist()
-        y = fips_polygon_map[f].simplify(
-            simplify_county
-        ).exterior.xy[1].tolist()
-
-        x_c, y_c = fips_polygon_map[f].centroid.xy
-        county_name_str = str(df[df['FIPS'] == f]['COUNTY_NAME'].iloc[0])
-        state_name_str = str(df[df['FIPS'] == f]['STATE_NAME'].iloc[0])
-
-        t_c = (
-            'County: ' + county_name_str + '<br>' +
-            'State: ' + state_name_str + '<br>' +
-            'FIPS: ' + padded_f + '<br>Value: ' + str(values[index])
+# process-level store of the geometries read from package_data. The
+# county and state stores are keyed by their simplification level
+_geometry_cache = {}
+
+
+def _get_us_geometry_dfs():
+    """
+    Return the county and state GeoDataFrames, reading the shapefiles once
+    """
+    if 'dfs' not in _geometry_cache:
+        _geometry_cache['dfs'] = _create_us_counties_df(
+            st_to_state_name_dict, state_to_st_dict
         )
+    return _geometry_cache['dfs']
+
+
+def _polygons(geometry):
+    if geometry.type == 'Polygon':
+        return [geometry]
+    elif geometry.type == 'MultiPolygon':
+        return list(geometry)
+    return []
 
-        x_centroids.append(x_c[0])
-        y_centroids.append(y_c[0])
-        centroid_text.append(t_c)
-
-        x_traces[level] = x_traces[level] + x + [np.nan]
-        y_traces[level] = y_traces[level] + y + [np.nan]
-    elif fips_polygon_map[f].type == 'MultiPolygon':
-        x = ([poly.simplify(simplify_county).exterior.xy[0].tolist() for
-              poly in fips_polygon_map[f]])
-        y = ([poly.simplify(simplify_county).exterior.xy[1].tolist() for
-              poly in fips_polygon_map[f]])
-
-        x_c = [poly.centroid.xy[0].tolist() for poly in fips_polygon_map[f]]
-        y_c = [poly.centroid.xy[1].tolist() for poly in fips_polygon_map[f]]
-
-        county_name_str = str(df[df['FIPS'] == f]['COUNTY_NAME'].iloc[0])
-        state_name_str = str(df[df['FIPS'] == f]['STATE_NAME'].iloc[0])
-        text = (
-            'County: ' + county_name_str + '<br>' +
-            'State: ' + state_name_str + '<br>' +
-            'FIPS: ' + padded_f + '<br>Value: ' + str(values[index])
+
+def _load_store(geometry_cache_dir, name):
+    if geometry_cache_dir is None:
+        return None
+    path = os.path.join(geometry_cache_dir, name)
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as npz:
+        return dict(npz.items())
+
+
+def _save_store(geometry_cache_dir, name, store):
+    if geometry_cache_dir is None:
+        return
+    path = os.path.join(geometry_cache_dir, name)
+    if os.path.exists(path):
+        return
+    if not os.path.exists(geometry_cache_dir):
+        os.makedirs(geometry_cache_dir)
+    np.savez_compressed(path, **store)
+
+
+def _county_store(simplify_county, geometry_cache_dir=None):
+    """
+    Return the compact array store of the simplified county geometries
+
+    The store is a dict of numpy arrays. The outline coordinates of all
+    counties are concatenated into 'x' and 'y', with a nan after every
+    polygon ring, and county i owns the slice
+    coord_offsets[i]:coord_offsets[i + 1]. Centroids are stored the same
+    way with 'centroid_offsets'. 'text' holds the hover text of every
+    county up to its value.
+    """
+    filename = 'county_geometry_{}.npz'.format(simplify_county)
+    key = ('county', simplify_county)
+    if key in _geometry_cache:
+        store = _geometry_cache[key]
+        _save_store(geometry_cache_dir, filename, store)
+        return store
+
+    store = _load_store(geometry_cache_dir, filename)
+    if store is None:
+        df, df_state = _get_us_geometry_dfs()
+        fips_polygon_map = dict(
+            zip(
+                df['FIPS'].tolist(),
+                df['geometry'].tolist()
+            )
         )
-        t_c = [text for poly in fips_polygon_map[f]]
-        x_centroids = x_c + x_centroids
-        y_centroids = y_c + y_centroids
-        centroid_text = t_c + centroid_text
-        for x_y_idx in range(len(x)):
-            x_traces[level] = x_traces[level] + x[x_y_idx] + [np.nan]
-            y_traces[level] = y_traces[level] + y[x_y_idx] + [np.nan]
+        df_first = df.drop_duplicates('FIPS').set_index('FIPS')
+
+        fips_list, text, state_names = [], [], []
+        x, y, coord_offsets = [], [], [0]
+        x_c, y_c, centroid_offsets = [], [], [0]
+        for f, geometry in fips_polygon_map.items():
+            polys = _polygons(geometry)
+            if geometry.type == 'Polygon':
+                centroids = [geometry.centroid]
+            else:
+                centroids = [poly.centroid for poly in polys]
+
+            for poly in polys:
+                ring_x, ring_y = poly.simplify(simplify_county).exterior.xy
+                x.extend(ring_x)
+                x.append(np.nan)
+                y.extend(ring_y)
+                y.append(np.nan)
+            coord_offsets.append(len(x))
+
+            x_c.extend(centroid.x for centroid in centroids)
+            y_c.extend(centroid.y for centroid in centroids)
+            centroid_offsets.append(len(x_c))
+
+            county_name_str = str(df_first.loc[f, 'COUNTY_NAME'])
+            state_name_str = str(df_first.loc[f, 'STATE_NAME'])
+            fips_list.append(f)
+            state_names.append(state_name_str)
+            text.append(
+                'County: ' + county_name_str + '<br>' +
+                'State: ' + state_name_str + '<br>' +
+                'FIPS: ' + str(f).zfill(5) + '<br>Value: '
+            )
+
+        store = {
+            'fips': np.array(fips_list, dtype=int),
+            'state_names': np.array(state_names),
+            'text': np.array(text),
+            'x': np.array(x, dtype=float),
+            'y': np.array(y, dtype=float),
+            'coord_offsets': np.array(coord_offsets, dtype=int),
+            'x_centroids': np.array(x_c, dtype=float),
+            'y_centroids': np.array(y_c, dtype=float),
+            'centroid_offsets': np.array(centroid_offsets, dtype=int),
+        }
+        _save_store(geometry_cache_dir, filename, store)
+
+    # index for looking up the rows of FIPS values
+    store['fips_order'] = np.argsort(store['fips'], kind='mergesort')
+    store['sorted_fips'] = store['fips'][store['fips_order']]
 
-    return x_traces, y_traces, x_centroids, y_centroids, centroid_text
+    _geometry_cache[key] = store
+    return store
+
+
+def _state_store(simplify_state, geometry_cache_dir=None):
+    """
+    Return the compact array store of the simplified state outlines
+
+    Laid out like the county store: state i owns the slice
+    offsets[i]:offsets[i + 1] of 'x' and 'y'.
+    """
+    filename = 'state_geometry_{}.npz'.format(simplify_state)
+    key = ('state', simplify_state)
+    if key in _geometry_cache:
+        store = _geometry_cache[key]
+        _save_store(geometry_cache_dir, filename, store)
+        return store
+
+    store = _load_store(geometry_cache_dir, filename)
+    if store is None:
+        df, df_state = _get_us_geometry_dfs()
+
+        names, x, y, offsets = [], [], [], [0]
+        for name, geometry in zip(df_state['STATE_NAME'],
+                                  df_state['geometry']):
+            if geometry.type == 'Polygon':
+                ring_x, ring_y = geometry.simplify(
+                    simplify_state
+                ).exterior.xy
+                x.extend(ring_x)
+                y.extend(ring_y)
+            elif geometry.type == 'MultiPolygon':
+                for poly in geometry:
+                    ring_x, ring_y = poly.simplify(
+                        simplify_state
+                    ).exterior.xy
+                    x.extend(ring_x)
+                    x.append(np.nan)
+                    y.extend(ring_y)
+                    y.append(np.nan)
+            x.append(np.nan)
+            y.append(np.nan)
+            names.append(name)
+            offsets.append(len(x))
+
+        store = {
+            'state_names': np.array(names),
+            'x': np.array(x, dtype=float),
+            'y': np.array(y, dtype=float),
+            'offsets': np.array(offsets, dtype=int),
+        }
+        _save_store(geometry_cache_dir, filename, store)
+
+    _geometry_cache[key] = store
+    return store
+
+
+def _gather(values, offsets, rows):
+    """
+    Concatenate the slices offsets[r]:offsets[r + 1] of values for rows
+    """
+    rows = np.asarray(rows, dtype=int)
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    shifts = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return values[shifts + np.arange(lengths.sum())]
+
+
+def _lookup_fips(store, fips):
+    """
+    Return the store rows of fips and a mask of the fips that were found
+    """
+    sorted_fips = store['sorted_fips']
+    pos = np.searchsorted(sorted_fips, fips)
+    pos = np.minimum(pos, len(sorted_fips) - 1)
+    found = sorted_fips[pos] == fips
+    return store['fips_order'][pos], found
+
+
+def _data_range(values):
+    try:
+        values = np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        return None
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return None
+    return values.min(), values.max()
 
 
 def create_choropleth(fips, values, scope=['usa'], binning_endpoints=None,
@@ -362,7 +518,8 @@ def create_choropleth(fips, values, scope=['usa'], binning_endpoints=None,
                       show_state_data=True, state_outline=None,
                       county_outline=None, centroid_marker=None,
                       round_legend_values=False, exponent_format=False,
-                      legend_title='', **layout_options):
+                      legend_title='', geometry_cache_dir=None,
+                      **layout_options):
     """
     Returns figure for county choropleth. Uses data from package_data.
 
@@ -425,6 +582,13 @@ def create_choropleth(fips, values, scope=['usa'], binning_endpoints=None,
         B number format. For example 4000.0 becomes 4.0K
         Default = False
     :param (str) legend_title: title that appears above the legend
+    :param (str) geometry_cache_dir: directory in which the simplified
+        county and state geometries are persisted as compact numpy array
+        files, one per simplification level. Later calls, including calls
+        from other processes, load these files instead of reading and
+        simplifying the shapefiles in package_data. The geometries are
+        always cached in memory for the lifetime of the process.
+        Default = None
     :param **layout_options: a **kwargs argument for all layout parameters
 
 
@@ -581,15 +745,7 @@ def create_choropleth(fips, values, scope=['usa'], binning_endpoints=None,
             "```"
         )
 
-    df, df_state = _create_us_counties_df(st_to_state_name_dict,
-                                          state_to_st_dict)
-
-    fips_polygon_map = dict(
-        zip(
-            df['FIPS'].tolist(),
-            df['geometry'].tolist()
-        )
-    )
+    county_store = _county_store(simplify_county, geometry_cache_dir)
 
     if not state_outline:
         state_outline = {'color': 'rgb(240, 240, 240)',
@@ -616,7 +772,7 @@ def create_choropleth(fips, values, scope=['usa'], binning_endpoints=None,
         values = values.tolist()
 
     # make fips numeric
-    fips = map(lambda x: int(x), fips)
+    fips = np.array([int(f) for f in fips], dtype=int)
 
     if binning_endpoints:
         intervals = utils.endpts_to_intervals(binning_endpoints)
@@ -691,8 +847,6 @@ def create_choropleth(fips, values, scope=['usa'], binning_endpoints=None,
         )
 
     color_lookup = dict(zip(LEVELS, colorscale))
-    x_traces = dict(zip(LEVELS, [[] for i in range(len(LEVELS))]))
-    y_traces = dict(zip(LEVELS, [[] for i in range(len(LEVELS))]))
 
     # scope
     if isinstance(scope, str):
@@ -706,7 +860,7 @@ def create_choropleth(fips, values, scope=['usa'], binning_endpoints=None,
                     'American Samoa']
     for state in scope:
         if state.lower() == 'usa':
-            scope_names = df['STATE_NAME'].unique()
+            scope_names = pd.unique(county_store['state_names'])
             scope_names = list(scope_names)
             for ex_st in extra_states:
                 try:
@@ -717,46 +871,45 @@ def create_choropleth(fips, values, scope=['usa'], binning_endpoints=None,
             if state in st_to_state_name_dict.keys():
                 state = st_to_state_name_dict[state]
             scope_names.append(state)
-    df_state = df_state[df_state['STATE_NAME'].isin(scope_names)]
-
-    plot_data = []
-    x_centroids = []
-    y_centroids = []
-    centroid_text = []
-    fips_not_in_shapefile = []
-    if not binning_endpoints:
-        for index, f in enumerate(fips):
-            level = values[index]
-            try:
-                fips_polygon_map[f].type
-
-                (x_traces, y_traces, x_centroids,
-                 y_centroids, centroid_text) = _calculations(
-                    df, fips, values, index, f, simplify_county, level,
-                    x_centroids, y_centroids, centroid_text, x_traces,
-                    y_traces, fips_polygon_map
-                )
-            except KeyError:
-                fips_not_in_shapefile.append(f)
 
+    # index of the level of every value
+    if binning_endpoints:
+        level_index = np.searchsorted(binning_endpoints,
+                                      np.asarray(values, dtype=float))
     else:
-        for index, f in enumerate(fips):
-            for j, inter in enumerate(intervals):
-                if inter[0] < values[index] <= inter[1]:
-                    break
-            level = LEVELS[j]
+        level_lookup = dict((lev, j) for j, lev in enumerate(LEVELS))
+        level_index = np.array([level_lookup[v] for v in values], dtype=int)
+
+    rows, found = _lookup_fips(county_store, fips)
+    fips_not_in_shapefile = fips[~found].tolist()
+    rows = rows[found]
+    level_index = level_index[found]
+    found_values = [v for v, is_found in zip(values, found) if is_found]
+
+    # group the counties by level, keeping them in the order they were given
+    by_level = np.argsort(level_index, kind='mergesort')
+    level_bounds = np.searchsorted(level_index[by_level],
+                                   np.arange(len(LEVELS) + 1))
+    x_traces = {}
+    y_traces = {}
+    for j, lev in enumerate(LEVELS):
+        level_rows = rows[by_level[level_bounds[j]:level_bounds[j + 1]]]
+        x_traces[lev] = _gather(county_store['x'],
+                                county_store['coord_offsets'], level_rows)
+        y_traces[lev] = _gather(county_store['y'],
+                                county_store['coord_offsets'], level_rows)
 
-            try:
-                fips_polygon_map[f].type
-
-                (x_traces, y_traces, x_centroids,
-                 y_centroids, centroid_text) = _calculations(
-                    df, fips, values, index, f, simplify_county, level,
-                    x_centroids, y_centroids, centroid_text, x_traces,
-                    y_traces, fips_polygon_map
-                )
-            except KeyError:
-                fips_not_in_shapefile.append(f)
+    plot_data = []
+    x_centroids = _gather(county_store['x_centroids'],
+                          county_store['centroid_offsets'], rows)
+    y_centroids = _gather(county_store['y_centroids'],
+                          county_store['centroid_offsets'], rows)
+    n_centroids = (county_store['centroid_offsets'][rows + 1] -
+                   county_store['centroid_offsets'][rows])
+    centroid_text = []
+    for text, value, n in zip(county_store['text'][rows], found_values,
+                              n_centroids):
+        centroid_text.extend([text + str(value)] * n)
 
     if len(fips_not_in_shapefile) > 0:
         msg = (
@@ -770,26 +923,12 @@ def create_choropleth(fips, values, scope=['usa'], binning_endpoints=None,
         )
         warnings.warn(msg)
 
-    x_states = []
-    y_states = []
-    for index, row in df_state.iterrows():
-        if df_state['geometry'][index].type == 'Polygon':
-            x = row.geometry.simplify(simplify_state).exterior.xy[0].tolist()
-            y = row.geometry.simplify(simplify_state).exterior.xy[1].tolist()
-            x_states = x_states + x
-            y_states = y_states + y
-        elif df_state['geometry'][index].type == 'MultiPolygon':
-            x = ([poly.simplify(simplify_state).exterior.xy[0].tolist() for
-                  poly in df_state['geometry'][index]])
-            y = ([poly.simplify(simplify_state).exterior.xy[1].tolist() for
-                  poly in df_state['geometry'][index]])
-            for segment in range(len(x)):
-                x_states = x_states + x[segment]
-                y_states = y_states + y[segment]
-                x_states.append(np.nan)
-                y_states.append(np.nan)
-        x_states.append(np.nan)
-        y_states.append(np.nan)
+    state_store = _state_store(simplify_state, geometry_cache_dir)
+    state_rows = np.flatnonzero(
+        np.in1d(state_store['state_names'], scope_names)
+    )
+    x_states = _gather(state_store['x'], state_store['offsets'], state_rows)
+    y_states = _gather(state_store['y'], state_store['offsets'], state_rows)
 
     for lev in LEVELS:
         county_data = dict(
@@ -894,20 +1033,14 @@ def create_choropleth(fips, values, scope=['usa'], binning_endpoints=None,
         yaxis_range_low = float('inf')
         yaxis_range_high = float('-inf')
         for trace in fig['data']:
-            if all(isinstance(n, Number) for n in trace['x']):
-                calc_x_min = min(trace['x'] or [float('inf')])
-                calc_x_max = max(trace['x'] or [float('-inf')])
-                if calc_x_min < xaxis_range_low:
-                    xaxis_range_low = calc_x_min
-                if calc_x_max > xaxis_range_high:
-                    xaxis_range_high = calc_x_max
-            if all(isinstance(n, Number) for n in trace['y']):
-                calc_y_min = min(trace['y'] or [float('inf')])
-                calc_y_max = max(trace['y'] or [float('-inf')])
-                if calc_y_min < yaxis_range_low:
-                    yaxis_range_low = calc_y_min
-                if calc_y_max > yaxis_range_high:
-                    yaxis_range_high = calc_y_max
+            x_range = _data_range(trace['x'])
+            if x_range is not None:
+                xaxis_range_low = min(xaxis_range_low, x_range[0])
+                xaxis_range_high = max(xaxis_range_high, x_range[1])
+            y_range = _data_range(trace['y'])
+            if y_range is not None:
+                yaxis_range_low = min(yaxis_range_low, y_range[0])
+                yaxis_range_high = max(yaxis_range_high, y_range[1])
 
     # camera zoom
     fig['layout']['xaxis']['range'] = [xaxis_range_low, xaxis_range_high]
@@ -4,6 +4,8 @@ from __future__ import absolute_import
 
 from collections import OrderedDict
 
+import six
+
 from plotly import exceptions, optional_imports
 from plotly.graph_objs import graph_objs
 
@@ -17,7 +19,8 @@ scs = optional_imports.get_module('scipy.spatial')
 def create_dendrogram(X, orientation="bottom", labels=None,
                       colorscale=None, distfun=None,
                       linkagefun=lambda x: sch.linkage(x, 'complete'),
-                      hovertext=None):
+                      hovertext=None, merge_links=False, truncate_mode=None,
+                      p=30):
     """
     BETA function that returns a dendrogram Plotly figure object.
 
@@ -30,6 +33,14 @@ def create_dendrogram(X, orientation="bottom", labels=None,
     :param (function) linkagefun: Function to compute the linkage matrix from
                                   the pairwise distances
     :param (list[list]) hovertext: List of hovertext for constituent traces of dendrogram
+    :param (bool) merge_links: if True, all links of the same color are
+        drawn as a single trace with nan-separated coordinates instead of
+        one trace per link. Use this for large trees, where one trace per
+        link makes the figure slow to build and render
+    :param (str) truncate_mode: passed on to scipy's dendrogram to condense
+        large trees. 'lastp' only shows the last p merged clusters, 'level'
+        only shows p levels of the tree. Default is None (no truncation)
+    :param (int) p: the p parameter of truncate_mode
 
         clusters
 
@@ -88,7 +99,8 @@ def create_dendrogram(X, orientation="bottom", labels=None,
 
     dendrogram = _Dendrogram(X, orientation, labels, colorscale,
                              distfun=distfun, linkagefun=linkagefun,
-                             hovertext=hovertext)
+                             hovertext=hovertext, merge_links=merge_links,
+                             truncate_mode=truncate_mode, p=p)
 
     return graph_objs.Figure(data=dendrogram.data,
                              layout=dendrogram.layout)
@@ -101,9 +113,13 @@ class _Dendrogram(object):
                  width=np.inf, height=np.inf, xaxis='xaxis', yaxis='yaxis',
                  distfun=None,
                  linkagefun=lambda x: sch.linkage(x, 'complete'),
-                 hovertext=None):
+                 hovertext=None, merge_links=False, truncate_mode=None,
+                 p=30):
         self.orientation = orientation
         self.labels = labels
+        self.merge_links = merge_links
+        self.truncate_mode = truncate_mode
+        self.p = p
         self.xaxis = xaxis
         self.yaxis = yaxis
         self.data = []
@@ -135,11 +151,7 @@ class _Dendrogram(object):
         yvals_flat = yvals.flatten()
         xvals_flat = xvals.flatten()
 
-        self.zero_vals = []
-
-        for i in range(len(yvals_flat)):
-            if yvals_flat[i] == 0.0 and xvals_flat[i] not in self.zero_vals:
-                self.zero_vals.append(xvals_flat[i])
+        self.zero_vals = np.unique(xvals_flat[yvals_flat == 0.0]).tolist()
 
         if len(self.zero_vals) > len(yvals) + 1:
             # If the length of zero_vals is larger than the length of yvals,
@@ -273,8 +285,13 @@ class _Dendrogram(object):
         """
         d = distfun(X)
         Z = linkagefun(d)
+        truncate_kwargs = {}
+        if self.truncate_mode is not None:
+            truncate_kwargs = {'truncate_mode': self.truncate_mode,
+                               'p': self.p}
         P = sch.dendrogram(Z, orientation=self.orientation,
-                           labels=self.labels, no_plot=True)
+                           labels=self.labels, no_plot=True,
+                           **truncate_kwargs)
 
         icoord = scp.array(P['icoord'])
         dcoord = scp.array(P['dcoord'])
@@ -282,6 +299,11 @@ class _Dendrogram(object):
         color_list = scp.array(P['color_list'])
         colors = self.get_color_dict(colorscale)
 
+        if self.merge_links:
+            trace_list = self.get_merged_traces(icoord, dcoord, color_list,
+                                                colors, hovertext)
+            return trace_list, icoord, dcoord, ordered_labels, P['leaves']
+
         trace_list = []
 
         for i in range(len(icoord)):
@@ -326,3 +348,69 @@ class _Dendrogram(object):
             trace_list.append(trace)
 
         return trace_list, icoord, dcoord, ordered_labels, P['leaves']
+
+    def get_merged_traces(self, icoord, dcoord, color_list, colors,
+                          hovertext):
+        """
+        Returns one trace per link color, built with numpy.
+
+        The 4 points of every link of a color are laid out in a single
+        array, with a nan after each link so that links are not connected.
+
+        :param (ndarray) icoord: X points of the links, shape (n_links, 4)
+        :param (ndarray) dcoord: Y points of the links, shape (n_links, 4)
+        :param (ndarray) color_list: color code of each link
+        :param (dict) colors: color codes mapped to plot colors
+        :param (list) hovertext: List of hovertext for each link
+        :rtype (list): List of Plotly trace dicts, one per color
+
+        """
+        if self.orientation in ['top', 'bottom']:
+            xs, ys = icoord, dcoord
+        else:
+            xs, ys = dcoord, icoord
+
+        try:
+            x_index = int(self.xaxis[-1])
+        except ValueError:
+            x_index = ''
+
+        try:
+            y_index = int(self.yaxis[-1])
+        except ValueError:
+            y_index = ''
+
+        trace_list = []
+        for color_key in OrderedDict.fromkeys(color_list):
+            links = np.flatnonzero(color_list == color_key)
+
+            x = np.full((len(links), 5), np.nan)
+            x[:, :4] = self.sign[self.xaxis] * xs[links]
+            y = np.full((len(links), 5), np.nan)
+            y[:, :4] = self.sign[self.yaxis] * ys[links]
+
+            text = None
+            if hovertext:
+                text = []
+                for link in links:
+                    link_text = hovertext[link]
+                    if isinstance(link_text, six.string_types):
+                        link_text = [link_text] * 4
+                    text.extend(link_text)
+                    text.append(None)
+
+            trace = dict(
+                type='scatter',
+                x=x.ravel(),
+                y=y.ravel(),
+                mode='lines',
+                marker=dict(color=colors[color_key]),
+                text=text,
+                hoverinfo='text'
+            )
+            trace['xaxis'] = 'x' + str(x_index)
+            trace['yaxis'] = 'y' + str(y_index)
+
+            trace_list.append(trace)
+
+        return trace_list
@@ -48,7 +48,8 @@ def validate_distplot(hist_data, curve_type):
 
 def create_distplot(hist_data, group_labels, bin_size=1., curve_type='kde',
                     colors=None, rug_text=None, histnorm=DEFAULT_HISTNORM,
-                    show_hist=True, show_curve=True, show_rug=True):
+                    show_hist=True, show_curve=True, show_rug=True,
+                    binned_kde=False, curve_points=500, max_rug_points=None):
     """
     BETA function that creates a distplot similar to seaborn.distplot
 
@@ -70,6 +71,17 @@ def create_distplot(hist_data, group_labels, bin_size=1., curve_type='kde',
     :param (bool) show_rug: Add rug to distplot? Default = True
     :param (list[str]) colors: Colors for traces.
     :param (list[list]) rug_text: Hovertext values for rug_plot,
+    :param (bool) binned_kde: If True, the kde curve is computed by linearly
+        binning each data set onto the curve grid and convolving the bin
+        counts with the gaussian kernel using an FFT, instead of evaluating
+        scipy.stats.gaussian_kde at every grid point. The cost no longer
+        grows with (number of samples) x (number of grid points), which
+        makes large data sets practical. Default = False
+    :param (int) curve_points: Number of points at which the kde or normal
+        curve is evaluated. Default = 500
+    :param (int) max_rug_points: Maximum number of markers drawn in each rug
+        plot. Larger data sets are represented by a random subsample (with a
+        fixed seed) of this size. Default = None (draw every point)
     :return (dict): Representation of a distplot figure.
 
     Example 1: Simple distplot of 1 data set
@@ -175,34 +187,21 @@ def create_distplot(hist_data, group_labels, bin_size=1., curve_type='kde',
     if isinstance(bin_size, (float, int)):
         bin_size = [bin_size] * len(hist_data)
 
-    hist = _Distplot(
+    distplot = _Distplot(
         hist_data, histnorm, group_labels, bin_size,
         curve_type, colors, rug_text,
-        show_hist, show_curve).make_hist()
-
-    if curve_type == 'normal':
-        curve = _Distplot(
-            hist_data, histnorm, group_labels, bin_size,
-            curve_type, colors, rug_text,
-            show_hist, show_curve).make_normal()
-    else:
-        curve = _Distplot(
-            hist_data, histnorm, group_labels, bin_size,
-            curve_type, colors, rug_text,
-            show_hist, show_curve).make_kde()
-
-    rug = _Distplot(
-        hist_data, histnorm, group_labels, bin_size,
-        curve_type, colors, rug_text,
-        show_hist, show_curve).make_rug()
+        show_hist, show_curve, binned_kde, curve_points, max_rug_points)
 
     data = []
     if show_hist:
-        data.append(hist)
+        data.append(distplot.make_hist())
     if show_curve:
-        data.append(curve)
+        if curve_type == 'normal':
+            data.append(distplot.make_normal())
+        else:
+            data.append(distplot.make_kde())
     if show_rug:
-        data.append(rug)
+        data.append(distplot.make_rug())
         layout = graph_objs.Layout(
             barmode='overlay',
             hovermode='closest',
@@ -239,13 +238,17 @@ class _Distplot(object):
     """
     def __init__(self, hist_data, histnorm, group_labels,
                  bin_size, curve_type, colors,
-                 rug_text, show_hist, show_curve):
+                 rug_text, show_hist, show_curve, binned_kde=False,
+                 curve_points=500, max_rug_points=None):
         self.hist_data = hist_data
         self.histnorm = histnorm
         self.group_labels = group_labels
         self.bin_size = bin_size
         self.show_hist = show_hist
         self.show_curve = show_curve
+        self.binned_kde = binned_kde
+        self.curve_points = curve_points
+        self.max_rug_points = max_rug_points
         self.trace_number = len(hist_data)
         if rug_text:
             self.rug_text = rug_text
@@ -294,6 +297,33 @@ class _Distplot(object):
                                opacity=.7)
         return hist
 
+    def get_curve_x(self, index):
+        """
+        Makes the grid on which the kde or normal curve is evaluated.
+
+        :rtype (ndarray) curve_x: curve_points evenly spaced values starting
+            at the minimum of the data set
+        """
+        return (self.start[index] +
+                np.arange(self.curve_points) *
+                (self.end[index] - self.start[index]) / self.curve_points)
+
+    def binned_kde_values(self, index):
+        """
+        Evaluates a gaussian kde of a data set on its curve grid.
+
+        The data is linearly binned onto the grid (extended by one point so
+        that the maximum falls on it) and the bin weights are convolved with
+        the gaussian kernel through an FFT. The kernel bandwidth follows
+        Scott's rule, as in scipy.stats.gaussian_kde.
+
+        :rtype (ndarray) curve_y: density at each point of the curve grid
+        """
+        return utils.binned_gaussian_kde(
+            self.hist_data[index], self.start[index], self.end[index],
+            self.curve_points
+        )[:-1]
+
     def make_kde(self):
         """
         Makes the kernel density estimation(s) for create_distplot().
@@ -304,12 +334,13 @@ class _Distplot(object):
         """
         curve = [None] * self.trace_number
         for index in range(self.trace_number):
-            self.curve_x[index] = [self.start[index] +
-                                   x * (self.end[index] - self.start[index])
-                                   / 500 for x in range(500)]
-            self.curve_y[index] = (scipy_stats.gaussian_kde
-                                   (self.hist_data[index])
-                                   (self.curve_x[index]))
+            self.curve_x[index] = self.get_curve_x(index)
+            if self.binned_kde:
+                self.curve_y[index] = self.binned_kde_values(index)
+            else:
+                self.curve_y[index] = (scipy_stats.gaussian_kde
+                                       (self.hist_data[index])
+                                       (self.curve_x[index]))
 
             if self.histnorm == ALTERNATIVE_HISTNORM:
                 self.curve_y[index] *= self.bin_size[index]
@@ -342,9 +373,7 @@ class _Distplot(object):
         for index in range(self.trace_number):
             mean[index], sd[index] = (scipy_stats.norm.fit
                                       (self.hist_data[index]))
-            self.curve_x[index] = [self.start[index] +
-                                   x * (self.end[index] - self.start[index])
-                                   / 500 for x in range(500)]
+            self.curve_x[index] = self.get_curve_x(index)
             self.curve_y[index] = scipy_stats.norm.pdf(
                 self.curve_x[index], loc=mean[index], scale=sd[index])
 
@@ -372,11 +401,17 @@ class _Distplot(object):
         """
         rug = [None] * self.trace_number
         for index in range(self.trace_number):
+            rug_x = self.hist_data[index]
+            rug_text = self.rug_text[index]
+            sample = utils.subsample_indices(len(rug_x), self.max_rug_points)
+            if sample is not None:
+                rug_x = np.asarray(rug_x)[sample]
+                if rug_text is not None:
+                    rug_text = np.asarray(rug_text)[sample]
 
             rug[index] = dict(type='scatter',
-                              x=self.hist_data[index],
-                              y=([self.group_labels[index]] *
-                                 len(self.hist_data[index])),
+                              x=rug_x,
+                              y=[self.group_labels[index]] * len(rug_x),
                               xaxis='x1',
                               yaxis='y2',
                               mode='markers',
@@ -384,7 +419,7 @@ class _Distplot(object):
                               legendgroup=self.group_labels[index],
                               showlegend=(False if self.show_hist or
                                           self.show_curve else True),
-                              text=self.rug_text[index],
+                              text=rug_text,
                               marker=dict(color=self.colors[index % len(self.colors)],
                                           symbol='line-ns-open'))
         return rug
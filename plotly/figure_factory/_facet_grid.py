@@ -7,6 +7,7 @@ from plotly.tools import make_subplots
 import math
 from numbers import Number
 
+np = optional_imports.get_module('numpy')
 pd = optional_imports.get_module('pandas')
 
 TICK_COLOR = '#969696'
@@ -185,6 +186,26 @@ def _make_trace_for_scatter(trace, trace_type, color, **kwargs_marker):
     return trace
 
 
+def _grouped_columns(df, by, columns):
+    """
+    Returns the numpy arrays of columns for every group of df
+
+    df is grouped in a single pass by the column(s) in by. The result maps
+    each group key (a tuple if by is a list) to a dict of column names to
+    numpy arrays of the values of that group.
+    """
+    arrays = dict((c, df[c].values) for c in columns if c)
+    grouped = {}
+    for key, positions in df.groupby(by).indices.items():
+        grouped[key] = dict((c, arrays[c][positions]) for c in arrays)
+    return grouped
+
+
+def _facet_values(df, facet):
+    """Returns the sorted values of a facet, as ordered by groupby"""
+    return sorted(df[facet].dropna().unique())
+
+
 def _facet_grid_color_categorical(df, x, y, facet_row, facet_col, color_name,
                                   colormap, num_of_rows, num_of_cols,
                                   facet_row_labels, facet_col_labels,
@@ -198,34 +219,38 @@ def _facet_grid_color_categorical(df, x, y, facet_row, facet_col, color_name,
                         vertical_spacing=SUBPLOT_SPACING, print_grid=False)
 
     annotations = []
+    empty_group = dict((c, df[c].values[:0]) for c in [x, y] if c)
     if not facet_row and not facet_col:
-        color_groups = list(df.groupby(color_name))
-        for group in color_groups:
+        groups_by_color = _grouped_columns(df, color_name, [x, y])
+        for color_val in sorted(groups_by_color):
+            group = groups_by_color[color_val]
             trace = dict(
                 type=trace_type,
-                name=group[0],
+                name=color_val,
                 marker=dict(
-                    color=colormap[group[0]],
+                    color=colormap[color_val],
                 ),
                 **kwargs_trace
             )
             if x:
-                trace['x'] = group[1][x]
+                trace['x'] = group[x]
             if y:
-                trace['y'] = group[1][y]
+                trace['y'] = group[y]
             trace = _make_trace_for_scatter(
-                trace, trace_type, colormap[group[0]], **kwargs_marker
+                trace, trace_type, colormap[color_val], **kwargs_marker
             )
 
             fig.append_trace(trace, 1, 1)
 
     elif (facet_row and not facet_col) or (not facet_row and facet_col):
-        groups_by_facet = list(
-            df.groupby(facet_row if facet_row else facet_col)
-        )
-        for j, group in enumerate(groups_by_facet):
-            for color_val in df[color_name].unique():
-                data_by_color = group[1][group[1][color_name] == color_val]
+        facet = facet_row if facet_row else facet_col
+        groups_by_facet_color = _grouped_columns(df, [facet, color_name],
+                                                 [x, y])
+        color_vals = df[color_name].unique()
+        for j, facet_val in enumerate(_facet_values(df, facet)):
+            for color_val in color_vals:
+                group = groups_by_facet_color.get((facet_val, color_val),
+                                                  empty_group)
                 trace = dict(
                     type=trace_type,
                     name=color_val,
@@ -235,9 +260,9 @@ def _facet_grid_color_categorical(df, x, y, facet_row, facet_col, color_name,
                     **kwargs_trace
                 )
                 if x:
-                    trace['x'] = data_by_color[x]
+                    trace['x'] = group[x]
                 if y:
-                    trace['y'] = data_by_color[y]
+                    trace['y'] = group[y]
                 trace = _make_trace_for_scatter(
                     trace, trace_type, colormap[color_val], **kwargs_marker
                 )
@@ -247,9 +272,9 @@ def _facet_grid_color_categorical(df, x, y, facet_row, facet_col, color_name,
                                  1 if facet_row else j + 1)
 
             label = _return_label(
-                group[0],
+                facet_val,
                 facet_row_labels if facet_row else facet_col_labels,
-                facet_row if facet_row else facet_col
+                facet
             )
 
             annotations.append(
@@ -263,47 +288,35 @@ def _facet_grid_color_categorical(df, x, y, facet_row, facet_col, color_name,
             )
 
     elif facet_row and facet_col:
-        groups_by_facets = list(df.groupby([facet_row, facet_col]))
-        tuple_to_facet_group = {item[0]: item[1] for
-                                item in groups_by_facets}
+        groups_by_facets_color = _grouped_columns(
+            df, [facet_row, facet_col, color_name], [x, y]
+        )
+        facet_cells = set(key[:2] for key in groups_by_facets_color)
 
         row_values = df[facet_row].unique()
         col_values = df[facet_col].unique()
         color_vals = df[color_name].unique()
         for row_count, x_val in enumerate(row_values):
             for col_count, y_val in enumerate(col_values):
-                try:
-                    group = tuple_to_facet_group[(x_val, y_val)]
-                except KeyError:
-                    group = pd.DataFrame([[None, None, None]],
-                                         columns=[x, y, color_name])
-
                 for color_val in color_vals:
-                    if group.values.tolist() != [[None, None, None]]:
-                        group_filtered = group[group[color_name] == color_val]
-
-                        trace = dict(
-                            type=trace_type,
-                            name=color_val,
-                            marker=dict(
-                                color=colormap[color_val],
-                            ),
-                            **kwargs_trace
+                    trace = dict(
+                        type=trace_type,
+                        name=color_val,
+                        marker=dict(
+                            color=colormap[color_val],
+                        ),
+                        **kwargs_trace
+                    )
+                    if (x_val, y_val) in facet_cells:
+                        group = groups_by_facets_color.get(
+                            (x_val, y_val, color_val), empty_group
                         )
-                        new_x = group_filtered[x]
-                        new_y = group_filtered[y]
+                        new_x = group.get(x)
+                        new_y = group.get(y)
                     else:
-                        trace = dict(
-                            type=trace_type,
-                            name=color_val,
-                            marker=dict(
-                                color=colormap[color_val],
-                            ),
-                            showlegend=False,
-                            **kwargs_trace
-                        )
-                        new_x = group[x]
-                        new_y = group[y]
+                        trace['showlegend'] = False
+                        new_x = [None]
+                        new_y = [None]
 
                     if x:
                         trace['x'] = new_x
@@ -349,34 +362,35 @@ def _facet_grid_color_numerical(df, x, y, facet_row, facet_col, color_name,
 
     annotations = []
     if not facet_row and not facet_col:
+        color_vals = df[color_name].values
         trace = dict(
             type=trace_type,
             marker=dict(
-                color=df[color_name],
+                color=color_vals,
                 colorscale=colormap,
                 showscale=True,
             ),
             **kwargs_trace
         )
         if x:
-            trace['x'] = df[x]
+            trace['x'] = df[x].values
         if y:
-            trace['y'] = df[y]
+            trace['y'] = df[y].values
         trace = _make_trace_for_scatter(
-            trace, trace_type, df[color_name], **kwargs_marker
+            trace, trace_type, color_vals, **kwargs_marker
         )
 
         fig.append_trace(trace, 1, 1)
 
     if (facet_row and not facet_col) or (not facet_row and facet_col):
-        groups_by_facet = list(
-            df.groupby(facet_row if facet_row else facet_col)
-        )
-        for j, group in enumerate(groups_by_facet):
+        facet = facet_row if facet_row else facet_col
+        groups_by_facet = _grouped_columns(df, facet, [x, y, color_name])
+        for j, facet_val in enumerate(_facet_values(df, facet)):
+            group = groups_by_facet[facet_val]
             trace = dict(
                 type=trace_type,
                 marker=dict(
-                    color=df[color_name],
+                    color=group[color_name],
                     colorscale=colormap,
                     showscale=True,
                     colorbar=dict(x=1.15),
@@ -384,11 +398,11 @@ def _facet_grid_color_numerical(df, x, y, facet_row, facet_col, color_name,
                 **kwargs_trace
             )
             if x:
-                trace['x'] = group[1][x]
+                trace['x'] = group[x]
             if y:
-                trace['y'] = group[1][y]
+                trace['y'] = group[y]
             trace = _make_trace_for_scatter(
-                trace, trace_type, df[color_name], **kwargs_marker
+                trace, trace_type, group[color_name], **kwargs_marker
             )
 
             fig.append_trace(
@@ -398,9 +412,7 @@ def _facet_grid_color_numerical(df, x, y, facet_row, facet_col, color_name,
             )
 
             labels = facet_row_labels if facet_row else facet_col_labels
-            label = _return_label(
-                group[0], labels, facet_row if facet_row else facet_col
-            )
+            label = _return_label(facet_val, labels, facet)
 
             annotations.append(
                 _annotation_dict(
@@ -413,45 +425,41 @@ def _facet_grid_color_numerical(df, x, y, facet_row, facet_col, color_name,
             )
 
     elif facet_row and facet_col:
-        groups_by_facets = list(df.groupby([facet_row, facet_col]))
-        tuple_to_facet_group = {item[0]: item[1] for
-                                item in groups_by_facets}
+        groups_by_facets = _grouped_columns(df, [facet_row, facet_col],
+                                            [x, y, color_name])
 
         row_values = df[facet_row].unique()
         col_values = df[facet_col].unique()
         for row_count, x_val in enumerate(row_values):
             for col_count, y_val in enumerate(col_values):
-                try:
-                    group = tuple_to_facet_group[(x_val, y_val)]
-                except KeyError:
-                    group = pd.DataFrame([[None, None, None]],
-                                         columns=[x, y, color_name])
-
-                if group.values.tolist() != [[None, None, None]]:
+                group = groups_by_facets.get((x_val, y_val))
+                if group is not None:
                     trace = dict(
                         type=trace_type,
                         marker=dict(
-                            color=df[color_name],
+                            color=group[color_name],
                             colorscale=colormap,
                             showscale=(row_count == 0),
                             colorbar=dict(x=1.15),
                         ),
                         **kwargs_trace
                     )
-
+                    marker_colors = group[color_name]
                 else:
                     trace = dict(
                         type=trace_type,
                         showlegend=False,
                         **kwargs_trace
                     )
+                    group = dict((c, [None]) for c in [x, y])
+                    marker_colors = None
 
                 if x:
                     trace['x'] = group[x]
                 if y:
                     trace['y'] = group[y]
                 trace = _make_trace_for_scatter(
-                    trace, trace_type, df[color_name], **kwargs_marker
+                    trace, trace_type, marker_colors, **kwargs_marker
                 )
 
                 fig.append_trace(trace, row_count + 1, col_count + 1)
@@ -495,9 +503,9 @@ def _facet_grid(df, x, y, facet_row, facet_col, num_of_rows,
         )
 
         if x:
-            trace['x'] = df[x]
+            trace['x'] = df[x].values
         if y:
-            trace['y'] = df[y]
+            trace['y'] = df[y].values
         trace = _make_trace_for_scatter(
             trace, trace_type, marker_color, **kwargs_marker
         )
@@ -505,10 +513,10 @@ def _facet_grid(df, x, y, facet_row, facet_col, num_of_rows,
         fig.append_trace(trace, 1, 1)
 
     elif (facet_row and not facet_col) or (not facet_row and facet_col):
-        groups_by_facet = list(
-            df.groupby(facet_row if facet_row else facet_col)
-        )
-        for j, group in enumerate(groups_by_facet):
+        facet = facet_row if facet_row else facet_col
+        groups_by_facet = _grouped_columns(df, facet, [x, y])
+        for j, facet_val in enumerate(_facet_values(df, facet)):
+            group = groups_by_facet[facet_val]
             trace = dict(
                 type=trace_type,
                 marker=dict(
@@ -519,9 +527,9 @@ def _facet_grid(df, x, y, facet_row, facet_col, num_of_rows,
             )
 
             if x:
-                trace['x'] = group[1][x]
+                trace['x'] = group[x]
             if y:
-                trace['y'] = group[1][y]
+                trace['y'] = group[y]
             trace = _make_trace_for_scatter(
                 trace, trace_type, marker_color, **kwargs_marker
             )
@@ -531,9 +539,9 @@ def _facet_grid(df, x, y, facet_row, facet_col, num_of_rows,
                              1 if facet_row else j + 1)
 
             label = _return_label(
-                group[0],
+                facet_val,
                 facet_row_labels if facet_row else facet_col_labels,
-                facet_row if facet_row else facet_col
+                facet
             )
 
             annotations.append(
@@ -548,18 +556,15 @@ def _facet_grid(df, x, y, facet_row, facet_col, num_of_rows,
             )
 
     elif facet_row and facet_col:
-        groups_by_facets = list(df.groupby([facet_row, facet_col]))
-        tuple_to_facet_group = {item[0]: item[1] for
-                                item in groups_by_facets}
+        groups_by_facets = _grouped_columns(df, [facet_row, facet_col],
+                                            [x, y])
+        missing_group = dict((c, [None]) for c in [x, y])
 
         row_values = df[facet_row].unique()
         col_values = df[facet_col].unique()
         for row_count, x_val in enumerate(row_values):
             for col_count, y_val in enumerate(col_values):
-                try:
-                    group = tuple_to_facet_group[(x_val, y_val)]
-                except KeyError:
-                    group = pd.DataFrame([[None, None]], columns=[x, y])
+                group = groups_by_facets.get((x_val, y_val), missing_group)
                 trace = dict(
                     type=trace_type,
                     marker=dict(
@@ -1048,9 +1053,15 @@ def create_facet_grid(df, x=None, y=None, facet_row=None, facet_col=None,
         min_ranges = []
         max_ranges = []
         for trace in fig['data']:
-            if trace[x_y] is not None and len(trace[x_y]) > 0:
-                min_ranges.append(min(trace[x_y]))
-                max_ranges.append(max(trace[x_y]))
+            values = trace[x_y]
+            if values is None or len(values) == 0:
+                continue
+            if isinstance(values, np.ndarray) and values.dtype.kind in 'iuf':
+                min_ranges.append(np.nanmin(values))
+                max_ranges.append(np.nanmax(values))
+            else:
+                min_ranges.append(min(values))
+                max_ranges.append(max(values))
         while None in min_ranges:
             min_ranges.remove(None)
         while None in max_ranges:
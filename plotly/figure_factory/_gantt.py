@@ -3,9 +3,11 @@ from __future__ import absolute_import
 from numbers import Number
 
 from plotly import exceptions, optional_imports
+from plotly.colors import sample_colorscale
 from plotly.figure_factory import utils
 from plotly.graph_objs import graph_objs
 
+np = optional_imports.get_module('numpy')
 pd = optional_imports.get_module('pandas')
 
 REQUIRED_GANTT_KEYS = ['Task', 'Start', 'Finish']
@@ -25,15 +27,7 @@ def validate_gantt(df):
                         ', '.join(REQUIRED_GANTT_KEYS))
                 )
 
-        num_of_rows = len(df.index)
-        chart = []
-        for index in range(num_of_rows):
-            task_dict = {}
-            for key in df:
-                task_dict[key] = df.ix[index][key]
-            chart.append(task_dict)
-
-        return chart
+        return df.to_dict('records')
 
     # validate if df is a list
     if not isinstance(df, list):
@@ -50,8 +44,104 @@ def validate_gantt(df):
     return df
 
 
+def _task_rows(tasks, task_names, group_tasks):
+    """
+    Fills task_names and returns a dict mapping each task name to its row
+
+    A task name is added to task_names for every task if group_tasks is
+    False, or only the first time it is seen if group_tasks is True. For
+    grouped tasks the list is reversed so that the tasks that are inserted
+    first are shown at the top.
+
+    :rtype (dict) task_rows: the y value of the first row for each task name
+    """
+    seen = set(task_names)
+    for task in tasks:
+        tn = task['name']
+        if not group_tasks or tn not in seen:
+            task_names.append(tn)
+            seen.add(tn)
+    if group_tasks:
+        task_names.reverse()
+
+    task_rows = {}
+    for row, tn in enumerate(task_names):
+        task_rows.setdefault(tn, row)
+    return task_rows
+
+
+def _gantt_fill_traces(shapes, entries):
+    """
+    Collapses the task shapes and their hover entries into a few traces
+
+    Rectangles sharing a fill color are drawn by a single scatter trace
+    filled 'toself', with the corners of consecutive rectangles separated
+    by None, and the hover entries of all tasks are merged into a single
+    marker trace.
+
+    :rtype (list[dict]) traces: one filled scatter trace per fill color, in
+        order of first appearance, followed by the hover trace
+    """
+    num_tasks = len(shapes)
+    x0 = np.empty(num_tasks, dtype=object)
+    x0[:] = [shape['x0'] for shape in shapes]
+    x1 = np.empty(num_tasks, dtype=object)
+    x1[:] = [shape['x1'] for shape in shapes]
+    y0 = np.array([shape['y0'] for shape in shapes], dtype=float)
+    y1 = np.array([shape['y1'] for shape in shapes], dtype=float)
+
+    corners_x = np.empty((num_tasks, 6), dtype=object)
+    corners_x[:, 0] = corners_x[:, 3] = corners_x[:, 4] = x0
+    corners_x[:, 1] = corners_x[:, 2] = x1
+    corners_x[:, 5] = None
+    corners_y = np.empty((num_tasks, 6))
+    corners_y[:, 0] = corners_y[:, 1] = corners_y[:, 4] = y0
+    corners_y[:, 2] = corners_y[:, 3] = y1
+    corners_y[:, 5] = np.nan
+
+    fillcolors = np.array([shape['fillcolor'] for shape in shapes])
+    color_names, first_index, color_index = np.unique(
+        fillcolors, return_index=True, return_inverse=True
+    )
+    order = np.argsort(color_index, kind='mergesort')
+    bounds = np.searchsorted(color_index[order],
+                             np.arange(len(color_names) + 1))
+
+    traces = []
+    for k in np.argsort(first_index):
+        rows = order[bounds[k]:bounds[k + 1]]
+        traces.append(
+            dict(type='scatter',
+                 x=corners_x[rows].ravel()[:-1],
+                 y=corners_y[rows].ravel()[:-1],
+                 mode='lines',
+                 fill='toself',
+                 fillcolor=color_names[k],
+                 line={'width': 0},
+                 hoverinfo='skip',
+                 showlegend=False,
+                 name='')
+        )
+
+    hover = dict(type='scatter',
+                 x=np.column_stack([x0, x1]).ravel(),
+                 y=np.repeat([entry['y'][0] for entry in entries], 2),
+                 mode='markers',
+                 showlegend=False,
+                 name='',
+                 marker={'color': 'white'})
+    if any('text' in entry for entry in entries):
+        hover['text'] = np.repeat(
+            np.array([entry.get('text') for entry in entries], dtype=object),
+            2
+        )
+    traces.append(hover)
+    return traces
+
+
 def gantt(chart, colors, title, bar_width, showgrid_x, showgrid_y, height,
-          width, tasks=None, task_names=None, data=None, group_tasks=False):
+          width, tasks=None, task_names=None, data=None, group_tasks=False,
+          use_scatter_fill=False):
     """
     Refer to create_gantt() for docstring
     """
@@ -61,6 +151,7 @@ def gantt(chart, colors, title, bar_width, showgrid_x, showgrid_y, height,
         task_names = []
     if data is None:
         data = []
+    num_entries = len(data)
 
     for index in range(len(chart)):
         task = dict(x0=chart[index]['Start'],
@@ -80,17 +171,7 @@ def gantt(chart, colors, title, bar_width, showgrid_x, showgrid_y, height,
         }
     }
     # create the list of task names
-    for index in range(len(tasks)):
-        tn = tasks[index]['name']
-        # Is added to task_names if group_tasks is set to False,
-        # or if the option is used (True) it only adds them if the
-        # name is not already in the list
-        if not group_tasks or tn not in task_names:
-            task_names.append(tn)
-    # Guarantees that for grouped tasks the tasks that are inserted first
-    # are shown at the top
-    if group_tasks:
-        task_names.reverse()
+    task_rows = _task_rows(tasks, task_names, group_tasks)
 
     color_index = 0
     for index in range(len(tasks)):
@@ -102,7 +183,7 @@ def gantt(chart, colors, title, bar_width, showgrid_x, showgrid_y, height,
         # to the same row.
         groupID = index
         if group_tasks:
-            groupID = task_names.index(tn)
+            groupID = task_rows[tn]
         tasks[index]['y0'] = groupID - bar_width
         tasks[index]['y1'] = groupID + bar_width
 
@@ -169,6 +250,11 @@ def gantt(chart, colors, title, bar_width, showgrid_x, showgrid_y, height,
             type='date'
         )
     )
+    if use_scatter_fill:
+        data[num_entries:num_entries + len(tasks)] = _gantt_fill_traces(
+            tasks, data[num_entries:num_entries + len(tasks)]
+        )
+        tasks = []
     layout['shapes'] = tasks
 
     fig = graph_objs.Figure(data=data, layout=layout)
@@ -177,7 +263,8 @@ def gantt(chart, colors, title, bar_width, showgrid_x, showgrid_y, height,
 
 def gantt_colorscale(chart, colors, title, index_col, show_colorbar, bar_width,
                      showgrid_x, showgrid_y, height, width, tasks=None,
-                     task_names=None, data=None, group_tasks=False):
+                     task_names=None, data=None, group_tasks=False,
+                     use_scatter_fill=False):
     """
     Refer to FigureFactory.create_gantt() for docstring
     """
@@ -187,6 +274,7 @@ def gantt_colorscale(chart, colors, title, index_col, show_colorbar, bar_width,
         task_names = []
     if data is None:
         data = []
+    num_entries = len(data)
     showlegend = False
 
     for index in range(len(chart)):
@@ -219,17 +307,28 @@ def gantt_colorscale(chart, colors, title, index_col, show_colorbar, bar_width,
             )
 
         # create the list of task names
-        for index in range(len(tasks)):
-            tn = tasks[index]['name']
-            # Is added to task_names if group_tasks is set to False,
-            # or if the option is used (True) it only adds them if the
-            # name is not already in the list
-            if not group_tasks or tn not in task_names:
-                task_names.append(tn)
-        # Guarantees that for grouped tasks the tasks that are inserted
-        # first are shown at the top
-        if group_tasks:
-            task_names.reverse()
+        task_rows = _task_rows(tasks, task_names, group_tasks)
+
+        # relabel colors with 'rgb' float components
+        colors = utils.color_parser(colors, utils.unlabel_rgb)
+        colors = utils.color_parser(colors, utils.label_rgb)
+
+        # sample the fill colors of all tasks from the colormap in one pass.
+        # sample_colorscale clamps to the colormap, so index values outside
+        # of 0-100 keep extrapolating the two colors
+        task_values = [chart[index][index_col] for index in range(len(tasks))]
+        if np is not None and all(0 <= value <= 100 for value in task_values):
+            fill_colors = sample_colorscale(colors[:2], task_values, low=0,
+                                            high=100, colortype='float')
+            fill_colors = fill_colors.tolist()
+        else:
+            lowcolor = utils.unlabel_rgb(colors[0])
+            highcolor = utils.unlabel_rgb(colors[1])
+            fill_colors = [
+                utils.find_intermediate_color(lowcolor, highcolor,
+                                              value / 100.0)
+                for value in task_values
+            ]
 
         for index in range(len(tasks)):
             tn = tasks[index]['name']
@@ -240,25 +339,11 @@ def gantt_colorscale(chart, colors, title, index_col, show_colorbar, bar_width,
             # to the same row.
             groupID = index
             if group_tasks:
-                groupID = task_names.index(tn)
+                groupID = task_rows[tn]
             tasks[index]['y0'] = groupID - bar_width
             tasks[index]['y1'] = groupID + bar_width
 
-            # unlabel color
-            colors = utils.color_parser(colors, utils.unlabel_rgb)
-            lowcolor = colors[0]
-            highcolor = colors[1]
-
-            intermed = (chart[index][index_col]) / 100.0
-            intermed_color = utils.find_intermediate_color(
-                lowcolor, highcolor, intermed
-            )
-            intermed_color = utils.color_parser(
-                intermed_color, utils.label_rgb
-            )
-            tasks[index]['fillcolor'] = intermed_color
-            # relabel colors with 'rgb'
-            colors = utils.color_parser(colors, utils.label_rgb)
+            tasks[index]['fillcolor'] = utils.label_rgb(fill_colors[index])
 
             # add a line for hover text and autorange
             entry = dict(
@@ -313,17 +398,7 @@ def gantt_colorscale(chart, colors, title, index_col, show_colorbar, bar_width,
             c_index += 1
 
         # create the list of task names
-        for index in range(len(tasks)):
-            tn = tasks[index]['name']
-            # Is added to task_names if group_tasks is set to False,
-            # or if the option is used (True) it only adds them if the
-            # name is not already in the list
-            if not group_tasks or tn not in task_names:
-                task_names.append(tn)
-        # Guarantees that for grouped tasks the tasks that are inserted
-        # first are shown at the top
-        if group_tasks:
-            task_names.reverse()
+        task_rows = _task_rows(tasks, task_names, group_tasks)
 
         for index in range(len(tasks)):
             tn = tasks[index]['name']
@@ -333,7 +408,7 @@ def gantt_colorscale(chart, colors, title, index_col, show_colorbar, bar_width,
             # to the same row.
             groupID = index
             if group_tasks:
-                groupID = task_names.index(tn)
+                groupID = task_rows[tn]
             tasks[index]['y0'] = groupID - bar_width
             tasks[index]['y1'] = groupID + bar_width
 
@@ -417,6 +492,11 @@ def gantt_colorscale(chart, colors, title, index_col, show_colorbar, bar_width,
             type='date'
         )
     )
+    if use_scatter_fill:
+        data[num_entries:num_entries + len(tasks)] = _gantt_fill_traces(
+            tasks, data[num_entries:num_entries + len(tasks)]
+        )
+        tasks = []
     layout['shapes'] = tasks
 
     fig = dict(data=data, layout=layout)
@@ -425,7 +505,8 @@ def gantt_colorscale(chart, colors, title, index_col, show_colorbar, bar_width,
 
 def gantt_dict(chart, colors, title, index_col, show_colorbar, bar_width,
                showgrid_x, showgrid_y, height, width, tasks=None,
-               task_names=None, data=None, group_tasks=False):
+               task_names=None, data=None, group_tasks=False,
+               use_scatter_fill=False):
     """
     Refer to FigureFactory.create_gantt() for docstring
     """
@@ -435,6 +516,7 @@ def gantt_dict(chart, colors, title, index_col, show_colorbar, bar_width,
         task_names = []
     if data is None:
         data = []
+    num_entries = len(data)
     showlegend = False
 
     for index in range(len(chart)):
@@ -471,17 +553,7 @@ def gantt_dict(chart, colors, title, index_col, show_colorbar, bar_width,
             )
 
     # create the list of task names
-    for index in range(len(tasks)):
-        tn = tasks[index]['name']
-        # Is added to task_names if group_tasks is set to False,
-        # or if the option is used (True) it only adds them if the
-        # name is not already in the list
-        if not group_tasks or tn not in task_names:
-            task_names.append(tn)
-    # Guarantees that for grouped tasks the tasks that are inserted first
-    # are shown at the top
-    if group_tasks:
-        task_names.reverse()
+    task_rows = _task_rows(tasks, task_names, group_tasks)
 
     for index in range(len(tasks)):
         tn = tasks[index]['name']
@@ -492,7 +564,7 @@ def gantt_dict(chart, colors, title, index_col, show_colorbar, bar_width,
         # to the same row.
         groupID = index
         if group_tasks:
-            groupID = task_names.index(tn)
+            groupID = task_rows[tn]
         tasks[index]['y0'] = groupID - bar_width
         tasks[index]['y1'] = groupID + bar_width
 
@@ -575,6 +647,11 @@ def gantt_dict(chart, colors, title, index_col, show_colorbar, bar_width,
             type='date'
         )
     )
+    if use_scatter_fill:
+        data[num_entries:num_entries + len(tasks)] = _gantt_fill_traces(
+            tasks, data[num_entries:num_entries + len(tasks)]
+        )
+        tasks = []
     layout['shapes'] = tasks
 
     fig = dict(data=data, layout=layout)
@@ -584,7 +661,8 @@ def gantt_dict(chart, colors, title, index_col, show_colorbar, bar_width,
 def create_gantt(df, colors=None, index_col=None, show_colorbar=False,
                  reverse_colors=False, title='Gantt Chart', bar_width=0.2,
                  showgrid_x=False, showgrid_y=False, height=600, width=900,
-                 tasks=None, task_names=None, data=None, group_tasks=False):
+                 tasks=None, task_names=None, data=None, group_tasks=False,
+                 use_scatter_fill=False):
     """
     Returns figure for a gantt chart
 
@@ -614,6 +692,13 @@ def create_gantt(df, colors=None, index_col=None, show_colorbar=False,
     :param (bool) showgrid_y: show/hide the y-axis grid
     :param (float) height: the height of the chart
     :param (float) width: the width of the chart
+    :param (bool) group_tasks: if True, all tasks with the same name are
+        drawn on the same row
+    :param (bool) use_scatter_fill: if True, the task bars are drawn by one
+        filled scatter trace per bar color, with all hover points merged in
+        a single marker trace, instead of one layout shape and one scatter
+        trace per task. This keeps charts with thousands of tasks fast to
+        build and to render. Default = False
 
     Example 1: Simple Gantt Chart
     ```
@@ -760,7 +845,7 @@ def create_gantt(df, colors=None, index_col=None, show_colorbar=False,
         fig = gantt(
             chart, colors, title, bar_width, showgrid_x, showgrid_y,
             height, width, tasks=None, task_names=None, data=None,
-            group_tasks=group_tasks
+            group_tasks=group_tasks, use_scatter_fill=use_scatter_fill
         )
         return fig
     else:
@@ -768,13 +853,15 @@ def create_gantt(df, colors=None, index_col=None, show_colorbar=False,
             fig = gantt_colorscale(
                 chart, colors, title, index_col, show_colorbar, bar_width,
                 showgrid_x, showgrid_y, height, width,
-                tasks=None, task_names=None, data=None, group_tasks=group_tasks
+                tasks=None, task_names=None, data=None,
+                group_tasks=group_tasks, use_scatter_fill=use_scatter_fill
             )
             return fig
         else:
             fig = gantt_dict(
                 chart, colors, title, index_col, show_colorbar, bar_width,
                 showgrid_x, showgrid_y, height, width,
-                tasks=None, task_names=None, data=None, group_tasks=group_tasks
+                tasks=None, task_names=None, data=None,
+                group_tasks=group_tasks, use_scatter_fill=use_scatter_fill
             )
             return fig
@@ -1,14 +1,85 @@
 from __future__ import absolute_import
 
-from plotly import exceptions
+import datetime
+
+from plotly import exceptions, optional_imports
 from plotly.graph_objs import graph_objs
 from plotly.figure_factory import utils
 
+# Optional imports, may be None for users that only use our core functionality.
+np = optional_imports.get_module('numpy')
 
 # Default colours for finance charts
 _DEFAULT_INCREASING_COLOR = '#3D9970'  # http://clrs.cc
 _DEFAULT_DECREASING_COLOR = '#FF4136'
 
+# Hovertext of the seven points drawing an ohlc stick
+_OHLC_TEXT = ("Open", "Open", "High", "Low", "Close", "Close", '')
+
+
+def _ohlc_arrays(open, high, low, close):
+    """
+    Converts the open, high, low and close values to float arrays
+
+    :rtype (list[ndarray]|None) arrays: open, high, low and close as 1D float
+        arrays (missing values become nan), or None if numpy is not
+        installed or the values can not be converted
+    """
+    if not np:
+        return None
+    try:
+        arrays = [np.asarray(values, dtype=float)
+                  for values in (open, high, low, close)]
+    except (TypeError, ValueError):
+        return None
+    if any(array.ndim != 1 for array in arrays):
+        return None
+    return arrays
+
+
+def _gap_array(rows):
+    """
+    Flattens rows of ohlc points into one array
+
+    :param (ndarray) rows: (n, 7) float or datetime64 array, the last
+        column of which is nan (or NaT) and separates consecutive ohlc
+        sticks
+    :rtype (ndarray) flat: 1D float or datetime64 array with nan (or NaT)
+        as every seventh value, which plotly.js draws as a gap
+    """
+    return rows.ravel()
+
+
+def _dates_array(dates, length):
+    """
+    Converts the dates of an ohlc or candlestick chart to an array
+
+    Datetime values are converted to datetime64[us], so that they serialize
+    to the same strings as datetime objects.
+
+    :rtype (ndarray|None) x: integer positions if dates is None, numeric or
+        datetime64 dates otherwise, or None if the dates can not be
+        converted (e.g. timezone aware datetimes)
+    """
+    if dates is None:
+        return np.arange(length)
+    x = np.asarray(dates)
+    if x.ndim != 1:
+        return None
+    if x.dtype.kind == 'O':
+        if not len(x) or not isinstance(x[0], datetime.datetime) or \
+                getattr(x[0], 'tzinfo', None) is not None:
+            return None
+        try:
+            x = x.astype('datetime64[us]')
+        except (TypeError, ValueError):
+            return None
+    if x.dtype.kind == 'M':
+        return x.astype('datetime64[us]')
+    if x.dtype.kind in 'iuf':
+        return x
+    return None
+
 
 def validate_ohlc(open, high, low, close, direction, **kwargs):
     """
@@ -26,25 +97,39 @@ def validate_ohlc(open, high, low, close, direction, **kwargs):
         unit.
     :raises: (PlotlyError) If direction is not 'increasing' or 'decreasing'
     """
-    for lst in [open, low, close]:
-        for index in range(len(high)):
-            if high[index] < lst[index]:
-                raise exceptions.PlotlyError("Oops! Looks like some of "
-                                             "your high values are less "
-                                             "the corresponding open, "
-                                             "low, or close values. "
-                                             "Double check that your data "
-                                             "is entered in O-H-L-C order")
-
-    for lst in [open, high, close]:
-        for index in range(len(low)):
-            if low[index] > lst[index]:
-                raise exceptions.PlotlyError("Oops! Looks like some of "
-                                             "your low values are greater "
-                                             "than the corresponding high"
-                                             ", open, or close values. "
-                                             "Double check that your data "
-                                             "is entered in O-H-L-C order")
+    arrays = _ohlc_arrays(open, high, low, close)
+    if arrays is not None:
+        open_values, high_values, low_values, close_values = arrays
+        with np.errstate(invalid='ignore'):
+            high_invalid = np.any((high_values < open_values) |
+                                  (high_values < low_values) |
+                                  (high_values < close_values))
+            low_invalid = np.any((low_values > open_values) |
+                                 (low_values > high_values) |
+                                 (low_values > close_values))
+    else:
+        high_invalid = any(high[index] < lst[index]
+                           for lst in [open, low, close]
+                           for index in range(len(high)))
+        low_invalid = any(low[index] > lst[index]
+                          for lst in [open, high, close]
+                          for index in range(len(low)))
+
+    if high_invalid:
+        raise exceptions.PlotlyError("Oops! Looks like some of "
+                                     "your high values are less "
+                                     "the corresponding open, "
+                                     "low, or close values. "
+                                     "Double check that your data "
+                                     "is entered in O-H-L-C order")
+
+    if low_invalid:
+        raise exceptions.PlotlyError("Oops! Looks like some of "
+                                     "your low values are greater "
+                                     "than the corresponding high"
+                                     ", open, or close values. "
+                                     "Double check that your data "
+                                     "is entered in O-H-L-C order")
 
     direction_opts = ('increasing', 'decreasing', 'both')
     if direction not in direction_opts:
@@ -303,8 +388,50 @@ class _OHLC(object):
         self.increase_y = []
         self.decrease_x = []
         self.decrease_y = []
-        self.get_all_xy()
-        self.separate_increase_decrease()
+
+        arrays = _ohlc_arrays(open, high, low, close)
+        x = _dates_array(dates, len(open)) if arrays is not None else None
+        if x is not None:
+            self.get_all_xy_arrays(arrays, x)
+        else:
+            self.get_all_xy()
+            self.separate_increase_decrease()
+
+    def get_all_xy_arrays(self, arrays, x):
+        """
+        Build the OHLC shapes and separate them with numpy
+
+        Each row of all_x and all_y holds the seven points of one OHLC
+        shape, the last of which is the gap between consecutive shapes.
+        Rows whose close value is missing are neither increasing nor
+        decreasing.
+        """
+        open_values, high_values, low_values, close_values = arrays
+        if self.dates is not None:
+            branch = np.diff(x).min() / 5
+        else:
+            branch = .2
+        if x.dtype.kind == 'M':
+            self.all_x = np.empty((len(x), 7), dtype=x.dtype)
+            self.all_x[:, 6] = np.datetime64('NaT')
+        else:
+            self.all_x = np.empty((len(x), 7))
+            self.all_x[:, 6] = np.nan
+        self.all_x[:, 0] = x - branch
+        self.all_x[:, 1:5] = x[:, None]
+        self.all_x[:, 5] = x + branch
+
+        self.all_y = np.column_stack([open_values, open_values, high_values,
+                                      low_values, close_values, close_values,
+                                      np.full(len(x), np.nan)])
+
+        with np.errstate(invalid='ignore'):
+            increase = close_values > open_values
+        decrease = ~increase & ~np.isnan(close_values)
+        self.increase_x = self.all_x[increase]
+        self.increase_y = self.all_y[increase]
+        self.decrease_x = self.all_x[decrease]
+        self.decrease_y = self.all_y[decrease]
 
     def get_all_xy(self):
         """
@@ -355,11 +482,14 @@ class _OHLC(object):
             trace, flat_increase_y: y=values for the increasing trace and
             text_increase: hovertext for the increasing trace
         """
-        flat_increase_x = utils.flatten(self.increase_x)
-        flat_increase_y = utils.flatten(self.increase_y)
-        text_increase = (("Open", "Open", "High",
-                          "Low", "Close", "Close", '')
-                         * (len(self.increase_x)))
+        if np and isinstance(self.increase_x, np.ndarray):
+            flat_increase_x = _gap_array(self.increase_x)
+            flat_increase_y = _gap_array(self.increase_y)
+            text_increase = np.tile(_OHLC_TEXT, len(self.increase_x))
+        else:
+            flat_increase_x = utils.flatten(self.increase_x)
+            flat_increase_y = utils.flatten(self.increase_y)
+            text_increase = _OHLC_TEXT * len(self.increase_x)
 
         return flat_increase_x, flat_increase_y, text_increase
 
@@ -371,10 +501,13 @@ class _OHLC(object):
             trace, flat_decrease_y: y=values for the decreasing trace and
             text_decrease: hovertext for the decreasing trace
         """
-        flat_decrease_x = utils.flatten(self.decrease_x)
-        flat_decrease_y = utils.flatten(self.decrease_y)
-        text_decrease = (("Open", "Open", "High",
-                          "Low", "Close", "Close", '')
-                         * (len(self.decrease_x)))
+        if np and isinstance(self.decrease_x, np.ndarray):
+            flat_decrease_x = _gap_array(self.decrease_x)
+            flat_decrease_y = _gap_array(self.decrease_y)
+            text_decrease = np.tile(_OHLC_TEXT, len(self.decrease_x))
+        else:
+            flat_decrease_x = utils.flatten(self.decrease_x)
+            flat_decrease_y = utils.flatten(self.decrease_y)
+            text_decrease = _OHLC_TEXT * len(self.decrease_x)
 
         return flat_decrease_x, flat_decrease_y, text_decrease
@@ -5,6 +5,7 @@ from plotly.figure_factory import utils
 from plotly.graph_objs import graph_objs
 from plotly.tools import make_subplots
 
+np = optional_imports.get_module('numpy')
 pd = optional_imports.get_module('pandas')
 
 DIAG_CHOICES = ['scatter', 'histogram', 'box']
@@ -366,6 +367,17 @@ def scatterplot_dict(dataframe, headers, diag, size,
         return fig
 
 
+def _sequential_theme(colormap, num_colors):
+    """
+    Returns num_colors 'rgb' colors evenly spread from the first to the
+    second color of a sequential colormap
+    """
+    theme = colors.sample_colorscale(colormap[:2],
+                                     np.linspace(0, 1, num_colors),
+                                     colortype='float')
+    return [colors.label_rgb(tuple(color)) for color in theme.tolist()]
+
+
 def scatterplot_theme(dataframe, headers, diag, size, height, width, title,
                       index, index_vals, endpts, colormap, colormap_type,
                       **kwargs):
@@ -386,9 +398,7 @@ def scatterplot_theme(dataframe, headers, diag, size, height, width, title,
 
         # Convert colormap to list of n RGB tuples
         if colormap_type == 'seq':
-            foo = colors.color_parser(colormap, colors.unlabel_rgb)
-            foo = utils.n_colors(foo[0], foo[1], n_colors_len)
-            theme = colors.color_parser(foo, colors.label_rgb)
+            theme = _sequential_theme(colormap, n_colors_len)
 
         if colormap_type == 'cat':
             # leave list of colors the same way
@@ -556,9 +566,7 @@ def scatterplot_theme(dataframe, headers, diag, size, height, width, title,
 
             # Convert colormap to list of n RGB tuples
             if colormap_type == 'seq':
-                foo = colors.color_parser(colormap, colors.unlabel_rgb)
-                foo = utils.n_colors(foo[0], foo[1], len(intervals))
-                theme = colors.color_parser(foo, colors.label_rgb)
+                theme = _sequential_theme(colormap, len(intervals))
 
             if colormap_type == 'cat':
                 # leave list of colors the same way
@@ -867,11 +875,147 @@ def scatterplot_theme(dataframe, headers, diag, size, height, width, title,
                 return fig
 
 
+def _splom_axis_domains(dim, spacing=0.02):
+    """
+    Returns the x and y axis domains of each dimension in a splom grid
+
+    Dimension i is laid out in the i-th column from the left and the i-th
+    row from the top.
+    """
+    step = 1. / dim
+    x_domains = [[i * step + spacing, (i + 1) * step - spacing]
+                 for i in range(dim)]
+    y_domains = [[1 - (i + 1) * step + spacing, 1 - i * step - spacing]
+                 for i in range(dim)]
+    return x_domains, y_domains
+
+
+def scatterplot_splom(df, headers, diag, size, height, width, title, index,
+                      endpts, colormap, colormap_type, **kwargs):
+    """
+    Refer to FigureFactory.create_scatterplotmatrix() for docstring
+
+    Returns fig for scatterplotmatrix drawn with Splom traces
+
+    The off-diagonal cells of every group of points are drawn by a single
+    Splom trace holding each dataframe column once, instead of one Scatter
+    trace per cell. Histogram and box diagonals are drawn on extra axes
+    overlaid on the diagonal cells.
+
+    """
+    dim = len(headers)
+    columns = [df[header].values for header in headers]
+    marker = dict(kwargs.pop('marker', {}), size=size)
+
+    # each group is a (name, positions, color) triple
+    showscale = False
+    if index is None:
+        groups = [(None, None, None)]
+    else:
+        index_vals = df[index].values
+        if isinstance(colormap, dict) or isinstance(index_vals[0], str):
+            names, codes = np.unique(index_vals, return_inverse=True)
+            names = names.tolist()
+        elif endpts:
+            intervals = utils.endpts_to_intervals(endpts)
+            names = [str(interval) for interval in intervals]
+            codes = np.searchsorted(endpts, index_vals)
+        else:
+            # color all points by their index value
+            theme = list(colormap)
+            if len(theme) <= 1:
+                theme.append(theme[0])
+            marker['color'] = index_vals
+            marker['colorscale'] = colors.make_colorscale(theme)
+            marker['showscale'] = True
+            showscale = True
+            names = None
+            groups = [(None, None, theme[0])]
+
+        if names is not None:
+            if isinstance(colormap, dict):
+                theme = [colormap[name] for name in names]
+            elif colormap_type == 'seq':
+                theme = _sequential_theme(colormap, len(names))
+            else:
+                theme = colormap
+
+            # positions of the points of every group, in a single pass
+            order = np.argsort(codes, kind='mergesort')
+            bounds = np.searchsorted(codes[order], np.arange(len(names) + 1))
+            groups = [(name, order[bounds[j]:bounds[j + 1]],
+                       theme[j % len(theme)])
+                      for j, name in enumerate(names)]
+
+    x_domains, y_domains = _splom_axis_domains(dim)
+    layout = dict(height=height, width=width, title=title,
+                  showlegend=index is not None and not showscale)
+    for i in range(dim):
+        layout['xaxis{}'.format(i + 1)] = dict(domain=x_domains[i],
+                                               title=headers[i])
+        layout['yaxis{}'.format(i + 1)] = dict(domain=y_domains[i],
+                                               title=headers[i])
+        if diag != 'scatter':
+            diag_axis = dim + i + 1
+            layout['xaxis{}'.format(diag_axis)] = dict(
+                domain=x_domains[i], anchor='y{}'.format(diag_axis),
+                showticklabels=diag != 'box'
+            )
+            layout['yaxis{}'.format(diag_axis)] = dict(
+                domain=y_domains[i], anchor='x{}'.format(diag_axis)
+            )
+    if diag == 'histogram' and len(groups) > 1:
+        layout['barmode'] = 'stack'
+
+    data = []
+    for name, positions, color in groups:
+        group_marker = dict(marker)
+        if color is not None and not showscale:
+            group_marker['color'] = color
+
+        if positions is None:
+            group_columns = columns
+        else:
+            group_columns = [column[positions] for column in columns]
+
+        data.append(graph_objs.Splom(
+            dimensions=[dict(label=header, values=column)
+                        for header, column in zip(headers, group_columns)],
+            diagonal=dict(visible=diag == 'scatter'),
+            marker=group_marker,
+            name=name,
+            legendgroup=name,
+            showlegend=name is not None,
+            **kwargs
+        ))
+
+        if diag == 'scatter':
+            continue
+        for i, column in enumerate(group_columns):
+            diag_axes = dict(xaxis='x{}'.format(dim + i + 1),
+                             yaxis='y{}'.format(dim + i + 1))
+            diag_marker = dict(color=color) if color is not None else None
+            if diag == 'histogram':
+                trace = graph_objs.Histogram(
+                    x=column, marker=diag_marker, name=name,
+                    legendgroup=name, showlegend=False, **diag_axes
+                )
+            else:
+                trace = graph_objs.Box(
+                    y=column, marker=diag_marker, name=name,
+                    legendgroup=name, showlegend=False, **diag_axes
+                )
+            data.append(trace)
+
+    return graph_objs.Figure(data=data, layout=layout)
+
+
 def create_scatterplotmatrix(df, index=None, endpts=None, diag='scatter',
                              height=500, width=500, size=6,
                              title='Scatterplot Matrix', colormap=None,
                              colormap_type='cat', dataframe=None,
-                             headers=None, index_vals=None, **kwargs):
+                             headers=None, index_vals=None, use_splom=False,
+                             **kwargs):
     """
     Returns data for a scatterplot matrix.
 
@@ -906,6 +1050,11 @@ def create_scatterplotmatrix(df, index=None, endpts=None, diag='scatter',
         If 'cat' is selected, a color from colormap will be assigned to
         each category from index, including the intervals if endpts is
         being used
+    :param (bool) use_splom: if True, the matrix is drawn with Splom
+        traces, which hold each column of df once per index group instead
+        of once per cell. This is much faster to build and much smaller to
+        serialize for dataframes with many columns or rows. In this case
+        **kwargs are passed to the Splom traces
     :param (dict) **kwargs: a dictionary of scatterplot arguments
         The only forbidden parameters are 'size', 'color' and
         'colorscale' in 'marker'
@@ -1083,6 +1232,30 @@ def create_scatterplotmatrix(df, index=None, endpts=None, diag='scatter',
     else:
         colormap = utils.validate_colors(colormap, 'rgb')
 
+    if use_splom:
+        if index and index not in df:
+            raise exceptions.PlotlyError("Make sure you set the index "
+                                         "input variable to one of the "
+                                         "column names of your "
+                                         "dataframe.")
+        headers = [name for name in df if name != index]
+        # only columns of mixed types need to be checked item by item
+        utils.validate_dataframe([df[name].values for name in headers
+                                  if df[name].dtype == object])
+        if index:
+            if df[index].dtype == object:
+                utils.validate_index(df[index].values)
+            if isinstance(colormap, dict):
+                if not all(name in colormap for name in df[index].unique()):
+                    raise exceptions.PlotlyError("If colormap is a "
+                                                 "dictionary, all the "
+                                                 "names in the index "
+                                                 "must be keys.")
+        return scatterplot_splom(
+            df, headers, diag, size, height, width, title, index or None,
+            endpts, colormap, colormap_type, **kwargs
+        )
+
     if not index:
         for name in df:
             headers.append(name)
@@ -204,30 +204,34 @@ class _Table(object):
         """
         Generate annotations to fill in table text
 
-        :rtype (list) annotations: list of annotations for each cell of the
-            table.
+        Annotations are returned as plain dicts so that they are validated
+        only once, when they are assigned to the figure layout.
+
+        :rtype (list[dict]) annotations: list of annotations for each cell of
+            the table.
         """
-        table_matrix = _Table.get_table_matrix(self)
         all_font_colors = _Table.get_table_font_color(self)
+        x = [m - self.annotation_offset for m in self.x]
         annotations = []
         for n, row in enumerate(self.table_text):
-            for m, val in enumerate(row):
-                # Bold text in header and index
-                format_text = ('<b>' + str(val) + '</b>' if n == 0 or
-                               self.index and m < 1 else str(val))
+            # Bold text in header and index
+            text = ['<b>' + str(val) + '</b>' if n == 0 else str(val)
+                    for val in row]
+            font_color = [all_font_colors[n]] * len(row)
+            if self.index and row:
+                text[0] = '<b>' + str(row[0]) + '</b>'
                 # Match font color of index to font color of header
-                font_color = (self.font_colors[0] if self.index and m == 0
-                              else all_font_colors[n])
-                annotations.append(
-                    graph_objs.layout.Annotation(
-                        text=format_text,
-                        x=self.x[m] - self.annotation_offset,
-                        y=self.y[n],
-                        xref='x1',
-                        yref='y1',
-                        align="left",
-                        xanchor="left",
-                        font=dict(color=font_color),
-                        showarrow=False)
-                )
+                font_color[0] = self.font_colors[0]
+            annotations.extend(
+                dict(text=text[m],
+                     x=x[m],
+                     y=self.y[n],
+                     xref='x1',
+                     yref='y1',
+                     align='left',
+                     xanchor='left',
+                     font=dict(color=font_color[m]),
+                     showarrow=False)
+                for m in range(len(row))
+            )
         return annotations
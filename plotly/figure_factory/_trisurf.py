@@ -72,9 +72,83 @@ def map_face2color(face, colormap, scale, vmin, vmax):
         return face_color
 
 
+def map_faces2color(faces, colormap, scale, vmin, vmax):
+    """
+    Normalize an array of facecolor values and return rgb-color strings
+
+    Vectorized counterpart of map_face2color. All faces are sampled from
+    the colormap in bulk with colors.sample_colorscale, which formats each
+    distinct resulting color into an 'rgb(...)' string only once. Returns a
+    numpy array of color strings, one per face.
+
+    """
+    if vmin >= vmax:
+        raise exceptions.PlotlyError("Incorrect relation between vmin "
+                                     "and vmax. The vmin value cannot be "
+                                     "bigger than or equal to the value "
+                                     "of vmax.")
+    if scale is None or len(colormap) == 1:
+        colorscale = colormap
+    else:
+        colorscale = colors.make_colorscale(colormap, scale)
+    return np.array(colors.sample_colorscale(colorscale, faces, vmin, vmax))
+
+
+def _vertex_color_values(tri_vertices, color_func):
+    """
+    Evaluate a color function at every vertex of every triangle
+
+    The function is first called once with whole coordinate arrays, which
+    is fast for functions built from numpy ufuncs. Functions that raise a
+    TypeError or ValueError on arrays (e.g. math.sqrt, or comparisons in if
+    statements) are then evaluated one vertex at a time.
+    """
+    xs = tri_vertices[:, :, 0]
+    ys = tri_vertices[:, :, 1]
+    zs = tri_vertices[:, :, 2]
+    try:
+        dists = color_func(xs, ys, zs)
+    except (TypeError, ValueError):
+        dists = [[color_func(vertex[0], vertex[1], vertex[2])
+                  for vertex in triangle]
+                 for triangle in tri_vertices]
+        return np.asarray(dists, dtype=float)
+
+    dists = np.asarray(dists, dtype=float)
+    if dists.ndim == 0:
+        # constant color function
+        return np.full(xs.shape, float(dists))
+    elif dists.shape != xs.shape:
+        raise exceptions.PlotlyError(
+            "color_func must return one value per vertex when called with "
+            "arrays of vertex coordinates, received an array of shape "
+            "{0} for coordinate arrays of shape {1}.".format(
+                dists.shape, xs.shape))
+    return dists
+
+
+def _edge_coords(tri_vertices):
+    """
+    Return the x, y and z coordinates of the edges of all triangles
+
+    Each triangle contributes its 3 vertices, a repeat of its first vertex
+    to close the outline and a None separator. The coordinates are written
+    into preallocated object arrays of length 5 * ntri.
+    """
+    n_tri = tri_vertices.shape[0]
+    ixs_triangles = [0, 1, 2, 0]
+    edges = []
+    for dim in range(3):
+        edge = np.empty((n_tri, 5), dtype=object)
+        edge[:, :4] = tri_vertices[:, ixs_triangles, dim]
+        edge[:, 4] = None
+        edges.append(edge.ravel())
+    return edges
+
+
 def trisurf(x, y, z, simplices, show_colorbar, edges_color, scale,
             colormap=None, color_func=None, plot_edges=False, x_edge=None,
-            y_edge=None, z_edge=None, facecolor=None):
+            y_edge=None, z_edge=None, facecolor=None, use_intensity=False):
     """
     Refer to FigureFactory.create_trisurf() for docstring
     """
@@ -113,37 +187,57 @@ def trisurf(x, y, z, simplices, show_colorbar, edges_color, scale,
     else:
         # apply user inputted function to calculate
         # custom coloring for triangle vertices
-        mean_dists = []
-        for triangle in tri_vertices:
-            dists = []
-            for vertex in triangle:
-                dist = color_func(vertex[0], vertex[1], vertex[2])
-                dists.append(dist)
-            mean_dists.append(np.mean(dists))
-        mean_dists = np.asarray(mean_dists)
-
-    # Check if facecolors are already strings and can be skipped
-    if isinstance(mean_dists[0], str):
-        facecolor = mean_dists
-    else:
+        mean_dists = _vertex_color_values(tri_vertices, color_func).mean(-1)
+
+    mean_dists_are_numbers = not isinstance(mean_dists[0], str)
+    ii, jj, kk = simplices.T
+
+    if mean_dists_are_numbers:
         min_mean_dists = np.min(mean_dists)
         max_mean_dists = np.max(mean_dists)
 
-        if facecolor is None:
-            facecolor = []
-        for index in range(len(mean_dists)):
-            color = map_face2color(mean_dists[index], colormap, scale,
-                                   min_mean_dists, max_mean_dists)
-            facecolor.append(color)
-
-    # Make sure facecolor is a list so output is consistent across Pythons
-    facecolor = np.asarray(facecolor)
-    ii, jj, kk = simplices.T
+    if use_intensity and mean_dists_are_numbers:
+        # let plotly.js interpolate the colorscale over vertex intensities
+        # instead of sending one color string per face
+        if color_func is None:
+            intensity = np.asarray(z, dtype=float)
+        elif callable(color_func):
+            intensity = _vertex_color_values(points3D[:, None, :],
+                                             color_func)[:, 0]
+        else:
+            # average the face values of the faces sharing each vertex
+            n_points = len(points3D)
+            face_values = np.repeat(mean_dists.astype(float), 3)
+            totals = np.bincount(simplices.ravel(), weights=face_values,
+                                 minlength=n_points)
+            counts = np.bincount(simplices.ravel(), minlength=n_points)
+            intensity = totals / np.maximum(counts, 1)
+
+        if len(colormap) == 1:
+            colorscale = colors.make_colorscale(colormap * 2)
+        else:
+            colorscale = colors.make_colorscale(colormap, scale)
+        colorscale = colors.convert_colorscale_to_rgb(colorscale)
 
-    triangles = graph_objs.Mesh3d(x=x, y=y, z=z, facecolor=facecolor,
-                                  i=ii, j=jj, k=kk, name='')
+        triangles = graph_objs.Mesh3d(x=x, y=y, z=z, intensity=intensity,
+                                      colorscale=colorscale,
+                                      showscale=show_colorbar is True,
+                                      i=ii, j=jj, k=kk, name='')
+        # the mesh draws its own colorbar
+        show_colorbar = False
+    else:
+        # Check if facecolors are already strings and can be skipped
+        if not mean_dists_are_numbers:
+            facecolor = mean_dists
+        else:
+            facecolor = map_faces2color(mean_dists, colormap, scale,
+                                        min_mean_dists, max_mean_dists)
 
-    mean_dists_are_numbers = not isinstance(mean_dists[0], str)
+        # Make sure facecolor is a list so output is consistent across
+        # Pythons
+        facecolor = np.asarray(facecolor)
+        triangles = graph_objs.Mesh3d(x=x, y=y, z=z, facecolor=facecolor,
+                                      i=ii, j=jj, k=kk, name='')
 
     if mean_dists_are_numbers and show_colorbar is True:
         # make a colorscale from the colors
@@ -184,20 +278,16 @@ def trisurf(x, y, z, simplices, show_colorbar, edges_color, scale,
             y_edge = []
             z_edge = []
 
-    # Pull indices we care about, then add a None column to separate tris
-    ixs_triangles = [0, 1, 2, 0]
-    pull_edges = tri_vertices[:, ixs_triangles, :]
-    x_edge_pull = np.hstack([pull_edges[:, :, 0],
-                             np.tile(None, [pull_edges.shape[0], 1])])
-    y_edge_pull = np.hstack([pull_edges[:, :, 1],
-                             np.tile(None, [pull_edges.shape[0], 1])])
-    z_edge_pull = np.hstack([pull_edges[:, :, 2],
-                             np.tile(None, [pull_edges.shape[0], 1])])
-
-    # Now unravel the edges into a 1-d vector for plotting
-    x_edge = np.hstack([x_edge, x_edge_pull.reshape([1, -1])[0]])
-    y_edge = np.hstack([y_edge, y_edge_pull.reshape([1, -1])[0]])
-    z_edge = np.hstack([z_edge, z_edge_pull.reshape([1, -1])[0]])
+    x_edge_pull, y_edge_pull, z_edge_pull = _edge_coords(tri_vertices)
+
+    # Append the edges of this surface to any edges passed in
+    if len(x_edge):
+        x_edge_pull = np.hstack([x_edge, x_edge_pull])
+    if len(y_edge):
+        y_edge_pull = np.hstack([y_edge, y_edge_pull])
+    if len(z_edge):
+        z_edge_pull = np.hstack([z_edge, z_edge_pull])
+    x_edge, y_edge, z_edge = x_edge_pull, y_edge_pull, z_edge_pull
 
     if not (len(x_edge) == len(y_edge) == len(z_edge)):
         raise exceptions.PlotlyError("The lengths of x_edge, y_edge and "
@@ -227,7 +317,7 @@ def create_trisurf(x, y, z, simplices, colormap=None, show_colorbar=True,
                    zerolinecolor='rgb(255, 255, 255)',
                    edges_color='rgb(50, 50, 50)',
                    height=800, width=800,
-                   aspectratio=None):
+                   aspectratio=None, use_intensity=False):
     """
     Returns figure for a triangulated surface plot
 
@@ -267,6 +357,13 @@ def create_trisurf(x, y, z, simplices, colormap=None, show_colorbar=True,
     :param (int|float) width: the width of the plot (in pixels)
     :param (dict) aspectratio: a dictionary of the aspect ratio values for
         the x, y and z axes. 'x', 'y' and 'z' take (int|float) values
+    :param (bool) use_intensity: if True and the surface is colored by
+        numeric values, the mesh is colored through its 'intensity' and
+        'colorscale' properties instead of one color string per face. The
+        intensity is set per vertex: the z values if color_func is None,
+        color_func evaluated at the vertices if it is a function, or else
+        the mean of the values of the faces sharing each vertex.
+        This keeps the figure small for meshes with many simplices
 
     Example 1: Sphere
     ```
@@ -462,7 +559,8 @@ def create_trisurf(x, y, z, simplices, colormap=None, show_colorbar=True,
 
     data1 = trisurf(x, y, z, simplices, show_colorbar=show_colorbar,
                     color_func=color_func, colormap=colormap, scale=scale,
-                    edges_color=edges_color, plot_edges=plot_edges)
+                    edges_color=edges_color, plot_edges=plot_edges,
+                    use_intensity=use_intensity)
 
     axis = dict(
         showbackground=showbackground,
@@ -3,6 +3,7 @@ from __future__ import absolute_import
 from numbers import Number
 
 from plotly import exceptions, optional_imports
+from plotly.colors import sample_colorscale
 from plotly.figure_factory import utils
 from plotly.graph_objs import graph_objs
 from plotly.tools import make_subplots
@@ -157,26 +158,30 @@ def make_YAxis(yaxis_title):
     return yaxis
 
 
-def violinplot(vals, fillcolor='#1f77b4', rugplot=True):
+def violinplot(vals, fillcolor='#1f77b4', rugplot=True, binned_kde=False,
+               max_rug_points=None):
     """
     Refer to FigureFactory.create_violin() for docstring.
     """
     vals = np.asarray(vals, np.float)
     #  summary statistics
-    vals_min = calc_stats(vals)['min']
-    vals_max = calc_stats(vals)['max']
-    q1 = calc_stats(vals)['q1']
-    q2 = calc_stats(vals)['q2']
-    q3 = calc_stats(vals)['q3']
-    d1 = calc_stats(vals)['d1']
-    d2 = calc_stats(vals)['d2']
-
-    # kernel density estimation of pdf
-    pdf = scipy_stats.gaussian_kde(vals)
+    stats = calc_stats(vals)
+    vals_min = stats['min']
+    vals_max = stats['max']
+    q1 = stats['q1']
+    q2 = stats['q2']
+    q3 = stats['q3']
+    d1 = stats['d1']
+    d2 = stats['d2']
+
     # grid over the data interval
     xx = np.linspace(vals_min, vals_max, 100)
-    # evaluate the pdf at the grid xx
-    yy = pdf(xx)
+    # kernel density estimation of pdf evaluated at the grid xx
+    if binned_kde:
+        yy = utils.binned_gaussian_kde(vals, vals_min, vals_max, 99)
+    else:
+        pdf = scipy_stats.gaussian_kde(vals)
+        yy = pdf(xx)
     max_pdf = np.max(yy)
     # distance from the violin plot to rugplot
     distance = (2.0 * max_pdf)/10 if rugplot else 0
@@ -188,14 +193,45 @@ def violinplot(vals, fillcolor='#1f77b4', rugplot=True):
                  make_quartiles(q1, q3),
                  make_median(q2)]
     if rugplot:
-        plot_data.append(make_violin_rugplot(vals, max_pdf, distance=distance,
+        sample = utils.subsample_indices(len(vals), max_rug_points)
+        rug_vals = vals if sample is None else vals[sample]
+        plot_data.append(make_violin_rugplot(rug_vals, max_pdf,
+                                             distance=distance,
                                              color=fillcolor))
     return plot_data, plot_xrange
 
 
+def group_values(data, data_header, group_header, sort):
+    """
+    Splits the data column into one array of values per group
+
+    The groups are factorized and the rows stably sorted by group once, so
+    every group is sliced out of a single pass over the data.
+
+    :rtype (tuple) (group_name, group_vals): list of the group names, in
+        order of appearance or sorted if sort is True, and a dictionary
+        with the float array of values of each group
+    """
+    codes, uniques = pd.factorize(data[group_header])
+    group_name = uniques.tolist()
+
+    order = np.argsort(codes, kind='mergesort')
+    bounds = np.searchsorted(codes[order], np.arange(len(group_name) + 1))
+    vals = np.asarray(data[data_header], np.float)[order]
+    group_vals = dict(
+        (name, vals[bounds[k]:bounds[k + 1]])
+        for k, name in enumerate(group_name)
+    )
+
+    if sort:
+        group_name.sort()
+    return group_name, group_vals
+
+
 def violin_no_colorscale(data, data_header, group_header, colors,
                          use_colorscale, group_stats, rugplot, sort,
-                         height, width, title):
+                         height, width, title, binned_kde=False,
+                         max_rug_points=None):
     """
     Refer to FigureFactory.create_violin() for docstring.
 
@@ -203,15 +239,9 @@ def violin_no_colorscale(data, data_header, group_header, colors,
 
     """
 
-    # collect all group names
-    group_name = []
-    for name in data[group_header]:
-        if name not in group_name:
-            group_name.append(name)
-    if sort:
-        group_name.sort()
-
-    gb = data.groupby([group_header])
+    # collect all group names and their values
+    group_name, group_vals = group_values(data, data_header, group_header,
+                                          sort)
     L = len(group_name)
 
     fig = make_subplots(rows=1, cols=L,
@@ -220,12 +250,14 @@ def violin_no_colorscale(data, data_header, group_header, colors,
                         print_grid=False)
     color_index = 0
     for k, gr in enumerate(group_name):
-        vals = np.asarray(gb.get_group(gr)[data_header], np.float)
+        vals = group_vals[gr]
         if color_index >= len(colors):
             color_index = 0
         plot_data, plot_xrange = violinplot(vals,
                                             fillcolor=colors[color_index],
-                                            rugplot=rugplot)
+                                            rugplot=rugplot,
+                                            binned_kde=binned_kde,
+                                            max_rug_points=max_rug_points)
         layout = graph_objs.Layout()
 
         for item in plot_data:
@@ -253,7 +285,7 @@ def violin_no_colorscale(data, data_header, group_header, colors,
 
 def violin_colorscale(data, data_header, group_header, colors, use_colorscale,
                       group_stats, rugplot, sort, height, width,
-                      title):
+                      title, binned_kde=False, max_rug_points=None):
     """
     Refer to FigureFactory.create_violin() for docstring.
 
@@ -261,13 +293,9 @@ def violin_colorscale(data, data_header, group_header, colors, use_colorscale,
 
     """
 
-    # collect all group names
-    group_name = []
-    for name in data[group_header]:
-        if name not in group_name:
-            group_name.append(name)
-    if sort:
-        group_name.sort()
+    # collect all group names and their values
+    group_name, group_vals = group_values(data, data_header, group_header,
+                                          sort)
 
     # make sure all group names are keys in group_stats
     for group in group_name:
@@ -276,7 +304,6 @@ def violin_colorscale(data, data_header, group_header, colors, use_colorscale,
                                          "column must be represented "
                                          "as a key in group_stats.")
 
-    gb = data.groupby([group_header])
     L = len(group_name)
 
     fig = make_subplots(rows=1, cols=L,
@@ -284,10 +311,6 @@ def violin_colorscale(data, data_header, group_header, colors, use_colorscale,
                         horizontal_spacing=0.025,
                         print_grid=False)
 
-    # prepare low and high color for colorscale
-    lowcolor = utils.color_parser(colors[0], utils.unlabel_rgb)
-    highcolor = utils.color_parser(colors[1], utils.unlabel_rgb)
-
     # find min and max values in group_stats
     group_stats_values = []
     for key in group_stats:
@@ -296,19 +319,21 @@ def violin_colorscale(data, data_header, group_header, colors, use_colorscale,
     max_value = max(group_stats_values)
     min_value = min(group_stats_values)
 
-    for k, gr in enumerate(group_name):
-        vals = np.asarray(gb.get_group(gr)[data_header], np.float)
+    # find the intermediate colors of all groups from the colorscale
+    group_colors = sample_colorscale(
+        colors[:2], [group_stats[gr] for gr in group_name],
+        low=min_value, high=max_value, colortype='float'
+    )
 
-        # find intermediate color from colorscale
-        intermed = (group_stats[gr] - min_value) / (max_value - min_value)
-        intermed_color = utils.find_intermediate_color(
-            lowcolor, highcolor, intermed
-        )
+    for k, gr in enumerate(group_name):
+        vals = group_vals[gr]
 
         plot_data, plot_xrange = violinplot(
             vals,
-            fillcolor='rgb{}'.format(intermed_color),
-            rugplot=rugplot
+            fillcolor=utils.label_rgb(group_colors[k].tolist()),
+            rugplot=rugplot,
+            binned_kde=binned_kde,
+            max_rug_points=max_rug_points
         )
         layout = graph_objs.Layout()
 
@@ -348,7 +373,8 @@ def violin_colorscale(data, data_header, group_header, colors, use_colorscale,
 
 
 def violin_dict(data, data_header, group_header, colors, use_colorscale,
-                group_stats, rugplot, sort, height, width, title):
+                group_stats, rugplot, sort, height, width, title,
+                binned_kde=False, max_rug_points=None):
     """
     Refer to FigureFactory.create_violin() for docstring.
 
@@ -356,14 +382,9 @@ def violin_dict(data, data_header, group_header, colors, use_colorscale,
 
     """
 
-    # collect all group names
-    group_name = []
-    for name in data[group_header]:
-        if name not in group_name:
-            group_name.append(name)
-
-    if sort:
-        group_name.sort()
+    # collect all group names and their values
+    group_name, group_vals = group_values(data, data_header, group_header,
+                                          sort)
 
     # check if all group names appear in colors dict
     for group in group_name:
@@ -372,7 +393,6 @@ def violin_dict(data, data_header, group_header, colors, use_colorscale,
                                          "the group names must appear as "
                                          "keys in colors.")
 
-    gb = data.groupby([group_header])
     L = len(group_name)
 
     fig = make_subplots(rows=1, cols=L,
@@ -381,9 +401,11 @@ def violin_dict(data, data_header, group_header, colors, use_colorscale,
                         print_grid=False)
 
     for k, gr in enumerate(group_name):
-        vals = np.asarray(gb.get_group(gr)[data_header], np.float)
+        vals = group_vals[gr]
         plot_data, plot_xrange = violinplot(vals, fillcolor=colors[gr],
-                                            rugplot=rugplot)
+                                            rugplot=rugplot,
+                                            binned_kde=binned_kde,
+                                            max_rug_points=max_rug_points)
         layout = graph_objs.Layout()
 
         for item in plot_data:
@@ -411,7 +433,8 @@ def violin_dict(data, data_header, group_header, colors, use_colorscale,
 def create_violin(data, data_header=None, group_header=None, colors=None,
                   use_colorscale=False, group_stats=None, rugplot=True,
                   sort=False, height=450, width=600,
-                  title='Violin and Rug Plot'):
+                  title='Violin and Rug Plot', binned_kde=False,
+                  max_rug_points=None):
     """
     Returns figure for a violin plot
 
@@ -447,6 +470,14 @@ def create_violin(data, data_header=None, group_header=None, colors=None,
     :param (float) height: the height of the violin plot.
     :param (float) width: the width of the violin plot.
     :param (str) title: the title of the violin plot.
+    :param (bool) binned_kde: If True, the kde of each violin is computed
+        by linearly binning the values onto the plot grid and convolving
+        the bin counts with the gaussian kernel using an FFT, instead of
+        evaluating scipy.stats.gaussian_kde at every grid point. This makes
+        groups with many values practical. Default = False
+    :param (int) max_rug_points: Maximum number of markers drawn in each
+        rugplot. Larger groups are represented by a random subsample (with
+        a fixed seed) of this size. Default = None (draw every value)
 
     Example 1: Single Violin Plot
     ```
@@ -572,7 +603,9 @@ def create_violin(data, data_header=None, group_header=None, colors=None,
 
         # call the plotting functions
         plot_data, plot_xrange = violinplot(data, fillcolor=valid_colors[0],
-                                            rugplot=rugplot)
+                                            rugplot=rugplot,
+                                            binned_kde=binned_kde,
+                                            max_rug_points=max_rug_points)
 
         layout = graph_objs.Layout(
             title=title,
@@ -611,14 +644,14 @@ def create_violin(data, data_header=None, group_header=None, colors=None,
                 fig = violin_dict(
                     data, data_header, group_header, valid_colors,
                     use_colorscale, group_stats, rugplot, sort,
-                    height, width, title
+                    height, width, title, binned_kde, max_rug_points
                 )
                 return fig
             else:
                 fig = violin_no_colorscale(
                     data, data_header, group_header, valid_colors,
                     use_colorscale, group_stats, rugplot, sort,
-                    height, width, title
+                    height, width, title, binned_kde, max_rug_points
                 )
                 return fig
         else:
@@ -639,6 +672,6 @@ def create_violin(data, data_header=None, group_header=None, colors=None,
             fig = violin_colorscale(
                 data, data_header, group_header, valid_colors,
                 use_colorscale, group_stats, rugplot, sort, height,
-                width, title
+                width, title, binned_kde, max_rug_points
             )
             return fig
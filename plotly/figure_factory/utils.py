@@ -3,8 +3,10 @@ from __future__ import absolute_import
 import collections
 import decimal
 
-from plotly import exceptions
+from plotly import exceptions, optional_imports
 
+# Optional imports, may be None for users that only use our core functionality.
+np = optional_imports.get_module('numpy')
 
 DEFAULT_PLOTLY_COLORS = ['rgb(31, 119, 180)', 'rgb(255, 127, 14)',
                          'rgb(44, 160, 44)', 'rgb(214, 39, 40)',
@@ -131,6 +133,70 @@ def flatten(array):
                                      "entered as lists or ndarrays!")
 
 
+def binned_gaussian_kde(data, start, end, num_intervals):
+    """
+    Evaluates a gaussian kde of data on an evenly spaced grid
+
+    The grid points are start + k * (end - start) / num_intervals for
+    k = 0..num_intervals. The data is linearly binned onto the grid and the
+    bin weights are convolved with the gaussian kernel through an FFT, so
+    the cost does not grow with (number of samples) x (number of grid
+    points). The kernel bandwidth follows Scott's rule, as in
+    scipy.stats.gaussian_kde.
+
+    :param (list|array) data: the data set, expected in [start, end]
+    :param (float) start: the first grid point
+    :param (float) end: the last grid point
+    :param (int) num_intervals: number of intervals between grid points
+    :raises (PlotlyError): If the data set has zero variance.
+    :rtype (ndarray): density at each of the num_intervals + 1 grid points
+    """
+    data = np.asarray(data, dtype=float)
+    n = len(data)
+    m = num_intervals
+    bandwidth = np.std(data, ddof=1) * n ** (-1. / 5)
+    if not bandwidth > 0:
+        raise exceptions.PlotlyError(
+            "The kde of a data set with zero variance is undefined."
+        )
+    delta = (end - start) / float(m)
+
+    # Linear binning onto the grid start + k * delta, k = 0..m
+    position = np.clip((data - start) / delta, 0, m)
+    lower = np.minimum(np.floor(position).astype(int), m - 1)
+    upper_weight = position - lower
+    counts = (np.bincount(lower, weights=1 - upper_weight,
+                          minlength=m + 1) +
+              np.bincount(lower + 1, weights=upper_weight,
+                          minlength=m + 1))
+
+    # Kernel evaluated at every grid offset in [-m, m]
+    offsets = np.arange(-m, m + 1) * delta
+    kernel = (np.exp(-0.5 * (offsets / bandwidth) ** 2) /
+              (np.sqrt(2 * np.pi) * bandwidth * n))
+
+    size = 1 << int(np.ceil(np.log2(len(counts) + len(kernel) - 1)))
+    density = np.fft.irfft(np.fft.rfft(counts, size) *
+                           np.fft.rfft(kernel, size), size)
+    return np.maximum(density[m:2 * m + 1], 0)
+
+
+def subsample_indices(num_values, max_points):
+    """
+    Returns the sorted indices of a reproducible random subsample
+
+    :param (int) num_values: number of values to sample from
+    :param (int) max_points: maximum size of the subsample
+    :rtype (ndarray|None): max_points sorted indices drawn without
+        replacement with a fixed seed, or None if max_points is None or
+        num_values does not exceed it
+    """
+    if max_points is None or num_values <= max_points:
+        return None
+    return np.sort(np.random.RandomState(0).choice(
+        num_values, max_points, replace=False))
+
+
 def find_intermediate_color(lowcolor, highcolor, intermed):
     """
     Returns the color at a given distance between two colors
@@ -19,6 +19,7 @@ FILE_CONTENT = {CREDENTIALS_FILE: {'username': '',
                               'plotly_api_domain': 'https://api.plot.ly',
                               'plotly_ssl_verification': True,
                               'plotly_proxy_authorization': False,
+                              'plotly_api_pool_size': 10,
                               'world_readable': True,
                               'sharing': 'public',
                               'auto_open': True}}
@@ -2,3 +2,5 @@ from ._orca import to_image, write_image
 from . import orca
 
 from ._json import to_json, from_json, read_json, write_json
+
+from ._render_cache import RenderCache, set_render_cache, get_render_cache
@@ -1,7 +1,9 @@
 from six import string_types
 import json
 
+from plotly.animation import ColumnarFrames
 from plotly.utils import PlotlyJSONEncoder
+from plotly.io._render_cache import get_render_cache, render_cache_key
 from plotly.io._utils import (validate_coerce_fig_to_dict,
                               validate_coerce_output_type)
 
@@ -34,6 +36,36 @@ def to_json(fig,
     str
         Representation of figure as a JSON string
     """
+    # Check render cache
+    # ------------------
+    # Trace uids aren't part of the content hash, so only JSON without
+    # them is cached
+    cache_key = None
+    if remove_uids:
+        cache_key = render_cache_key(fig, 'json', pretty)
+        if cache_key is not None:
+            json_bytes = get_render_cache().get(cache_key)
+            if json_bytes is not None:
+                return json_bytes.decode('utf-8')
+
+    json_str = ''.join(_iter_json(fig, validate=validate, pretty=pretty,
+                                  remove_uids=remove_uids))
+
+    if cache_key is not None:
+        get_render_cache().put(cache_key, json_str.encode('utf-8'))
+
+    return json_str
+
+
+def _iter_json(fig, validate, pretty, remove_uids):
+    """
+    Return a generator of the pieces of the JSON representation of a
+    figure, which encodes the frames one at a time. See `to_json` for the
+    parameters.
+
+    Joined, the pieces are identical to the JSON encoding of the whole
+    figure dict.
+    """
     # Validate figure
     # ---------------
     fig_dict = validate_coerce_fig_to_dict(fig, validate)
@@ -44,8 +76,8 @@ def to_json(fig,
         for trace in fig_dict.get('data', []):
             trace.pop('uid')
 
-    # Dump to a JSON string and return
-    # --------------------------------
+    # Dump to JSON string pieces
+    # --------------------------
     opts = {'sort_keys': True}
     if pretty:
         opts['indent'] = 2
@@ -53,7 +85,51 @@ def to_json(fig,
         # Remove all whitespace
         opts['separators'] = (',', ':')
 
-    return json.dumps(fig_dict, cls=PlotlyJSONEncoder, **opts)
+    encoder = PlotlyJSONEncoder(**opts)
+
+    def newline_indent(level):
+        return '\n' + '  ' * level if pretty else ''
+
+    def dumps(obj, level):
+        # Plain json.dumps (with PlotlyJSONEncoder.default for non-native
+        # objects) gives the same result as PlotlyJSONEncoder unless there
+        # are NaN or Infinity values, which need the slower strict encoding
+        json_str = json.dumps(obj, default=encoder.default, **opts)
+        if 'NaN' in json_str or 'Infinity' in json_str:
+            json_str = encoder.encode(obj)
+
+        # Indent nested pretty-printed values. JSON strings never contain
+        # raw newlines
+        return json_str.replace('\n', '\n' + '  ' * level)
+
+    def iter_pieces():
+        if not fig_dict:
+            yield '{}'
+            return
+
+        yield '{'
+        for i, key in enumerate(sorted(fig_dict)):
+            if i > 0:
+                yield encoder.item_separator
+            yield newline_indent(1) + json.dumps(key) + encoder.key_separator
+
+            val = fig_dict[key]
+            if isinstance(val, ColumnarFrames):
+                val = val.to_plotly_json()
+
+            if key == 'frames' and isinstance(val, (list, tuple)) and val:
+                yield '['
+                for j, frame in enumerate(val):
+                    if j > 0:
+                        yield encoder.item_separator
+                    yield newline_indent(2) + dumps(frame, 2)
+                yield newline_indent(1) + ']'
+            else:
+                yield dumps(val, 1)
+
+        yield newline_indent(0) + '}'
+
+    return iter_pieces()
 
 
 def write_json(fig, file, validate=True, pretty=False, remove_uids=True):
@@ -82,10 +158,11 @@ def write_json(fig, file, validate=True, pretty=False, remove_uids=True):
     None
     """
 
-    # Get JSON string
-    # ---------------
-    # Pass through validate argument and let to_json handle validation logic
-    json_str = to_json(
+    # Get JSON string pieces
+    # ----------------------
+    # Pass through validate argument and let _iter_json handle validation
+    # logic. The figure's frames are encoded and written one at a time.
+    json_pieces = _iter_json(
         fig, validate=validate, pretty=pretty, remove_uids=remove_uids)
 
     # Check if file is a string
@@ -96,9 +173,11 @@ def write_json(fig, file, validate=True, pretty=False, remove_uids=True):
     # ---------
     if file_is_str:
         with open(file, 'w') as f:
-            f.write(json_str)
+            for json_piece in json_pieces:
+                f.write(json_piece)
     else:
-        file.write(json_str)
+        for json_piece in json_pieces:
+            file.write(json_piece)
 
 
 def from_json(value, output_type='Figure', skip_invalid=False):
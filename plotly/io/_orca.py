@@ -14,6 +14,7 @@ from six import string_types
 
 import plotly
 from plotly.files import PLOTLY_DIR, ensure_writable_plotly_dir
+from plotly.io._render_cache import get_render_cache, render_cache_key
 from plotly.io._utils import validate_coerce_fig_to_dict
 from plotly.optional_imports import get_module
 
@@ -1263,10 +1264,6 @@ def to_image(fig,
     bytes
         The image data
     """
-    # Make sure orca sever is running
-    # -------------------------------
-    ensure_server()
-
     # Handle defaults
     # ---------------
     # Apply configuration defaults to unspecified arguments
@@ -1284,6 +1281,21 @@ def to_image(fig,
     if height is None:
         height = config.default_height
 
+    # Check render cache
+    # ------------------
+    # The orca options that affect the rendered image are part of the key
+    cache_key = render_cache_key(
+        fig, format, width, height, scale, config.plotlyjs,
+        config.mathjax, config.topojson, config.mapbox_access_token)
+    if cache_key is not None:
+        img_data = get_render_cache().get(cache_key)
+        if img_data is not None:
+            return img_data
+
+    # Make sure orca sever is running
+    # -------------------------------
+    ensure_server()
+
     # Validate figure
     # ---------------
     fig_dict = validate_coerce_fig_to_dict(fig, validate)
@@ -1332,6 +1344,8 @@ an image export operation is performed.
     # --------------
     if response.status_code == 200:
         # All good
+        if cache_key is not None:
+            get_render_cache().put(cache_key, response.content)
         return response.content
     else:
         # ### Something went wrong ###
@@ -0,0 +1,238 @@
+import hashlib
+import os
+import tempfile
+import threading
+
+from plotly.basedatatypes import BaseFigure
+from plotly.files import PLOTLY_DIR
+
+
+class RenderCache(object):
+    """
+    On-disk least-recently-used cache of exported figures
+
+    Entries are stored as one file per key in a directory. Reading an entry
+    updates the modification time of its file, and the entries with the
+    oldest modification times are evicted when the total size of the cache
+    exceeds `max_size`. The directory may be shared between processes.
+    """
+
+    def __init__(self, directory=None, max_size=100 * 1024 * 1024):
+        """
+        Construct a render cache
+
+        Parameters
+        ----------
+        directory: str or None
+            Path of the directory to store cache entries in. Created if it
+            doesn't exist. Defaults to the `render_cache` directory in the
+            plotly settings directory (~/.plotly)
+        max_size: int
+            Maximum total size of the cache entries in bytes
+        """
+        if directory is None:
+            directory = os.path.join(PLOTLY_DIR, 'render_cache')
+
+        if not isinstance(max_size, int) or max_size <= 0:
+            raise ValueError("""
+The max_size argument to RenderCache must be a positive integer
+    Received value of type {typ}: {v}""".format(typ=type(max_size),
+                                                  v=max_size))
+
+        self._directory = directory
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self):
+        """
+        Path of the directory of the cache entries
+
+        Returns
+        -------
+        str
+        """
+        return self._directory
+
+    @property
+    def max_size(self):
+        """
+        Maximum total size of the cache entries in bytes
+
+        Returns
+        -------
+        int
+        """
+        return self._max_size
+
+    def _entry_path(self, key):
+        key_hash = hashlib.md5(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self._directory, key_hash + '.cache')
+
+    def get(self, key):
+        """
+        Return the cached bytes for a key
+
+        Parameters
+        ----------
+        key: tuple
+            Cache key, e.g. (content hash, format, width, height, scale)
+
+        Returns
+        -------
+        bytes or None
+            Cached bytes, or None if the key isn't in the cache
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                content = f.read()
+            os.utime(path, None)
+        except (IOError, OSError):
+            return None
+        return content
+
+    def put(self, key, content):
+        """
+        Store bytes for a key, evicting least recently used entries if the
+        cache is full
+
+        Parameters
+        ----------
+        key: tuple
+            Cache key, e.g. (content hash, format, width, height, scale)
+        content: bytes
+            Bytes to store
+
+        Returns
+        -------
+        None
+        """
+        if len(content) > self._max_size:
+            return
+
+        with self._lock:
+            if not os.path.isdir(self._directory):
+                os.makedirs(self._directory)
+
+            # Write to a temporary file and move it in place, so that
+            # readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self._directory,
+                                            suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(content)
+                getattr(os, 'replace', os.rename)(tmp_path,
+                                                  self._entry_path(key))
+            except (IOError, OSError):
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+            self._evict()
+
+    def _evict(self):
+        entries = []
+        total_size = 0
+        for name in os.listdir(self._directory):
+            if not name.endswith('.cache'):
+                continue
+            path = os.path.join(self._directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+            total_size += stat.st_size
+
+        entries.sort()
+        for _, path, size in entries:
+            if total_size <= self._max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total_size -= size
+
+    def clear(self):
+        """
+        Remove all entries from the cache
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            if not os.path.isdir(self._directory):
+                return
+            for name in os.listdir(self._directory):
+                if name.endswith('.cache'):
+                    try:
+                        os.remove(os.path.join(self._directory, name))
+                    except OSError:
+                        pass
+
+
+# Active render cache
+# -------------------
+_render_cache = None
+
+
+def set_render_cache(cache):
+    """
+    Set the render cache used by `to_image`, `to_json`, and
+    `plotly.offline.plot` to return previously exported figures
+
+    Only Figure objects are cached, by their content hash (see
+    `BaseFigure.content_hash`) and export options. A cached export of a
+    figure is returned without validating the figure, encoding it as JSON,
+    or contacting orca.
+
+    Parameters
+    ----------
+    cache: RenderCache or None
+        Render cache to use, or None to disable caching (the default)
+
+    Returns
+    -------
+    None
+    """
+    global _render_cache
+    if cache is not None and not isinstance(cache, RenderCache):
+        raise ValueError("""
+The cache argument to set_render_cache must be a RenderCache or None
+    Received value of type {typ}: {v}""".format(typ=type(cache), v=cache))
+    _render_cache = cache
+
+
+def get_render_cache():
+    """
+    Return the render cache set by `set_render_cache`
+
+    Returns
+    -------
+    RenderCache or None
+    """
+    return _render_cache
+
+
+def render_cache_key(fig, *options):
+    """
+    Return the render cache key of an export of a figure, or None if the
+    export shouldn't be cached
+
+    Parameters
+    ----------
+    fig:
+        Figure object or dict representing a figure
+    *options:
+        Export options that affect the output
+
+    Returns
+    -------
+    tuple or None
+    """
+    if _render_cache is None or not isinstance(fig, BaseFigure):
+        return None
+    return (fig.content_hash(),) + options
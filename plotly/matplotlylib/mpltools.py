@@ -8,6 +8,7 @@ import math
 import warnings
 
 import matplotlib.dates
+import numpy as np
 import pytz
 
 
@@ -289,16 +290,21 @@ def get_bar_gap(bar_starts, bar_ends, tol=1e-10):
 
 
 def convert_rgba_array(color_list):
-    clean_color_list = list()
-    for c in color_list:
-        clean_color_list += [(dict(r=int(c[0]*255),
-                                   g=int(c[1]*255),
-                                   b=int(c[2]*255),
-                                   a=c[3]
-        ))]
-    plotly_colors = list()
-    for rgba in clean_color_list:
-        plotly_colors += ["rgba({r},{g},{b},{a})".format(**rgba)]
+    """Convert an array of mpl rgba colors to plotly rgba color strings.
+
+    Each distinct color is formatted only once, which keeps large
+    collections with per-point colors (e.g., from a colormap) cheap.
+
+    """
+    colors = np.asarray(color_list, dtype=float).reshape(-1, 4)
+    if not len(colors):
+        return []
+    # truncate like int() does for the non-negative components
+    rgba = np.column_stack([np.floor(colors[:, :3] * 255), colors[:, 3]])
+    unique_rgba, inverse = np.unique(rgba, axis=0, return_inverse=True)
+    unique_colors = ["rgba({0},{1},{2},{3})".format(int(r), int(g), int(b), a)
+                     for r, g, b, a in unique_rgba.tolist()]
+    plotly_colors = [unique_colors[i] for i in inverse]
     if len(plotly_colors) == 1:
         return plotly_colors[0]
     else:
@@ -322,9 +328,9 @@ def convert_linewidth_array(width_array):
 
 
 def convert_size_array(size_array):
-    size = [math.sqrt(s) for s in size_array]
+    size = np.sqrt(np.asarray(size_array, dtype=float))
     if len(size) == 1:
-        return size[0]
+        return float(size[0])
     else:
         return size
 
@@ -535,7 +541,7 @@ def mpl_dates_to_datestrings(dates, mpl_formatter):
     if mpl_formatter == "TimeSeries_DateFormatter":
         try:
             dates = matplotlib.dates.epoch2num(
-                [date*24*60*60 for date in dates]
+                np.asarray(dates)*24*60*60
             )
             dates = matplotlib.dates.num2date(dates, tz=pytz.utc)
         except:
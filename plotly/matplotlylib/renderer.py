@@ -11,6 +11,8 @@ from __future__ import absolute_import
 import six
 import warnings
 
+import numpy as np
+
 import plotly.graph_objs as go
 from plotly.matplotlylib.mplexporter import Renderer
 from plotly.matplotlylib import mpltools
@@ -223,19 +225,16 @@ class PlotlyRenderer(Renderer):
         """
         tol = 1e-10
         trace = [mpltools.make_bar(**bar_props) for bar_props in coll]
-        widths = [bar_props['x1'] - bar_props['x0'] for bar_props in trace]
-        heights = [bar_props['y1'] - bar_props['y0'] for bar_props in trace]
-        vertical = abs(
-            sum(widths[0] - widths[iii] for iii in range(len(widths)))
-        ) < tol
-        horizontal = abs(
-            sum(heights[0] - heights[iii] for iii in range(len(heights)))
-        ) < tol
+        x0, x1, y0, y1 = (np.array([bar_props[key] for bar_props in trace],
+                                   dtype=float)
+                          for key in ('x0', 'x1', 'y0', 'y1'))
+        widths = x1 - x0
+        heights = y1 - y0
+        vertical = abs(np.sum(widths[0] - widths)) < tol
+        horizontal = abs(np.sum(heights[0] - heights)) < tol
         if vertical and horizontal:
             # Check for monotonic x. Can't both be true!
-            x_zeros = [bar_props['x0'] for bar_props in trace]
-            if all((x_zeros[iii + 1] > x_zeros[iii]
-                    for iii in range(len(x_zeros[:-1])))):
+            if np.all(np.diff(x0) > 0):
                 orientation = 'v'
             else:
                 orientation = 'h'
@@ -245,39 +244,26 @@ class PlotlyRenderer(Renderer):
             orientation = 'h'
         if orientation == 'v':
             self.msg += "    Attempting to draw a vertical bar chart\n"
-            old_heights = [bar_props['y1'] for bar_props in trace]
-            for bar in trace:
-                bar['y0'], bar['y1'] = 0, bar['y1'] - bar['y0']
-            new_heights = [bar_props['y1'] for bar_props in trace]
             # check if we're stacked or not...
-            for old, new in zip(old_heights, new_heights):
-                if abs(old - new) > tol:
-                    self.plotly_fig['layout']['barmode'] = 'stack'
-                    self.plotly_fig['layout']['hovermode'] = 'x'
-            x = [bar['x0'] + (bar['x1'] - bar['x0']) / 2 for bar in trace]
-            y = [bar['y1'] for bar in trace]
-            bar_gap = mpltools.get_bar_gap([bar['x0'] for bar in trace],
-                                           [bar['x1'] for bar in trace])
+            if np.any(np.abs(y1 - heights) > tol):
+                self.plotly_fig['layout']['barmode'] = 'stack'
+                self.plotly_fig['layout']['hovermode'] = 'x'
+            x = x0 + widths / 2
+            y = heights
+            bar_gap = mpltools.get_bar_gap(x0, x1)
             if self.x_is_mpl_date:
-                x = [bar['x0'] for bar in trace]
                 formatter = (self.current_mpl_ax.get_xaxis()
                              .get_major_formatter().__class__.__name__)
-                x = mpltools.mpl_dates_to_datestrings(x, formatter)
+                x = mpltools.mpl_dates_to_datestrings(x0, formatter)
         else:
             self.msg += "    Attempting to draw a horizontal bar chart\n"
-            old_rights = [bar_props['x1'] for bar_props in trace]
-            for bar in trace:
-                bar['x0'], bar['x1'] = 0, bar['x1'] - bar['x0']
-            new_rights = [bar_props['x1'] for bar_props in trace]
             # check if we're stacked or not...
-            for old, new in zip(old_rights, new_rights):
-                if abs(old - new) > tol:
-                    self.plotly_fig['layout']['barmode'] = 'stack'
-                    self.plotly_fig['layout']['hovermode'] = 'y'
-            x = [bar['x1'] for bar in trace]
-            y = [bar['y0'] + (bar['y1'] - bar['y0']) / 2 for bar in trace]
-            bar_gap = mpltools.get_bar_gap([bar['y0'] for bar in trace],
-                                           [bar['y1'] for bar in trace])
+            if np.any(np.abs(x1 - widths) > tol):
+                self.plotly_fig['layout']['barmode'] = 'stack'
+                self.plotly_fig['layout']['hovermode'] = 'y'
+            x = widths
+            y = y0 + heights / 2
+            bar_gap = mpltools.get_bar_gap(y0, y1)
         bar = go.Bar(
             orientation=orientation,
             x=x,
@@ -365,13 +351,15 @@ class PlotlyRenderer(Renderer):
                 )
             )
         if props['coordinates'] == 'data':
+            # split the xy pairs into columns in one go
+            data = np.asarray(props['data']).reshape(-1, 2)
             marked_line = go.Scatter(
                 mode=mode,
                 name=(str(props['label']) if
                       isinstance(props['label'], six.string_types) else
                       props['label']),
-                x=[xy_pair[0] for xy_pair in props['data']],
-                y=[xy_pair[1] for xy_pair in props['data']],
+                x=data[:, 0],
+                y=data[:, 1],
                 xaxis='x{0}'.format(self.axis_ct),
                 yaxis='y{0}'.format(self.axis_ct),
                 line=line,
@@ -150,11 +150,27 @@ def init_notebook_mode(connected=False):
 
 def _plot_html(figure_or_data, config, validate, default_width,
                default_height, global_requirejs):
+    # Imported here since plotly.io imports plotly.basedatatypes, which
+    # imports this module
+    from plotly.io._render_cache import get_render_cache, render_cache_key
+
+    # Look up the JSON encoded figure in the render cache. The cached JSON
+    # keeps the trace uids of the figure that was first rendered
+    cache_key = render_cache_key(figure_or_data, 'html')
+    cached_json = None
+    if cache_key is not None:
+        cached_json = get_render_cache().get(cache_key)
+
+    if cached_json is not None:
+        figure = None
+        layout = figure_or_data._layout
+    else:
+        figure = tools.return_figure_from_figure_or_data(figure_or_data,
+                                                         validate)
+        layout = figure.get('layout', {})
 
-    figure = tools.return_figure_from_figure_or_data(figure_or_data, validate)
-
-    width = figure.get('layout', {}).get('width', default_width)
-    height = figure.get('layout', {}).get('height', default_height)
+    width = layout.get('width', default_width)
+    height = layout.get('height', default_height)
 
     try:
         float(width)
@@ -171,15 +187,28 @@ def _plot_html(figure_or_data, config, validate, default_width,
         height = str(height) + 'px'
 
     plotdivid = uuid.uuid4()
-    jdata = _json.dumps(figure.get('data', []), cls=utils.PlotlyJSONEncoder)
-    jlayout = _json.dumps(figure.get('layout', {}),
-                          cls=utils.PlotlyJSONEncoder)
-
-    if figure.get('frames', None):
-        jframes = _json.dumps(figure.get('frames', []),
-                              cls=utils.PlotlyJSONEncoder)
+    if cached_json is not None:
+        # JSON encoded values don't contain raw newlines
+        jdata, jlayout, jframes = cached_json.decode('utf-8').split('\n')
+        jframes = jframes or None
     else:
-        jframes = None
+        jdata = _json.dumps(figure.get('data', []),
+                            cls=utils.PlotlyJSONEncoder)
+        jlayout = _json.dumps(figure.get('layout', {}),
+                              cls=utils.PlotlyJSONEncoder)
+
+        if figure.get('frames', None):
+            # Encode frames one at a time, the strict JSON encoding of the
+            # PlotlyJSONEncoder is expensive on many large frames at once
+            jframes = '[' + ', '.join(
+                _json.dumps(frame, cls=utils.PlotlyJSONEncoder)
+                for frame in figure['frames']) + ']'
+        else:
+            jframes = None
+
+        if cache_key is not None:
+            get_render_cache().put(cache_key, '\n'.join(
+                [jdata, jlayout, jframes or '']).encode('utf-8'))
 
     configkeys = (
         'staticPlot',
@@ -16,9 +16,11 @@ and ploty's servers.
 """
 from __future__ import absolute_import
 
+import collections
 import copy
 import json
 import os
+import threading
 import time
 import warnings
 import webbrowser
@@ -501,6 +503,29 @@ def get_figure(file_owner_or_url, file_id=None, raw=False):
     return tools.get_graph_obj(figure, obj_type='Figure')
 
 
+def _encode_stream_objects(stream_objects):
+    """
+    Encode stream objects as newline terminated lines of strict JSON.
+
+    Plain json.dumps (with PlotlyJSONEncoder.default for non-native
+    objects) gives the same result as PlotlyJSONEncoder unless there are
+    NaN or Infinity values. Only the lines that could hold them go
+    through the slower strict encoding.
+
+    :param (list) stream_objects: dicts to write to a stream.
+    :returns: (str)
+
+    """
+    encoder = utils.PlotlyJSONEncoder()
+    lines = []
+    for stream_object in stream_objects:
+        line = _json.dumps(stream_object, default=encoder.default)
+        if 'NaN' in line or 'Infinity' in line:
+            line = encoder.encode(stream_object)
+        lines.append(line + '\n')
+    return ''.join(lines)
+
+
 @utils.template_doc(**tools.get_config_file())
 class Stream:
     """
@@ -533,17 +558,41 @@ class Stream:
     stream.open() # Open the stream
     stream.write(dict(x=1, y=1)) # Plot (1, 1) in your graph
 
+    Buffered stream example:
+    # Writes are queued and sent in batches by a background thread
+    stream = Stream(stream_id, buffered=True)
+    stream.open()
+    for i in range(10000):
+        stream.write(dict(x=i, y=read_sensor()))
+    stream.close() # Send what is still queued and close the stream
+    print(stream.stats) # Points sent, dropped, chunks sent, ...
+
     """
 
     HTTP_PORT = 80
     HTTPS_PORT = 443
 
     @utils.template_doc(**tools.get_config_file())
-    def __init__(self, stream_id):
+    def __init__(self, stream_id, buffered=False, flush_interval=0.05,
+                 max_batch_points=1000, max_buffered_points=100000,
+                 block_when_full=False):
         """
         Initialize a Stream object with your unique stream_id.
         Find your stream_id at {plotly_domain}/settings.
 
+        By default every `write` is encoded and sent right away. With
+        `buffered=True`, `write` only queues the point and a background
+        thread sends the queued points together, as newline separated
+        JSON in a single chunk, every `flush_interval` seconds or as soon
+        as `max_batch_points` points are queued.
+
+        At most `max_buffered_points` points are queued. When the queue is
+        full, `write` waits for room if `block_when_full` is True, and
+        otherwise the oldest queued point is dropped. See `stats`.
+
+        Queued points are encoded when they are sent, so don't modify
+        what you passed to `write` afterwards.
+
         For more help, see: `help(plotly.plotly.Stream)`
         or see examples and tutorials here:
         https://plot.ly/python/streaming/
@@ -552,6 +601,21 @@ class Stream:
         self.stream_id = stream_id
         self._stream = None
 
+        self._buffered = buffered
+        self._flush_interval = flush_interval
+        self._max_batch_points = max_batch_points
+        self._max_buffered_points = max_buffered_points
+        self._block_when_full = block_when_full
+
+        self._buffer = collections.deque()
+        self._buffer_condition = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._flusher = None
+        self._flusher_stop = False
+        self._flush_error = None
+        self._stats = {'written': 0, 'sent': 0, 'dropped': 0, 'chunks': 0,
+                       'blocked_seconds': 0.0}
+
     def get_streaming_specs(self):
         """
         Returns the streaming server, port, ssl_enabled flag, and headers.
@@ -588,7 +652,8 @@ class Stream:
 
         """
         try:
-            self._stream.write('\n', reconnect_on=reconnect_on)
+            with self._send_lock:
+                self._stream.write('\n', reconnect_on=reconnect_on)
         except AttributeError:
             raise exceptions.PlotlyError(
                 "Stream has not been opened yet, "
@@ -603,6 +668,24 @@ class Stream:
 
         return self._stream._isconnected()
 
+    @property
+    def stats(self):
+        """
+        Counters of a buffered stream.
+
+        'written': points passed to `write`,
+        'sent': points sent to plotly,
+        'dropped': points dropped because the queue was full or sending
+                   them failed,
+        'buffered': points queued and not sent yet,
+        'chunks': chunks sent to plotly,
+        'blocked_seconds': time `write` spent waiting for room in the queue.
+
+        """
+        with self._buffer_condition:
+            stats = dict(self._stats, buffered=len(self._buffer))
+        return stats
+
     def open(self):
         """
         Open streaming connection to plotly.
@@ -615,6 +698,84 @@ class Stream:
         streaming_specs = self.get_streaming_specs()
         self._stream = chunked_requests.Stream(**streaming_specs)
 
+        if self._buffered and (self._flusher is None or
+                               not self._flusher.is_alive()):
+            self._flusher_stop = False
+            self._flush_error = None
+            self._flusher = threading.Thread(target=self._flush_loop)
+            self._flusher.daemon = True
+            self._flusher.start()
+
+    def _flush_loop(self):
+        """
+        Send the queued points of a buffered stream until it is closed.
+
+        A failed batch doesn't stop the loop, its error is raised by the
+        next call to `write`, `flush` or `close`.
+
+        """
+        while True:
+            with self._buffer_condition:
+                if (not self._flusher_stop and
+                        len(self._buffer) < self._max_batch_points):
+                    self._buffer_condition.wait(self._flush_interval)
+                if self._flusher_stop:
+                    return
+            try:
+                self._send_buffered()
+            except Exception as e:
+                self._flush_error = e
+
+    def _send_buffered(self):
+        """
+        Send all queued points, `max_batch_points` per chunk.
+
+        """
+        with self._send_lock:
+            while True:
+                with self._buffer_condition:
+                    num_points = min(len(self._buffer),
+                                     self._max_batch_points)
+                    batch = [self._buffer.popleft()
+                             for _ in range(num_points)]
+                    self._buffer_condition.notify_all()
+                if not batch:
+                    return
+
+                stream_objects = [stream_object for stream_object, _ in batch]
+                reconnect_on = batch[-1][1]
+                try:
+                    self._stream.write(_encode_stream_objects(stream_objects),
+                                       reconnect_on=reconnect_on)
+                except Exception:
+                    with self._buffer_condition:
+                        self._stats['dropped'] += len(batch)
+                    raise
+
+                with self._buffer_condition:
+                    self._stats['sent'] += len(batch)
+                    self._stats['chunks'] += 1
+
+    def _raise_flush_error(self):
+        error, self._flush_error = self._flush_error, None
+        if error is not None:
+            raise error
+        if self._flusher is not None and not self._flusher.is_alive():
+            raise exceptions.PlotlyError(
+                "The thread sending the points of this buffered stream has "
+                "stopped. Call `close()` and `open()` on the stream to "
+                "restart it.")
+
+    def flush(self):
+        """
+        Send the points queued by a buffered stream now.
+
+        """
+        self._raise_flush_error()
+        if self._stream is None:
+            raise exceptions.PlotlyError("Stream has not been opened yet.")
+        self._send_buffered()
+
     def write(self, trace, layout=None,
               reconnect_on=(200, '', 408, 502)):
         """
@@ -659,11 +820,12 @@ class Stream:
 
         """
 
-        # Convert trace objects to dictionaries
+        # Convert trace objects to dictionaries. Only top level keys are
+        # changed below, so a shallow copy leaves `trace` intact.
         if isinstance(trace, BaseTraceType):
             stream_object = trace.to_plotly_json()
         else:
-            stream_object = copy.deepcopy(trace)
+            stream_object = dict(trace)
 
         # Remove 'type' if present since this trace type cannot be changed
         stream_object.pop('type', None)
@@ -671,9 +833,13 @@ class Stream:
         if layout is not None:
             stream_object.update(dict(layout=layout))
 
+        if self._buffered and self._stream is not None:
+            self._raise_flush_error()
+            self._queue(stream_object, reconnect_on)
+            return
+
         # TODO: allow string version of this?
-        jdata = _json.dumps(stream_object, cls=utils.PlotlyJSONEncoder)
-        jdata += "\n"
+        jdata = _encode_stream_objects([stream_object])
 
         try:
             self._stream.write(jdata, reconnect_on=reconnect_on)
@@ -683,6 +849,30 @@ class Stream:
                 "cannot write to a closed connection. "
                 "Call `open()` on the stream to open the stream.")
 
+    def _queue(self, stream_object, reconnect_on):
+        """
+        Queue a point of a buffered stream, making room if the queue is full.
+
+        """
+        with self._buffer_condition:
+            if len(self._buffer) >= self._max_buffered_points:
+                if self._block_when_full:
+                    start = time.time()
+                    try:
+                        while len(self._buffer) >= self._max_buffered_points:
+                            self._raise_flush_error()
+                            self._buffer_condition.wait(self._flush_interval)
+                    finally:
+                        self._stats['blocked_seconds'] += time.time() - start
+                while len(self._buffer) >= self._max_buffered_points:
+                    self._buffer.popleft()
+                    self._stats['dropped'] += 1
+
+            self._buffer.append((stream_object, reconnect_on))
+            self._stats['written'] += 1
+            if len(self._buffer) >= self._max_batch_points:
+                self._buffer_condition.notify_all()
+
     def close(self):
         """
         Close the stream connection to plotly's streaming servers.
@@ -693,9 +883,20 @@ class Stream:
 
         """
         try:
-            self._stream.close()
-        except AttributeError:
-            raise exceptions.PlotlyError("Stream has not been opened yet.")
+            if self._flusher is not None:
+                with self._buffer_condition:
+                    self._flusher_stop = True
+                    self._buffer_condition.notify_all()
+                self._flusher.join()
+                self._flusher = None
+                self._send_buffered()
+                self._raise_flush_error()
+        finally:
+            try:
+                self._stream.close()
+            except AttributeError:
+                raise exceptions.PlotlyError(
+                    "Stream has not been opened yet.")
 
 
 class image:
@@ -882,6 +1083,54 @@ class file_ops:
         return response.status_code
 
 
+def _encoded_chunks(num_items, encode, max_chunk_bytes, start=0):
+    """
+    Split items [start, num_items) into JSON-encoded, size-bounded chunks.
+
+    Each chunk is encoded on its own, so only one chunk is held in memory
+    at a time. The number of items per chunk is adapted from the encoded
+    size of the previous chunk, and a chunk that comes out too large is
+    re-encoded with fewer items. Only single-item chunks may exceed
+    `max_chunk_bytes`.
+
+    :param (int) num_items: the number of items to split up.
+    :param (function) encode: encode(start, stop) returns the JSON string
+        of the request body holding items [start, stop).
+    :param (int) max_chunk_bytes: the size bound of each encoded chunk.
+    :param (int) start: the first item to encode.
+    :returns: (generator) of (start, stop, encoded_body) tuples.
+
+    """
+    if max_chunk_bytes < 1:
+        raise exceptions.InputError("max_chunk_bytes must be positive.")
+
+    size = 100
+    while start < num_items:
+        stop = min(start + size, num_items)
+        encoded = encode(start, stop)
+        per_item = len(encoded) / float(stop - start)
+        if len(encoded) > max_chunk_bytes and stop - start > 1:
+            size = min(stop - start - 1,
+                       max(1, int(0.9 * max_chunk_bytes / per_item)))
+            continue
+        yield start, stop, encoded
+        start = stop
+        size = max(1, int(0.9 * max_chunk_bytes / per_item))
+
+
+def _column_slice(data, start, stop):
+    """
+    Return rows [start, stop) of a column as a list, padded with ''.
+
+    """
+    chunk = data[start:stop]
+    if hasattr(chunk, 'tolist'):
+        chunk = chunk.tolist()
+    else:
+        chunk = list(chunk)
+    return chunk + [''] * (stop - start - len(chunk))
+
+
 class grid_ops:
     """
     Interface to Plotly's Grid API.
@@ -920,7 +1169,8 @@ class grid_ops:
 
     @classmethod
     def upload(cls, grid, filename,
-               world_readable=True, auto_open=True, meta=None):
+               world_readable=True, auto_open=True, meta=None,
+               max_chunk_bytes=None, progress=None):
         """
         Upload a grid to your Plotly account with the specified filename.
 
@@ -945,6 +1195,22 @@ class grid_ops:
                                    Metadata is any arbitrary
                                    JSON-encodable object, for example:
                                    `{"experiment name": "GaAs"}`
+            - max_chunk_bytes (default=None): Upload the grid in chunks of
+                                   rows whose JSON encoding stays under
+                                   this many bytes, instead of in a single
+                                   request. Each chunk is encoded and sent
+                                   on its own (and retried on its own if
+                                   the server fails), which keeps large
+                                   grids from timing out. Columns of
+                                   unequal length are padded with empty
+                                   strings.
+            - progress (default=None): Called as
+                                   `progress(uploaded_rows, total_rows)`
+                                   after each chunk is uploaded.
+
+        If a chunked upload is interrupted after its first chunk, the grid
+        exists in your Plotly account with the rows uploaded so far and
+        can be completed with `plotly.plotly.grid_ops.resume_upload`.
 
         Filenames must be unique. To overwrite a grid with the same filename,
         you'll first have to delete the grid with the blocking name. See
@@ -991,19 +1257,39 @@ class grid_ops:
         if parent_path != '':
             file_ops.mkdirs(parent_path)
 
-        # transmorgify grid object into plotly's format
-        grid_json = grid._to_plotly_grid_json()
-        if meta is not None:
-            grid_json['metadata'] = meta
+        def make_payload(grid_json):
+            if meta is not None:
+                grid_json['metadata'] = meta
 
-        payload = {
-            'filename': filename,
-            'data': grid_json,
-            'world_readable': world_readable
-        }
+            payload = {
+                'filename': filename,
+                'data': grid_json,
+                'world_readable': world_readable
+            }
 
-        if parent_path != '':
-            payload['parent_path'] = parent_path
+            if parent_path != '':
+                payload['parent_path'] = parent_path
+            return payload
+
+        if max_chunk_bytes is None:
+            # transmorgify grid object into plotly's format
+            payload = make_payload(grid._to_plotly_grid_json())
+        else:
+            # create the grid with the first chunk of rows
+            def encode(start, stop):
+                grid_json = {'cols': {}}
+                for column_index, column in enumerate(grid):
+                    grid_json['cols'][column.name] = {
+                        'data': column.data[start:stop],
+                        'order': column_index
+                    }
+                return _json.dumps(make_payload(grid_json), sort_keys=True,
+                                   cls=utils.PlotlyJSONEncoder)
+
+            num_rows = cls._num_rows(grid)
+            _, first_stop, payload = next(
+                _encoded_chunks(max(num_rows, 1), encode, max_chunk_bytes)
+            )
 
         response = v2.grids.create(payload)
 
@@ -1017,6 +1303,12 @@ class grid_ops:
 
         grid.id = fid
 
+        if max_chunk_bytes is not None:
+            grid._uploaded_rows = min(first_stop, num_rows)
+            if progress is not None:
+                progress(grid._uploaded_rows, num_rows)
+            cls._upload_remaining_rows(grid, max_chunk_bytes, progress)
+
         if meta is not None:
             meta_ops.upload(meta, grid=grid)
 
@@ -1025,8 +1317,66 @@ class grid_ops:
 
         return web_url
 
+    @staticmethod
+    def _num_rows(grid):
+        return max([len(column.data) for column in grid] or [0])
+
+    @classmethod
+    def _upload_remaining_rows(cls, grid, max_chunk_bytes, progress):
+        """
+        Append the rows of a grid that a chunked upload has not sent yet.
+
+        """
+        num_rows = cls._num_rows(grid)
+
+        def encode(start, stop):
+            columns = [_column_slice(column.data, start, stop)
+                       for column in grid]
+            rows = [list(row) for row in zip(*columns)]
+            return _json.dumps({'rows': rows}, cls=utils.PlotlyJSONEncoder)
+
+        for _, stop, body in _encoded_chunks(num_rows, encode,
+                                             max_chunk_bytes,
+                                             start=grid._uploaded_rows):
+            v2.grids.row(grid.id, body)
+            grid._uploaded_rows = stop
+            if progress is not None:
+                progress(stop, num_rows)
+
     @classmethod
-    def append_columns(cls, columns, grid=None, grid_url=None):
+    def resume_upload(cls, grid, max_chunk_bytes, progress=None):
+        """
+        Finish a chunked grid upload that was interrupted.
+
+        `grid` is the plotly.grid_objs.Grid object that was passed to
+        `grid_ops.upload` with `max_chunk_bytes`. The grid was created in
+        your Plotly account with its first chunk of rows, and only the rows
+        that were not uploaded yet are sent, in chunks of at most
+        `max_chunk_bytes` bytes. `progress` is called as
+        `progress(uploaded_rows, total_rows)` after each chunk.
+
+        Usage example:
+        ```
+        import plotly.plotly as py
+        from plotly.exceptions import PlotlyRequestError
+        try:
+            py.grid_ops.upload(grid, 'big grid', max_chunk_bytes=2**20)
+        except PlotlyRequestError:
+            py.grid_ops.resume_upload(grid, max_chunk_bytes=2**20)
+        ```
+
+        """
+        grid_ops.ensure_uploaded(grid.id)
+        if getattr(grid, '_uploaded_rows', None) is None:
+            raise exceptions.PlotlyError(
+                'This grid was not uploaded in chunks. Only uploads made '
+                'with `max_chunk_bytes` can be resumed.'
+            )
+        cls._upload_remaining_rows(grid, max_chunk_bytes, progress)
+
+    @classmethod
+    def append_columns(cls, columns, grid=None, grid_url=None,
+                       max_chunk_bytes=None, progress=None):
         """
         Append columns to a Plotly grid.
 
@@ -1038,6 +1388,11 @@ class grid_ops:
 
         `grid_url` is a unique URL of a `grid` in your plotly account.
 
+        `max_chunk_bytes` sends the columns in several requests whose
+        JSON encoding stays under this many bytes (a single column larger
+        than that is sent on its own), and `progress` is called as
+        `progress(appended_columns, total_columns)` after each request.
+
         Usage example 1: Upload a grid to Plotly, and then append a column
         ```
         from plotly.grid_objs import Grid, Column
@@ -1077,21 +1432,41 @@ class grid_ops:
             err = exceptions.NON_UNIQUE_COLUMN_MESSAGE.format(duplicate_name)
             raise exceptions.InputError(err)
 
-        # This is sorta gross, we need to double-encode this.
-        body = {
-            'cols': _json.dumps(columns, cls=utils.PlotlyJSONEncoder)
-        }
         fid = grid_id
-        response = v2.grids.col_create(fid, body)
-        parsed_content = response.json()
+        if max_chunk_bytes is None:
+            # This is sorta gross, we need to double-encode this.
+            body = {
+                'cols': _json.dumps(columns, cls=utils.PlotlyJSONEncoder)
+            }
+            response = v2.grids.col_create(fid, body)
+            parsed_content = response.json()
 
-        cls._fill_in_response_column_ids(columns, parsed_content['cols'], fid)
+            cls._fill_in_response_column_ids(columns, parsed_content['cols'],
+                                             fid)
+        else:
+            columns = list(columns)
+
+            def encode(start, stop):
+                return _json.dumps({
+                    'cols': _json.dumps(columns[start:stop],
+                                        cls=utils.PlotlyJSONEncoder)
+                })
+
+            for start, stop, body in _encoded_chunks(len(columns), encode,
+                                                     max_chunk_bytes):
+                response = v2.grids.col_create(fid, body)
+                parsed_content = response.json()
+                cls._fill_in_response_column_ids(columns[start:stop],
+                                                 parsed_content['cols'], fid)
+                if progress is not None:
+                    progress(stop, len(columns))
 
         if grid:
             grid.extend(columns)
 
     @classmethod
-    def append_rows(cls, rows, grid=None, grid_url=None):
+    def append_rows(cls, rows, grid=None, grid_url=None,
+                    max_chunk_bytes=None, progress=None):
         """
         Append rows to a Plotly grid.
 
@@ -1109,6 +1484,10 @@ class grid_ops:
 
         `grid_url` is a unique URL of a `grid` in your plotly account.
 
+        `max_chunk_bytes` sends the rows in several requests whose JSON
+        encoding stays under this many bytes, and `progress` is called as
+        `progress(appended_rows, total_rows)` after each request.
+
         Usage example 1: Upload a grid to Plotly, and then append rows
         ```
         from plotly.grid_objs import Grid, Column
@@ -1154,7 +1533,20 @@ class grid_ops:
                                 'column' if n_columns == 1 else 'columns'))
 
         fid = grid_id
-        v2.grids.row(fid, {'rows': rows})
+        if max_chunk_bytes is None:
+            v2.grids.row(fid, {'rows': rows})
+        else:
+            rows = list(rows)
+
+            def encode(start, stop):
+                return _json.dumps({'rows': rows[start:stop]},
+                                   cls=utils.PlotlyJSONEncoder)
+
+            for _, stop, body in _encoded_chunks(len(rows), encode,
+                                                 max_chunk_bytes):
+                v2.grids.row(fid, body)
+                if progress is not None:
+                    progress(stop, len(rows))
 
         if grid:
             longest_column_length = max([len(col.data) for col in grid])
@@ -33,6 +33,7 @@ CONFIG_KEYS = {
     'plotly_api_domain': six.string_types,
     'plotly_ssl_verification': bool,
     'plotly_proxy_authorization': bool,
+    'plotly_api_pool_size': int,
     'world_readable': bool,
     'auto_open': bool,
     'sharing': six.string_types
@@ -67,6 +68,7 @@ def sign_in(username, api_key, **kwargs):
     :param (str|optional) plotly_api_domain:
     :param (bool|optional) plotly_ssl_verification:
     :param (bool|optional) plotly_proxy_authorization:
+    :param (int|optional) plotly_api_pool_size:
     :param (bool|optional) world_readable:
 
     """
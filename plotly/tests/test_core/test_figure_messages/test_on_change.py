@@ -270,3 +270,53 @@ class TestOnChangeCallbacks(TestCase):
                                          (-10, 10),
                                          (11, 22),
                                          1000)
+
+    def test_callbacks_invoked_in_registration_order(self):
+        calls = []
+        self.figure.layout.on_change(lambda *args: calls.append('width'),
+                                     'width')
+        self.figure.layout.on_change(lambda *args: calls.append('range'),
+                                     'xaxis.range')
+        self.figure.layout.on_change(lambda *args: calls.append('both'),
+                                     'xaxis.range', 'width')
+        self.figure.layout.on_change(lambda *args: calls.append('xaxis'),
+                                     'xaxis')
+
+        self.figure.plotly_relayout(
+            relayout_data={'xaxis.range': [-10, 10], 'width': 500})
+        self.assertEqual(calls, ['width', 'range', 'both', 'xaxis'])
+
+    def test_many_callbacks_only_matching_invoked(self):
+        fns = [MagicMock() for _ in range(200)]
+        self.figure.layout.update(
+            {'xaxis%d' % (i + 2): {} for i in range(len(fns))})
+        for i, fn in enumerate(fns):
+            self.figure.layout.on_change(fn, 'xaxis%d.range' % (i + 2))
+
+        self.figure.layout.xaxis5.range = [0, 1]
+        called = [i for i, fn in enumerate(fns) if fn.called]
+        self.assertEqual(called, [3])
+        fns[3].assert_called_once_with(self.figure.layout, (0, 1))
+
+    def test_callback_on_batch_update_deferred(self):
+        fn_range = MagicMock()
+        self.figure.layout.on_change(fn_range,
+                                     'xaxis.range',
+                                     'yaxis.range',
+                                     'width')
+
+        with self.figure.batch_update(defer_callbacks=True):
+            self.figure.plotly_relayout({'xaxis.range': [-10, 10]})
+            self.figure.plotly_relayout({'yaxis.range': [11, 22]})
+            self.figure.layout.width = 500
+            # Check fn not called before context exits
+            self.assertFalse(fn_range.called)
+
+        fn_range.assert_called_once_with(self.figure.layout,
+                                         (-10, 10),
+                                         (11, 22),
+                                         500)
+
+        # Callbacks are dispatched right away again after the context
+        self.figure.layout.width = 600
+        self.assertEqual(fn_range.call_count, 2)
@@ -0,0 +1,92 @@
+from unittest import TestCase
+import plotly.graph_objs as go
+
+
+class TestAnimationQueue(TestCase):
+
+    def test_steps_applied_to_figure(self):
+        fig = go.Figure(data=[go.Scatter(y=[0, 0])])
+        changes = []
+        fig.data[0].on_change(lambda trace, y: changes.append(y), 'y')
+
+        with fig.animation_queue(frame_rate=20) as queue:
+            for i in range(5):
+                with queue.step():
+                    fig.data[0].y = [i, i + 1]
+
+        self.assertEqual(fig.data[0].y, (4, 5))
+        self.assertEqual(len(changes), 5)
+        self.assertEqual(queue.num_steps, 5)
+        self.assertTrue(queue.closed)
+        self.assertEqual(queue.animation_opts['frame'], {'duration': 50.0})
+
+        with self.assertRaisesRegexp(ValueError, 'closed'):
+            with queue.step():
+                pass
+
+    def test_invalid_animation_queue(self):
+        fig = go.Figure(data=[go.Scatter(y=[0, 0])])
+        with self.assertRaisesRegexp(ValueError, 'frame_rate'):
+            with fig.animation_queue(frame_rate=0):
+                pass
+
+        with self.assertRaisesRegexp(ValueError, 'chunk_size'):
+            with fig.animation_queue(chunk_size=0):
+                pass
+
+        with self.assertRaises(ValueError):
+            with fig.batch_update():
+                with fig.animation_queue():
+                    pass
+
+    if 'FigureWidget' in go.__dict__.keys():
+        def setUp(self):
+            self.fig = go.FigureWidget(
+                data=[go.Scatter(y=[0, 0]), go.Scatter(y=[1, 1])])
+            self.msgs = []
+            self.fig.observe(self.record_msg, names='_py2js_animationQueue')
+
+        def record_msg(self, change):
+            if change['new'] is not None:
+                self.msgs.append(change['new'])
+
+        def test_steps_sent_in_chunks(self):
+            with self.fig.animation_queue(chunk_size=4) as queue:
+                for i in range(10):
+                    with queue.step():
+                        self.fig.data[1].y = [i, i]
+                        self.fig.layout.title = str(i)
+
+            self.assertEqual([len(msg['steps']) for msg in self.msgs],
+                             [4, 4, 2])
+            self.assertEqual(self.msgs[-1]['steps'][-1], {
+                'style_data': [{'y': [9, 9]}],
+                'layout_data': {'title': '9'},
+                'style_traces': [1]})
+            self.assertEqual(set(msg['queue_id'] for msg in self.msgs),
+                             {queue.queue_id})
+            self.assertEqual(self.msgs[-1]['trace_edit_id'],
+                             self.fig._last_trace_edit_id)
+
+        def test_playback_reports(self):
+            reports = []
+            with self.fig.animation_queue(
+                    chunk_size=2,
+                    on_playback=lambda q: reports.append(
+                        (q.played_steps, q.dropped_steps))) as queue:
+                for i in range(4):
+                    with queue.step():
+                        self.fig.data[0].y = [i, i]
+
+            queue_id = queue.queue_id
+            self.assertIn(queue_id, self.fig._animation_queues)
+
+            self.fig._js2py_animationQueue = {
+                'queue_id': queue_id, 'played_steps': 2, 'dropped_steps': 0}
+            self.fig._js2py_animationQueue = {
+                'queue_id': queue_id, 'played_steps': 3, 'dropped_steps': 1}
+
+            self.assertEqual(reports, [(2, 0), (3, 1)])
+            self.assertEqual(queue.dropped_steps, 1)
+            self.assertNotIn(queue_id, self.fig._animation_queues)
+            self.assertIsNone(self.fig._js2py_animationQueue)
@@ -0,0 +1,43 @@
+from unittest import TestCase
+import plotly.graph_objs as go
+
+
+class TestTraceDeltas(TestCase):
+    if 'FigureWidget' in go.__dict__.keys():
+        def setUp(self):
+            self.fig = go.FigureWidget(
+                data=[go.Scatter(y=[i, i + 1]) for i in range(4)])
+
+        def send_trace_deltas(self, trace_deltas, trace_edit_id=None):
+            if trace_edit_id is None:
+                trace_edit_id = self.fig._last_trace_edit_id
+
+            self.fig._js2py_traceDeltas = {
+                'trace_deltas': trace_deltas,
+                'trace_edit_id': trace_edit_id}
+
+        def test_deltas_for_touched_traces_only(self):
+            changes = []
+            self.fig.data[2].on_change(
+                lambda trace, mode: changes.append(mode), 'mode')
+
+            trace_uids = [trace.uid for trace in self.fig.data]
+            self.send_trace_deltas([
+                {'uid': trace_uids[2], 'mode': 'lines'},
+                {'uid': trace_uids[0], 'mode': 'markers'}])
+
+            self.assertEqual(self.fig.data[0]._prop_defaults['mode'],
+                             'markers')
+            self.assertEqual(self.fig.data[2]._prop_defaults['mode'],
+                             'lines')
+            self.assertEqual(self.fig.data[1]._prop_defaults, {})
+            self.assertEqual(self.fig.data[3]._prop_defaults, {})
+            self.assertEqual(changes, ['lines'])
+            self.assertIsNone(self.fig._js2py_traceDeltas)
+
+        def test_superseded_deltas_are_ignored(self):
+            trace_uid = self.fig.data[1].uid
+            self.fig.data[1].name = 'b'
+            self.send_trace_deltas([{'uid': trace_uid, 'mode': 'lines'}],
+                                   trace_edit_id=0)
+            self.assertEqual(self.fig.data[1]._prop_defaults, {})
@@ -1,8 +1,15 @@
 from __future__ import absolute_import
 
-from unittest import TestCase
+import copy
+import pickle
+from unittest import TestCase, SkipTest
 
 import plotly.graph_objs as go
+from plotly import basedatatypes
+from plotly.basedatatypes import BaseFigure, BasePlotlyType
+from plotly.optional_imports import get_module
+
+np = get_module('numpy')
 
 
 class FigureTest(TestCase):
@@ -109,4 +116,227 @@ class FigureTest(TestCase):
                          [{
                              'data': [{'type': 'bar'}],
                              'layout':  {'title': 'Figure title'}
-                         }])
\ No newline at end of file
+                         }])
+
+class KeyPathTest(TestCase):
+
+    def test_str_to_dict_path(self):
+        self.assertEqual(BaseFigure._str_to_dict_path('marker'), ('marker',))
+        self.assertEqual(
+            BaseFigure._str_to_dict_path('updatemenus[1].buttons[0].label'),
+            ('updatemenus', 1, 'buttons', 0, 'label'))
+        self.assertEqual(BaseFigure._str_to_dict_path(('a', 0)), ('a', 0))
+
+        # Paths are parsed once and shared
+        path = BaseFigure._str_to_dict_path('marker.colorbar.tickfont.size')
+        self.assertIs(
+            BaseFigure._str_to_dict_path('marker.colorbar.tickfont.size'),
+            path)
+
+    def test_dict_path_cache_is_bounded(self):
+        max_size = BaseFigure._max_dict_path_cache_size
+        for i in range(max_size + 10):
+            BaseFigure._str_to_dict_path('xaxis{}.range[0]'.format(i))
+        self.assertTrue(len(BaseFigure._dict_path_cache) <= max_size)
+        self.assertEqual(BaseFigure._str_to_dict_path('xaxis3.range[0]'),
+                         ('xaxis3', 'range', 0))
+
+    def test_build_dispatch_plan(self):
+        dispatch_plan = BaseFigure._build_dispatch_plan(
+            ['xaxis.rangeselector.font.color', 'xaxis.rangeselector.bgcolor'])
+        self.assertEqual(dispatch_plan, {
+            (): {('xaxis',),
+                 ('xaxis', 'rangeselector'),
+                 ('xaxis', 'rangeselector', 'bgcolor'),
+                 ('xaxis', 'rangeselector', 'font'),
+                 ('xaxis', 'rangeselector', 'font', 'color')},
+            ('xaxis',): {('rangeselector',),
+                         ('rangeselector', 'bgcolor'),
+                         ('rangeselector', 'font'),
+                         ('rangeselector', 'font', 'color')},
+            ('xaxis', 'rangeselector'): {('bgcolor',),
+                                         ('font',),
+                                         ('font', 'color')},
+            ('xaxis', 'rangeselector', 'font'): {('color',)}})
+
+
+class PickleTest(TestCase):
+
+    def setUp(self):
+        self.figure = go.Figure(
+            data=[go.Scatter(y=[1, 3, 2], marker={'color': 'red'}),
+                  go.Bar(x=['a', 'b'], y=[2, 1])],
+            layout={'xaxis2': {'range': [0, 1]},
+                    'annotations': [{'text': 'a'}, {'text': 'b'}]},
+            frames=[go.Frame(data=[go.Scatter(y=[3, 1])],
+                             layout={'yaxis3': {'title': 'f'}})])
+
+    def assert_restored(self, restored):
+        self.assertEqual(type(restored), type(self.figure))
+        expected, result = self.figure.to_dict(), restored.to_dict()
+        for trace in expected['data'] + result['data']:
+            trace.pop('uid')
+        self.assertEqual(result, expected)
+
+        # Restored figures are independent of the original one
+        restored.data[0].marker.color = 'blue'
+        restored.layout.annotations[1].font.size = 20
+        restored.layout.xaxis2.range = [1, 2]
+        restored.frames[0].layout.yaxis3.title = 'g'
+        self.assertEqual(restored._data[0]['marker'], {'color': 'blue'})
+        self.assertEqual(restored._layout['annotations'][1],
+                         {'text': 'b', 'font': {'size': 20}})
+        self.assertEqual(self.figure.data[0].marker.color, 'red')
+        self.assertEqual(self.figure.layout.annotations[1].font.size, None)
+        self.assertEqual(self.figure.layout.xaxis2.range, (0, 1))
+        self.assertEqual(self.figure.frames[0].layout.yaxis3.title, 'f')
+
+        # And can be extended as usual
+        restored.add_scatter(y=[1, 2])
+        restored.layout.xaxis3 = {'range': [0, 2]}
+        self.assertEqual(len(restored.data), 3)
+
+    def test_pickle_figure(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assert_restored(
+                pickle.loads(pickle.dumps(self.figure, protocol)))
+
+    def test_copy_figure(self):
+        self.assert_restored(copy.deepcopy(self.figure))
+        self.assert_restored(copy.copy(self.figure))
+
+    def test_restored_traces_get_new_uids(self):
+        restored = pickle.loads(pickle.dumps(self.figure))
+        self.assertNotEqual(restored.data[0].uid, self.figure.data[0].uid)
+
+    def test_pickle_plotly_obj(self):
+        annotation = self.figure.layout.annotations[1]
+        for obj in [annotation, self.figure.layout, go.Scatter(y=[1, 2])]:
+            restored = pickle.loads(pickle.dumps(obj))
+            self.assertEqual(type(restored), type(obj))
+            self.assertIsNone(restored.parent)
+            self.assertEqual(restored.to_plotly_json(), obj.to_plotly_json())
+
+        restored = copy.deepcopy(annotation)
+        restored.text = 'c'
+        self.assertEqual(annotation.text, 'b')
+        self.assertEqual(copy.copy(self.figure.layout.xaxis2).range, (0, 1))
+
+
+class EqualityTest(TestCase):
+
+    def setUp(self):
+        if np is None:
+            raise SkipTest('numpy not installed')
+
+        self.figure = go.Figure(data=[
+            go.Scatter(x=np.arange(2000), y=np.linspace(0, 1, 2000))])
+
+    def test_copies_share_read_only_arrays(self):
+        y = self.figure.data[0].y
+        self.assertFalse(y.flags.writeable)
+        self.assertIs(copy.deepcopy(self.figure).data[0].y, y)
+        self.assertIs(copy.deepcopy(self.figure.data[0]).y, y)
+
+    def test_digested_equality(self):
+        other = go.Figure(self.figure.to_dict())
+        other.data[0].uid = self.figure.data[0].uid
+        y1, y2 = self.figure.data[0].y, other.data[0].y
+
+        for _ in range(3):
+            self.assertEqual(self.figure, other)
+        self.assertIsNotNone(basedatatypes._array_digest(y1))
+        self.assertEqual(basedatatypes._array_digest(y1),
+                         basedatatypes._array_digest(y2))
+
+        other.data[0].x = np.arange(1, 2001)
+        for _ in range(3):
+            self.assertNotEqual(self.figure, other)
+
+    def test_vals_equal(self):
+        a = np.arange(2000.0)
+        a.flags.writeable = False
+        b = a.copy()
+        b[0] = -0.0
+        b.flags.writeable = False
+        c = a.copy()
+        c[-1] = 0
+        c.flags.writeable = False
+        d = a.astype('int32')
+        d.flags.writeable = False
+
+        for _ in range(3):
+            self.assertTrue(BasePlotlyType._vals_equal(a, a))
+            self.assertTrue(BasePlotlyType._vals_equal(a, b))
+            self.assertFalse(BasePlotlyType._vals_equal(a, c))
+            self.assertTrue(BasePlotlyType._vals_equal(a, d))
+            self.assertFalse(BasePlotlyType._vals_equal(
+                a.astype('int64'), c.astype('int64')))
+            self.assertTrue(BasePlotlyType._vals_equal({'y': a}, {'y': b}))
+
+    def test_equal_digests_are_confirmed(self):
+        a = np.arange(2000)
+        a.flags.writeable = False
+        b = a[::-1].copy()
+        b.flags.writeable = False
+        for _ in range(2):
+            BasePlotlyType._vals_equal(a, b)
+
+        # Even if the digests of different arrays collide, the arrays are
+        # compared
+        digests = basedatatypes._array_digests
+        digests[id(b)] = (digests[id(b)][0],
+                          basedatatypes._array_digest(a))
+        self.assertFalse(BasePlotlyType._vals_equal(a, b))
+
+
+class ContentHashTest(TestCase):
+
+    def build_figure(self):
+        return go.Figure(data=[go.Scatter(y=[1, 2], marker={'color': 'red'}),
+                               go.Bar(x=['a', 'b'], y=[3, 4])],
+                         layout={'title': 'Figure title'})
+
+    def test_hash_is_stable(self):
+        figure = self.build_figure()
+        self.assertEqual(figure.content_hash(),
+                         self.build_figure().content_hash())
+        self.assertEqual(figure.content_hash(),
+                         copy.deepcopy(figure).content_hash())
+
+    def test_hash_changes_with_properties(self):
+        figure = self.build_figure()
+        hashes = [figure.content_hash()]
+
+        figure.data[0].marker.color = 'blue'
+        hashes.append(figure.content_hash())
+
+        figure.plotly_restyle({'y': [[5, 6]]}, 1)
+        hashes.append(figure.content_hash())
+
+        figure.layout.title = 'New title'
+        hashes.append(figure.content_hash())
+
+        with figure.batch_update():
+            figure.layout.xaxis.range = [0, 1]
+        hashes.append(figure.content_hash())
+
+        figure.layout = go.Layout(title='Other title')
+        hashes.append(figure.content_hash())
+
+        figure.data = [figure.data[1], figure.data[0]]
+        hashes.append(figure.content_hash())
+
+        figure.frames = [go.Frame(data=[go.Scatter(y=[7])])]
+        hashes.append(figure.content_hash())
+
+        self.assertEqual(len(set(hashes)), len(hashes))
+
+        # Reverting properties reverts the hash
+        other = self.build_figure()
+        other.data[1].y = [5, 6]
+        other.data[0].marker.color = 'blue'
+        other.layout.title = 'Other title'
+        other.data = [other.data[1], other.data[0]]
+        other.frames = [go.Frame(data=[go.Scatter(y=[7])])]
+        self.assertEqual(figure.content_hash(), other.content_hash())
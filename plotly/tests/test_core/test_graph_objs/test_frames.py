@@ -1,8 +1,12 @@
 from __future__ import absolute_import
 
+import pickle
 from unittest import TestCase
 
-from plotly.graph_objs import Bar, Frames, Frame, Layout
+import numpy as np
+
+from plotly.animation import ColumnarFrames
+from plotly.graph_objs import Bar, Figure, Frames, Frame, Layout, Scatter
 
 import re
 
@@ -21,6 +25,20 @@ def return_prop_descriptions(prop_descrip_text):
 
 class FramesTest(TestCase):
 
+    def setUp(self):
+        # Some tests set attributes on the Frame class itself, restore its
+        # properties afterwards
+        self.frame_attrs = {attr: Frame.__dict__.get(attr)
+                            for attr in ('data', 'layout', 'frame')}
+
+    def tearDown(self):
+        for attr, val in self.frame_attrs.items():
+            if val is None:
+                if attr in Frame.__dict__:
+                    delattr(Frame, attr)
+            else:
+                setattr(Frame, attr, val)
+
     def test_instantiation(self):
 
         native_frames = [
@@ -88,3 +106,125 @@ class FramesTest(TestCase):
             set(matches),
             {'group', 'name', 'data', 'layout', 'baseframe', 'traces'}
         )
+
+
+class ColumnarFramesTest(TestCase):
+
+    def setUp(self):
+        self.ys = np.arange(12.).reshape(3, 4)
+        self.sizes = np.arange(12).reshape(3, 4) + 1
+        self.frames = ColumnarFrames(
+            [{'y': self.ys, 'marker.size': self.sizes},
+             {'y': self.ys * 2}],
+            traces=[1, 0], names=['a', 'b', 'c'],
+            constants=[{'mode': 'lines'}, {'type': 'bar'}])
+
+    def test_frame_dict(self):
+        frame = self.frames.frame_dict(-1)
+        self.assertEqual(sorted(frame), ['data', 'name', 'traces'])
+        self.assertEqual(frame['name'], 'c')
+        self.assertEqual(frame['traces'], [1, 0])
+        scatter, bar = frame['data']
+        self.assertEqual(sorted(scatter), ['marker', 'mode', 'type', 'y'])
+        self.assertEqual(scatter['type'], 'scatter')
+        self.assertEqual(bar['type'], 'bar')
+        np.testing.assert_array_equal(scatter['marker']['size'],
+                                      self.sizes[2])
+        np.testing.assert_array_equal(bar['y'], self.ys[2] * 2)
+
+        # Frames share the read-only rows of copies of the stacked arrays
+        self.assertFalse(np.shares_memory(scatter['y'], self.ys))
+        self.assertFalse(scatter['y'].flags.writeable)
+        self.assertTrue(np.shares_memory(
+            scatter['y'], self.frames.frame_dict(-1)['data'][0]['y']))
+        self.ys[2] = -1
+        np.testing.assert_array_equal(scatter['y'], [8, 9, 10, 11])
+
+        with self.assertRaises(IndexError):
+            self.frames.frame_dict(3)
+
+    def test_materialized_frames(self):
+        self.assertEqual(len(self.frames), 3)
+        frames = list(self.frames)
+        self.assertEqual([frame.name for frame in frames], ['a', 'b', 'c'])
+        self.assertIsInstance(frames[1], Frame)
+        frame_data = frames[1].to_plotly_json()['data']
+        np.testing.assert_array_equal(frame_data[0]['marker']['size'],
+                                      [5, 6, 7, 8])
+
+    def test_figure_frames(self):
+        fig = Figure(data=[Scatter(y=self.ys[0]), Bar(y=self.ys[0])],
+                     frames=self.frames)
+        self.assertIs(fig.frames, self.frames)
+        expected = Figure(data=fig.data,
+                          frames=self.frames.to_plotly_json())
+        self.assertTrue(all(isinstance(frame, Frame)
+                            for frame in expected.frames))
+
+        fig_frames = fig.to_dict()['frames']
+        expected_frames = expected.to_dict()['frames']
+        self.assertEqual(len(fig_frames), len(expected_frames))
+        for frame, expected_frame in zip(fig_frames, expected_frames):
+            np.testing.assert_equal(frame, expected_frame)
+
+        restored = pickle.loads(pickle.dumps(fig))
+        self.assertIsInstance(restored.frames, ColumnarFrames)
+        np.testing.assert_equal(restored.to_dict()['frames'], fig_frames)
+        self.assertFalse(
+            restored.frames.frame_dict(0)['data'][0]['y'].flags.writeable)
+
+        fig.frames = None
+        self.assertEqual(fig.frames, ())
+
+    def test_invalid_columnar_frames(self):
+        with self.assertRaisesRegexp(ValueError, 'one element per frame'):
+            ColumnarFrames({'x': self.ys, 'y': self.ys[:2]})
+
+        with self.assertRaisesRegexp(ValueError, 'per frame values'):
+            ColumnarFrames({'y': 1})
+
+        with self.assertRaisesRegexp(ValueError, 'per frame values'):
+            ColumnarFrames({}, constants={'y': self.ys})
+
+        with self.assertRaisesRegexp(ValueError, 'one dict per element'):
+            ColumnarFrames({'y': self.ys}, constants=[{}, {}])
+
+        with self.assertRaisesRegexp(ValueError, 'one name per frame'):
+            ColumnarFrames({'y': self.ys}, names=['a'])
+
+        with self.assertRaisesRegexp(ValueError, 'not supported'):
+            ColumnarFrames({'transforms[0].value': self.ys})
+
+        with self.assertRaises(ValueError):
+            ColumnarFrames({'y': self.ys}, constants={'bogus': 1})
+
+    def test_constant_arrays(self):
+        # Two dimensional constants are used in every frame, and arrays of
+        # per frame values can have more dimensions
+        z = np.arange(6.).reshape(2, 3)
+        frames = ColumnarFrames({'zmax': np.arange(4.)}, constants={
+            'type': 'heatmap', 'z': z})
+        self.assertEqual(len(frames), 4)
+        heatmap = frames.frame_dict(3)['data'][0]
+        np.testing.assert_array_equal(heatmap['z'], z)
+        self.assertEqual(heatmap['zmax'], 3)
+
+        # The frames share a read-only copy of the constant arrays
+        self.assertFalse(np.shares_memory(heatmap['z'], z))
+        self.assertFalse(heatmap['z'].flags.writeable)
+        fig = Figure(data=[{'type': 'heatmap', 'z': z}], frames=frames)
+        for frames_dicts in (frames.to_plotly_json(),
+                             fig.to_dict()['frames'],
+                             pickle.loads(pickle.dumps(frames))
+                             .to_plotly_json()):
+            for frame in frames_dicts:
+                self.assertTrue(np.shares_memory(frame['data'][0]['z'],
+                                                 frames_dicts[0]['data'][0]
+                                                 ['z']))
+        self.assertTrue(np.shares_memory(
+            frames.frame_dict(0)['data'][0]['z'], heatmap['z']))
+
+        zs = np.arange(24.).reshape(4, 2, 3)
+        frames = ColumnarFrames({'z': zs}, constants={'type': 'heatmap'})
+        np.testing.assert_array_equal(frames.frame_dict(3)['data'][0]['z'],
+                                      zs[3])
@@ -45,8 +45,26 @@ Scatter({
 
         expected = """\
 Scatter({
-    'marker': {'color': 'green',
-               'opacity': [0.0, 0.001, 0.002, ..., 0.997, 0.998, 0.999]},
+    'marker': {'color': 'green', 'opacity': [0.0, 0.001, 0.002, ..., 0.997, 0.998, 0.999]},
     'y': [0, 1, 2, ..., 997, 998, 999]
 })"""
         self.assertEqual(scatt.__repr__(), expected)
+
+    def test_figure_repr_elided(self):
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('numpy not installed')
+
+        fig = go.Figure(
+            data=[go.Scatter(y=np.arange(10000.0)) for _ in range(12)],
+            layout={'annotations': [{'text': str(i)} for i in range(15)]})
+
+        fig_repr = fig.__repr__()
+        self.assertIn("'y': array([0.000e+00, 1.000e+00, 2.000e+00, ..., "
+                      "9.997e+03, 9.998e+03, 9.999e+03], shape=(10000,), "
+                      "dtype=float64)", fig_repr)
+        self.assertEqual(fig_repr.count("'type': 'scatter'"), 10)
+        self.assertIn('... (2 more)', fig_repr)
+        self.assertEqual(fig_repr.count("'text': "), 10)
+        self.assertIn('... (5 more)', fig_repr)
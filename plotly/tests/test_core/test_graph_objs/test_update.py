@@ -121,3 +121,61 @@ class TestUpdateMethod(TestCase):
 
         self.assertEqual(len(layout.annotations), 2)
         self.assertEqual(layout.to_plotly_json(), expected)
+
+
+class TestCompiledUpdate(TestCase):
+
+    def setUp(self):
+        self.theme = {
+            'font': {'family': 'Courier New', 'size': 13},
+            'xaxis': {'showgrid': False, 'range': [0, 5]},
+            'xaxis3': {'title': 'three', 'tickfont': {'color': 'red'}},
+            'annotations': [{'font': {'size': 8}}, {'text': 'B'}],
+        }
+
+    def make_figure(self, annotations):
+        return go.Figure(data=[Scatter(y=[1, 2]), go.Bar(y=[3, 4])],
+                         layout={'xaxis2': {'title': 'two'},
+                                 'annotations': annotations})
+
+    def test_layout_compiled_update_matches_update(self):
+        compiled = go.Layout.compile_update(self.theme, width=500)
+
+        for annotations in [[], [{'text': 'a'}, {'text': 'b'}, {}]]:
+            expected = self.make_figure(annotations)
+            expected.layout.update(self.theme, width=500)
+
+            for target in ['figure', 'layout']:
+                fig = self.make_figure(annotations)
+                if target == 'figure':
+                    self.assertIs(compiled.apply(fig), fig)
+                else:
+                    compiled.apply(fig.layout)
+                self.assertEqual(fig.layout.to_plotly_json(),
+                                 expected.layout.to_plotly_json())
+
+    def test_trace_compiled_update(self):
+        compiled = Scatter.compile_update(marker={'size': 3}, mode='lines')
+        fig = self.make_figure([])
+        compiled.apply(fig)
+
+        self.assertEqual(fig.data[0].marker.size, 3)
+        self.assertEqual(fig.data[0].mode, 'lines')
+        self.assertIsNone(fig.data[1].marker.color)
+
+        with self.assertRaisesRegexp(ValueError, 'Bar'):
+            compiled.apply(fig.data[1])
+
+    def test_compiled_values_are_not_shared(self):
+        compiled = go.Layout.compile_update(xaxis={'range': [0, 5]})
+        fig1, fig2 = go.Figure(), go.Figure()
+        compiled.apply(fig1)
+        compiled.apply(fig2)
+        fig1.plotly_relayout({'xaxis.range[1]': 10})
+        self.assertEqual(fig2.layout.xaxis.range, (0, 5))
+
+    def test_compile_update_validates_once(self):
+        with self.assertRaisesRegexp(ValueError, 'bogus'):
+            go.Layout.compile_update(xaxis={'bogus': 1})
+        with self.assertRaises(ValueError):
+            go.Layout.compile_update(xaxis={'range': 'not a range'})
@@ -32,6 +32,21 @@ class FileToolsTest(PlotlyTestCase):
         self.assertEqual(config['auto_open'], auto_open)
         tools.reset_config_file()
 
+    def test_set_config_file_positional_args(self):
+
+        # Check the keyword arguments added later don't shift the positional
+        # arguments
+
+        tools.set_config_file('this', 'thing', 'that', True, False, True,
+                              None, False, 5)
+        config = tools.get_config_file()
+        self.assertEqual(config['plotly_domain'], 'this')
+        self.assertEqual(config['plotly_proxy_authorization'], False)
+        self.assertEqual(config['world_readable'], True)
+        self.assertEqual(config['auto_open'], False)
+        self.assertEqual(config['plotly_api_pool_size'], 5)
+        tools.reset_config_file()
+
     def test_set_config_file_two_entries(self):
 
         # Check set_config and get_config given only two entries return the
@@ -118,3 +118,21 @@ def test_pickle_layout(fig1):
 
     # Copied layout should have no parent
     assert copied_layout.parent is None
+
+
+def test_pickled_arrays_are_read_only():
+    np = pytest.importorskip('numpy')
+    fig = go.Figure(data=[go.Scatter(y=np.arange(3.0),
+                                     marker={'size': np.arange(3)})],
+                    frames=[{'data': [{'y': np.arange(3.0)}]}])
+
+    fig_copied = pickle.loads(pickle.dumps(fig))
+    assert not fig_copied.data[0].y.flags.writeable
+    assert not fig_copied.data[0].marker.size.flags.writeable
+    assert not fig_copied.frames[0]._props['data'][0]['y'].flags.writeable
+
+    with pytest.raises(ValueError):
+        fig_copied.data[0].y[0] = 99
+
+    trace_copied = pickle.loads(pickle.dumps(fig.data[0]))
+    assert not trace_copied.y.flags.writeable
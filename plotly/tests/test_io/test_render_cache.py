@@ -0,0 +1,115 @@
+import os
+import sys
+
+import pytest
+
+import plotly.graph_objs as go
+import plotly.io as pio
+import plotly.offline as offline
+
+if sys.version_info.major == 3 and sys.version_info.minor >= 3:
+    import tempfile
+else:
+    from backports import tempfile
+
+
+# fixtures
+# --------
+@pytest.fixture
+def cache_dir(request):
+    with tempfile.TemporaryDirectory() as dir_name:
+        yield dir_name
+
+
+@pytest.fixture
+def render_cache(request, cache_dir):
+    cache = pio.RenderCache(cache_dir)
+    pio.set_render_cache(cache)
+    yield cache
+    pio.set_render_cache(None)
+
+
+@pytest.fixture
+def fig1(request):
+    return go.Figure(data=[{'type': 'scatter', 'y': [1, 2]}],
+                     layout={'title': 'Figure title'},
+                     frames=[{'data': [{'y': [2, 1]}]}])
+
+
+# RenderCache
+# -----------
+def test_get_put(cache_dir):
+    cache = pio.RenderCache(cache_dir)
+    assert cache.get(('a', 'png')) is None
+    cache.put(('a', 'png'), b'image')
+    assert cache.get(('a', 'png')) == b'image'
+    assert pio.RenderCache(cache_dir).get(('a', 'png')) == b'image'
+
+    cache.clear()
+    assert cache.get(('a', 'png')) is None
+
+
+def test_evict_least_recently_used(cache_dir):
+    cache = pio.RenderCache(cache_dir, max_size=35)
+    for i, key in enumerate(['a', 'b', 'c']):
+        cache.put(key, b'0123456789')
+        os.utime(cache._entry_path(key), (i, i))
+
+    # Reading 'a' makes 'b' the least recently used entry
+    assert cache.get('a') == b'0123456789'
+    cache.put('d', b'0123456789')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == b'0123456789'
+    assert cache.get('c') == b'0123456789'
+    assert cache.get('d') == b'0123456789'
+
+
+def test_invalid_render_cache():
+    with pytest.raises(ValueError):
+        pio.RenderCache(max_size=0)
+
+    with pytest.raises(ValueError):
+        pio.set_render_cache('cache')
+
+
+# Exports
+# -------
+def test_to_json_cached(render_cache, fig1):
+    json_str = pio.to_json(fig1)
+    assert pio.to_json(go.Figure(fig1)) == json_str
+    assert len(os.listdir(render_cache.directory)) == 1
+
+    # Edits change the hash of the figure
+    fig1.layout.title = 'New title'
+    assert pio.to_json(fig1) != json_str
+    assert len(os.listdir(render_cache.directory)) == 2
+
+    # Cached JSON is returned without encoding the figure
+    render_cache.put((fig1.content_hash(), 'json', False), b'"cached"')
+    assert pio.to_json(fig1) == '"cached"'
+    assert pio.to_json(fig1, remove_uids=False) != '"cached"'
+    assert pio.to_json(fig1.to_dict()) != '"cached"'
+
+
+def test_offline_plot_cached(render_cache, fig1):
+    html = offline.plot(fig1, output_type='div', include_plotlyjs=False)
+    cached_html = offline.plot(fig1, output_type='div',
+                               include_plotlyjs=False)
+    assert len(os.listdir(render_cache.directory)) == 1
+
+    # Only the div ids differ
+    div_id = html.split('id="')[1].split('"')[0]
+    cached_div_id = cached_html.split('id="')[1].split('"')[0]
+    assert cached_html.replace(cached_div_id, div_id) == html
+    assert 'Plotly.addFrames' in cached_html
+
+
+def test_to_image_cached(render_cache, fig1):
+    # Cached images are returned without starting orca
+    key = (fig1.content_hash(), 'png', 700, 500, 1,
+           pio.orca.config.plotlyjs, pio.orca.config.mathjax,
+           pio.orca.config.topojson, pio.orca.config.mapbox_access_token)
+    render_cache.put(key, b'image')
+    assert pio.to_image(fig1, format='png', width=700, height=500,
+                        scale=1) == b'image'
@@ -27,6 +27,16 @@ def fig1(request):
                      layout={'title': 'Figure title'})
 
 
+@pytest.fixture
+def fig_frames(request):
+    return go.Figure(data=[{'type': 'scatter', 'y': [1, 2]}],
+                     layout={'title': 'Figure title'},
+                     frames=[{'data': [{'y': [3, float('nan')]}],
+                              'name': 'frame\n1'},
+                             {'data': [{'y': [2, 1]}],
+                              'layout': {'title': 'Frame title'}}])
+
+
 opts = {'separators': (',', ':'),
         'cls': plotly.utils.PlotlyJSONEncoder,
         'sort_keys': True}
@@ -72,6 +82,13 @@ def test_to_json_pretty_print(fig1):
         fig1, **pretty_opts)
 
 
+@pytest.mark.parametrize('pretty', [True, False])
+def test_to_json_frames(fig_frames, pretty):
+    # Frames are encoded one at a time
+    assert pio.to_json(fig_frames, remove_uids=False, pretty=pretty) == (
+        json.dumps(fig_frames, **(pretty_opts if pretty else opts)))
+
+
 # from_json
 # ---------
 def test_from_json(fig1):
@@ -193,9 +210,10 @@ def test_write_json_filelike(fig1, pretty, remove_uids):
     # write_json to mock file
     pio.write_json(fig1, filemock, pretty=pretty, remove_uids=remove_uids)
 
-    # check write contents
+    # check write contents, which may be written in pieces
     expected = pio.to_json(fig1, pretty=pretty, remove_uids=remove_uids)
-    filemock.write.assert_called_once_with(expected)
+    written = ''.join(args[0] for args, _ in filemock.write.call_args_list)
+    assert written == expected
 
 
 @pytest.mark.parametrize('pretty', [True, False])
@@ -32,6 +32,26 @@ class NumpyTestUtilsMixin(object):
         str_path = [repr(p) for p in path]
         return '[' + ']['.join(sp for sp in str_path) + ']'
 
+    def _arrays_equal(self, a1, a2):
+        """Array equality that considers nan (and NaT) values equal."""
+        a1 = np.asarray(a1)
+        a2 = np.asarray(a2)
+        if a1.shape != a2.shape:
+            return False
+        if a1.dtype.kind == 'M' or a2.dtype.kind == 'M':
+            # validators store dates as datetime objects (None for NaT).
+            # Compare the underlying integers, in which NaT equals NaT
+            dtype = a1.dtype if a1.dtype.kind == 'M' else a2.dtype
+            try:
+                a1 = a1.astype(dtype)
+                a2 = a2.astype(dtype)
+            except (TypeError, ValueError):
+                return False
+            return np.array_equal(a1.view('i8'), a2.view('i8'))
+        if a1.dtype.kind in 'iuf' and a2.dtype.kind in 'iuf':
+            return np.allclose(a1, a2, equal_nan=True)
+        return np.array_equal(a1, a2)
+
     def assert_fig_equal(self, d1, d2, msg=None, ignore=['uid']):
         """
         Helper function for assert_dict_equal
@@ -105,7 +125,7 @@ class NumpyTestUtilsMixin(object):
 
                 if (isinstance(val, np.ndarray) or
                         isinstance(comp_val, np.ndarray)):
-                    if np.array_equal(val, comp_val):
+                    if self._arrays_equal(val, comp_val):
                         continue
                 elif val == comp_val:
                     continue
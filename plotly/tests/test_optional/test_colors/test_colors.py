@@ -0,0 +1,73 @@
+from unittest import TestCase
+
+import numpy as np
+
+from plotly.exceptions import PlotlyError
+import plotly.colors as colors
+
+
+class TestSampleColorscale(TestCase):
+
+    def test_sample_colorscale_rgb(self):
+
+        # values are normalized from [low, high] and clamped to the scale
+        colorscale = [[0, 'rgb(0, 0, 0)'], [0.5, '#ff0000'],
+                      [1, 'rgb(255, 255, 255)']]
+        test_colors = colors.sample_colorscale(
+            colorscale, [-10, 0, 5, 10, 15, 20, 30], low=0, high=20
+        )
+        exp_colors = ['rgb(0, 0, 0)', 'rgb(0, 0, 0)', 'rgb(128, 0, 0)',
+                      'rgb(255, 0, 0)', 'rgb(255, 128, 128)',
+                      'rgb(255, 255, 255)', 'rgb(255, 255, 255)']
+        self.assertEqual(test_colors, exp_colors)
+
+    def test_sample_colorscale_array(self):
+
+        # evenly spread tuple colors are sampled into a uint8 array
+        test_array = colors.sample_colorscale(
+            [(0, 0, 0), (1, 0.5, 0), (1, 1, 1)], [0, 0.25, 0.5, 1],
+            colortype='array'
+        )
+        exp_array = np.array([[0, 0, 0], [128, 64, 0], [255, 128, 0],
+                              [255, 255, 255]], dtype=np.uint8)
+        self.assertEqual(test_array.dtype, np.uint8)
+        np.testing.assert_array_equal(test_array, exp_array)
+
+    def test_sample_colorscale_matches_find_intermediate_color(self):
+
+        # unrounded samples agree with find_intermediate_color
+        lowcolor, highcolor = 'rgb(10, 20, 30)', 'rgb(250, 100, 3)'
+        values = [0, 12.5, 33.3, 77.7, 100]
+        test_colors = colors.sample_colorscale(
+            [lowcolor, highcolor], values, high=100, colortype='float'
+        )
+        exp_colors = [
+            colors.find_intermediate_color(lowcolor, highcolor, value / 100.0,
+                                           colortype='rgb')
+            for value in values
+        ]
+        self.assertEqual([colors.label_rgb(c) for c in test_colors.tolist()],
+                         exp_colors)
+
+    def test_sample_colorscale_rgba_and_scale_name(self):
+
+        # alpha is interpolated and formatted as an 'rgba' color
+        test_colors = colors.sample_colorscale(
+            ['rgba(0, 0, 0, 0)', 'rgb(100, 100, 100)'], [0.5]
+        )
+        self.assertEqual(test_colors, ['rgba(50, 50, 50, 0.5)'])
+
+        # Plotly scale names are accepted as well
+        test_colors = colors.sample_colorscale('Greys', [0, 1])
+        self.assertEqual(test_colors, ['rgb(0, 0, 0)', 'rgb(255, 255, 255)'])
+
+    def test_sample_colorscale_errors(self):
+
+        self.assertRaises(PlotlyError, colors.sample_colorscale,
+                          'foo', [0.5])
+        self.assertRaises(PlotlyError, colors.sample_colorscale,
+                          [[0, 'rgb(0, 0, 0)'], [0.8, 'rgb(1, 1, 1)']], [0.5])
+        self.assertRaises(PlotlyError, colors.sample_colorscale,
+                          'Greys', [0.5], low=1, high=1)
+        self.assertRaises(PlotlyError, colors.sample_colorscale,
+                          'Greys', [0.5], colortype='hex')
@@ -1,3 +1,4 @@
+import math
 from unittest import TestCase
 from plotly import optional_imports
 from plotly.graph_objs import graph_objs as go
@@ -360,6 +361,51 @@ class TestDistplot(NumpyTestUtilsMixin, TestCase):
                                        'yaxis': 'y'}
             self.assert_fig_equal(dp['data'][1], expected_dp_data_hist_2)
 
+    def test_distplot_binned_kde(self):
+
+        # check: the binned kde closely matches the exact kde on the same
+        # grid, and curve_points sets the grid size
+
+        np.random.seed(0)
+        hist_data = [np.concatenate([np.random.randn(500),
+                                     np.random.randn(300) * 0.3 + 4])]
+
+        exact = ff.create_distplot(hist_data, ['a'], show_rug=False,
+                                   curve_points=200)
+        binned = ff.create_distplot(hist_data, ['a'], show_rug=False,
+                                    binned_kde=True, curve_points=200)
+
+        self.assertEqual(len(binned['data'][1]['x']), 200)
+        np.testing.assert_array_equal(binned['data'][1]['x'],
+                                      exact['data'][1]['x'])
+        np.testing.assert_allclose(binned['data'][1]['y'],
+                                   exact['data'][1]['y'],
+                                   atol=1e-3 * max(exact['data'][1]['y']))
+
+        self.assertRaises(PlotlyError, ff.create_distplot, [[1, 1, 1]],
+                          ['a'], binned_kde=True)
+
+    def test_distplot_max_rug_points(self):
+
+        # check: large rugs are subsampled along with their text
+
+        np.random.seed(0)
+        data = np.random.randn(1000)
+        text = ['t{}'.format(i) for i in range(1000)]
+
+        dp = ff.create_distplot([data], ['a'], rug_text=[text],
+                                max_rug_points=100)
+        rug = dp['data'][2]
+
+        self.assertEqual(len(rug['x']), 100)
+        self.assertEqual(len(rug['y']), 100)
+        indices = [int(t[1:]) for t in rug['text']]
+        self.assertEqual(indices, sorted(indices))
+        np.testing.assert_array_equal(rug['x'], data[indices])
+
+        dp = ff.create_distplot([data[:50]], ['a'], max_rug_points=100)
+        self.assertEqual(len(dp['data'][2]['x']), 50)
+
 
 class TestStreamline(TestCase):
 
@@ -787,6 +833,40 @@ class TestDendrogram(NumpyTestUtilsMixin, TestCase):
         self.assertEqual(len(dendro.layout.xaxis.ticktext), 4)
         self.assertEqual(len(dendro.layout.xaxis.tickvals), 4)
 
+    def test_dendrogram_merge_links(self):
+        np.random.seed(0)
+        X = np.random.rand(50, 4)
+        dendro = ff.create_dendrogram(X)
+        merged_dendro = ff.create_dendrogram(X, merge_links=True)
+
+        # one trace per link color
+        link_colors = [trace['marker']['color'] for trace in dendro['data']]
+        self.assertEqual(len(merged_dendro['data']), len(set(link_colors)))
+
+        # every link is drawn, followed by a nan separator
+        for merged_trace in merged_dendro['data']:
+            color = merged_trace['marker']['color']
+            links = [trace for trace in dendro['data']
+                     if trace['marker']['color'] == color]
+            exp_x = np.concatenate([np.append(trace['x'], np.nan)
+                                    for trace in links])
+            exp_y = np.concatenate([np.append(trace['y'], np.nan)
+                                    for trace in links])
+            np.testing.assert_array_equal(merged_trace['x'], exp_x)
+            np.testing.assert_array_equal(merged_trace['y'], exp_y)
+
+        self.assert_fig_equal(merged_dendro['layout'], dendro['layout'])
+
+    def test_dendrogram_truncate(self):
+        np.random.seed(0)
+        X = np.random.rand(50, 4)
+        dendro = ff.create_dendrogram(X, truncate_mode='lastp', p=10)
+
+        # p leaves are left, joined by p - 1 links
+        self.assertEqual(len(dendro['data']), 9)
+        self.assertEqual(len(dendro['layout']['xaxis']['tickvals']), 10)
+
+
 class TestTrisurf(NumpyTestUtilsMixin, TestCase):
 
     def test_vmin_and_vmax(self):
@@ -986,6 +1066,78 @@ class TestTrisurf(NumpyTestUtilsMixin, TestCase):
         self.assertTrue(isinstance(test_colors_plot['data'][0]['facecolor'][0],
                                    str))
 
+    def test_map_faces2color_matches_map_face2color(self):
+
+        # the vectorized face coloring must agree with the per-face one
+        from plotly.figure_factory._trisurf import (map_face2color,
+                                                    map_faces2color)
+        faces = np.linspace(-2, 3, 101)
+        colormap = [(0.1, 0.2, 0.3), (0.9, 0.5, 0.1), (0.3, 0.3, 1.0)]
+
+        for scale in [None, [0, 0.2, 1]]:
+            exp_colors = [map_face2color(face, colormap, scale, -2, 3)
+                          for face in faces]
+            test_colors = map_faces2color(faces, colormap, scale, -2, 3)
+            self.assertListEqual(list(test_colors), exp_colors)
+
+    def test_trisurf_use_intensity(self):
+
+        # check that intensity mode colors the mesh through its colorscale
+        u = np.linspace(-1, 1, 3)
+        v = np.linspace(-1, 1, 3)
+        u, v = np.meshgrid(u, v)
+        x = u.flatten()
+        y = v.flatten()
+        z = x*y
+
+        simplices = Delaunay(np.vstack([x, y]).T).simplices
+
+        test_trisurf_plot = ff.create_trisurf(
+            x, y, z, simplices, use_intensity=True, plot_edges=False
+        )
+        self.assertEqual(len(test_trisurf_plot['data']), 1)
+
+        mesh = test_trisurf_plot['data'][0]
+        self.assertIsNone(mesh.facecolor)
+        self.assertTrue(np.allclose(mesh.intensity, z))
+        self.assertEqual(mesh.colorscale,
+                         ((0.0, 'rgb(31, 119, 180)'),
+                          (1.0, 'rgb(255, 127, 14)')))
+        self.assertTrue(mesh.showscale)
+
+        # a color function is evaluated at the vertices
+        test_trisurf_plot = ff.create_trisurf(
+            x, y, z, simplices, use_intensity=True,
+            color_func=lambda x, y, z: x + y
+        )
+        self.assertTrue(np.allclose(test_trisurf_plot['data'][0].intensity,
+                                    x + y))
+
+        # scalar-only color functions are evaluated one vertex at a time
+        calls = []
+
+        def scalar_color_func(x, y, z):
+            calls.append(1)
+            return math.sqrt(x ** 2 + y ** 2)
+
+        test_trisurf_plot = ff.create_trisurf(
+            x, y, z, simplices, use_intensity=True,
+            color_func=scalar_color_func
+        )
+        self.assertTrue(np.allclose(test_trisurf_plot['data'][0].intensity,
+                                    np.sqrt(x ** 2 + y ** 2)))
+        # one failed call with arrays per pass over the triangle vertices
+        # and the points, then one call per vertex
+        self.assertEqual(len(calls), 2 + 3 * len(simplices) + len(x))
+
+        # errors other than TypeError and ValueError are not swallowed
+        def failing_color_func(x, y, z):
+            raise RuntimeError('bad color function')
+
+        self.assertRaisesRegexp(RuntimeError, 'bad color function',
+                                ff.create_trisurf, x, y, z, simplices,
+                                color_func=failing_color_func)
+
 
 class TestScatterPlotMatrix(NumpyTestUtilsMixin, TestCase):
 
@@ -1313,8 +1465,101 @@ class TestScatterPlotMatrix(NumpyTestUtilsMixin, TestCase):
                                exp_scatter_plot_matrix['layout'])
 
 
+    def test_scatter_plot_matrix_sequential_colormap(self):
+
+        # index groups get colors evenly spread between the two colors of a
+        # sequential colormap, also if there is a single group
+        df = pd.DataFrame([[2, 'Apple'], [6, 'Pear'], [-15, 'Plum'],
+                           [5, 'Pear']], columns=['Numbers', 'Fruit'])
+        df['Other'] = np.arange(4.)
+        colormap = ['rgb(0, 0, 100)', 'rgb(100, 0, 0)']
+
+        for use_splom in (False, True):
+            fig = ff.create_scatterplotmatrix(
+                df, index='Fruit', colormap=colormap, colormap_type='seq',
+                use_splom=use_splom)
+            marker_colors = {}
+            for trace in fig['data']:
+                marker_colors.setdefault(trace.name, trace.marker.color)
+            self.assertEqual(marker_colors, {
+                'Apple': 'rgb(0.0, 0.0, 100.0)',
+                'Pear': 'rgb(50.0, 0.0, 50.0)',
+                'Plum': 'rgb(100.0, 0.0, 0.0)'})
+
+            fig = ff.create_scatterplotmatrix(
+                df[df['Fruit'] == 'Pear'], index='Fruit', colormap=colormap,
+                colormap_type='seq', use_splom=use_splom)
+            self.assertEqual(fig['data'][0].marker.color,
+                             'rgb(0.0, 0.0, 100.0)')
+
+    def test_scatter_plot_matrix_splom(self):
+
+        # check that each column is held once by a single splom trace
+        df = pd.DataFrame([[2, 'Apple'], [6, 'Pear'],
+                           [-15, 'Apple'], [5, 'Pear'],
+                           [-2, 'Apple'], [0, 'Apple']],
+                          columns=['Numbers', 'Fruit'])
+        df['Other'] = np.arange(6.)
+
+        test_scatter_plot_matrix = ff.create_scatterplotmatrix(
+            df.drop('Fruit', axis=1), use_splom=True, size=4
+        )
+        self.assertEqual(len(test_scatter_plot_matrix['data']), 1)
+        splom = test_scatter_plot_matrix['data'][0]
+        self.assertEqual(splom.type, 'splom')
+        self.assertEqual([d.label for d in splom.dimensions],
+                         ['Numbers', 'Other'])
+        np.testing.assert_array_equal(splom.dimensions[0]['values'],
+                                      [2, 6, -15, 5, -2, 0])
+        self.assertTrue(splom.diagonal.visible)
+        self.assertEqual(splom.marker.size, 4)
+        self.assertEqual(test_scatter_plot_matrix['layout']['xaxis1'].title,
+                         'Numbers')
+
+        # one splom trace per index group, histograms on the diagonal
+        test_scatter_plot_matrix = ff.create_scatterplotmatrix(
+            df, index='Fruit', diag='histogram', use_splom=True,
+            colormap=['rgb(140, 255, 50)', 'rgb(170, 60, 115)']
+        )
+        data = test_scatter_plot_matrix['data']
+        self.assertEqual([trace.type for trace in data],
+                         ['splom', 'histogram', 'histogram'] * 2)
+        self.assertEqual([trace.name for trace in data],
+                         ['Apple'] * 3 + ['Pear'] * 3)
+        self.assertFalse(data[0].diagonal.visible)
+        self.assertEqual(data[0].marker.color, 'rgb(140, 255, 50)')
+        self.assertEqual(data[3].marker.color, 'rgb(170, 60, 115)')
+        np.testing.assert_array_equal(data[3].dimensions[0]['values'],
+                                      [6, 5])
+        self.assertEqual((data[1].xaxis, data[1].yaxis), ('x3', 'y3'))
+        layout = test_scatter_plot_matrix['layout']
+        self.assertEqual(layout['yaxis3'].domain, layout['yaxis1'].domain)
+        self.assertEqual(layout['barmode'], 'stack')
+
+
 class TestGantt(NumpyTestUtilsMixin, TestCase):
 
+    def test_index_colors(self):
+
+        # numeric index values are interpolated between the two colors, and
+        # values outside of 0-100 extrapolate them
+        df = [dict(Task='Job A', Start='2009-01-01', Finish='2009-02-01',
+                   Complete=complete) for complete in (0, 25, 100)]
+        colors = ['rgb(0, 0, 100)', 'rgb(100, 0, 0)']
+        fig = ff.create_gantt(df, colors=colors, index_col='Complete')
+        self.assertEqual([shape['fillcolor']
+                          for shape in fig['layout']['shapes']],
+                         ['rgb(0.0, 0.0, 100.0)', 'rgb(25.0, 0.0, 75.0)',
+                          'rgb(100.0, 0.0, 0.0)'])
+
+        df.append(dict(Task='Job B', Start='2009-01-01',
+                       Finish='2009-02-01', Complete=150))
+        fig = ff.create_gantt(df, colors=colors, index_col='Complete')
+        self.assertEqual(fig['layout']['shapes'][1]['fillcolor'],
+                         'rgb(25.0, 0.0, 75.0)')
+        self.assertEqual(fig['layout']['shapes'][3]['fillcolor'],
+                         'rgb(150.0, 0.0, -50.0)')
+
     def test_df_dataframe(self):
 
         # validate dataframe has correct column names
@@ -1403,6 +1648,46 @@ class TestGantt(NumpyTestUtilsMixin, TestCase):
         self.assert_fig_equal(test_gantt_chart['layout'],
                                exp_gantt_chart['layout'])
 
+    def test_gantt_use_scatter_fill(self):
+
+        # check: bars of the same color are merged into one filled scatter
+        # trace and hover points into a single marker trace
+
+        df = pd.DataFrame([['Job A', '2009-01-01', '2009-02-28', 'x', 'a'],
+                           ['Job B', '2009-03-05', '2009-04-15', 'y', 'b'],
+                           ['Job A', '2009-05-01', '2009-06-01', 'x', 'c']],
+                          columns=['Task', 'Start', 'Finish', 'Resource',
+                                   'Description'])
+
+        fig = ff.create_gantt(df, index_col='Resource',
+                              colors=['rgb(1, 2, 3)', 'rgb(4, 5, 6)'],
+                              group_tasks=True, use_scatter_fill=True)
+
+        self.assertEqual(fig['layout']['shapes'], [])
+        self.assertEqual(fig['layout']['yaxis']['ticktext'],
+                         ['Job B', 'Job A'])
+        self.assertEqual(len(fig['data']), 3)
+
+        bars_x, bars_y, hover = fig['data']
+        self.assertEqual(bars_x['fill'], 'toself')
+        self.assertEqual(bars_x['fillcolor'], 'rgb(1, 2, 3)')
+        self.assertEqual(list(bars_x['x']),
+                         ['2009-01-01', '2009-02-28', '2009-02-28',
+                          '2009-01-01', '2009-01-01', None,
+                          '2009-05-01', '2009-06-01', '2009-06-01',
+                          '2009-05-01', '2009-05-01'])
+        np.testing.assert_allclose(bars_x['y'],
+                                   [0.8, 0.8, 1.2, 1.2, 0.8, np.nan,
+                                    0.8, 0.8, 1.2, 1.2, 0.8])
+        self.assertEqual(bars_y['fillcolor'], 'rgb(4, 5, 6)')
+        np.testing.assert_allclose(bars_y['y'],
+                                   [-0.2, -0.2, 0.2, 0.2, -0.2])
+
+        self.assertEqual(hover['mode'], 'markers')
+        self.assertEqual(list(hover['y']), [1, 1, 0, 0, 1, 1])
+        self.assertEqual(list(hover['text']),
+                         ['a', 'a', 'b', 'b', 'c', 'c'])
+
 
 class TestViolin(NumpyTestUtilsMixin, TestCase):
 
@@ -1994,6 +2279,34 @@ class TestViolin(NumpyTestUtilsMixin, TestCase):
         self.assert_fig_equal(test_violin['layout'],
                               exp_violin['layout'])
 
+    def test_violin_binned_kde_and_max_rug_points(self):
+
+        # check: the binned kde is close to the exact one and large rugs
+        # are subsampled
+
+        np.random.seed(0)
+        df = pd.DataFrame(dict(Score=np.random.randn(2000),
+                               Group=np.repeat(['b', 'a'], 1000)))
+
+        exact_violin = ff.create_violin(df, data_header='Score',
+                                        group_header='Group')
+        binned_violin = ff.create_violin(df, data_header='Score',
+                                         group_header='Group',
+                                         binned_kde=True, max_rug_points=100)
+
+        self.assertEqual(len(exact_violin['data']),
+                         len(binned_violin['data']))
+        for exact, binned in zip(exact_violin['data'][:5],
+                                 binned_violin['data'][:5]):
+            np.testing.assert_allclose(binned['x'], exact['x'], atol=5e-3)
+            np.testing.assert_array_equal(binned['y'], exact['y'])
+
+        # groups keep their order of appearance
+        self.assertEqual(binned_violin['layout']['xaxis1']['title'], 'b')
+        rug = binned_violin['data'][5]
+        self.assertEqual(len(rug['y']), 100)
+        self.assertTrue(set(rug['y']) <= set(df['Score'][:1000]))
+
 
 class TestFacetGrid(NumpyTestUtilsMixin, TestCase):
 
@@ -2217,6 +2530,39 @@ class TestFacetGrid(NumpyTestUtilsMixin, TestCase):
             exp_facet_grid['layout']
         )
 
+    def test_facet_grid_color_groups(self):
+        df = pd.DataFrame({'a': [1, 2, 3, 4, 5, 6],
+                           'b': [6, 5, 4, 3, 2, 1],
+                           'row': ['r1', 'r1', 'r1', 'r2', 'r2', 'r2'],
+                           'col': ['c1', 'c2', 'c1', 'c1', 'c1', 'c1'],
+                           'cat': ['x', 'y', 'y', 'x', 'x', 'y'],
+                           'num': [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]})
+
+        # one trace per facet cell and color, in order of appearance
+        test_facet_grid = ff.create_facet_grid(
+            df, x='a', y='b', facet_row='row', facet_col='col',
+            color_name='cat'
+        )
+        data = test_facet_grid['data']
+        self.assertEqual([trace.name for trace in data], ['x', 'y'] * 4)
+        np.testing.assert_array_equal(data[0].x, [1])
+        np.testing.assert_array_equal(data[1].x, [3])
+        np.testing.assert_array_equal(data[2].x, [])
+        np.testing.assert_array_equal(data[3].x, [2])
+        np.testing.assert_array_equal(data[4].x, [4, 5])
+
+        # the cell (r2, c2) has no data
+        self.assertEqual(data[6].x, (None,))
+        self.assertFalse(data[6].showlegend)
+
+        # numerical colors follow the points of each facet
+        test_facet_grid = ff.create_facet_grid(
+            df, x='a', y='b', facet_col='row', color_name='num'
+        )
+        data = test_facet_grid['data']
+        np.testing.assert_array_equal(data[0].marker.color, [0.1, 0.2, 0.3])
+        np.testing.assert_array_equal(data[1].marker.color, [0.4, 0.5, 0.6])
+
 
 class TestBullet(NumpyTestUtilsMixin, TestCase):
 
@@ -2856,7 +3202,42 @@ class TestChoropleth(NumpyTestUtilsMixin, TestCase):
                 -85.10533699999999
             ]
 
-            self.assertEqual(fig['data'][2]['x'][:50], exp_fig_head)
+            np.testing.assert_array_equal(fig['data'][2]['x'][:50],
+                                          exp_fig_head)
+
+        def test_persisted_geometry_cache(self):
+            import os
+            import shutil
+            import tempfile
+
+            from plotly.figure_factory import _county_choropleth
+
+            fips = [1001, 1003, 6001]
+            values = [1, 2, 3]
+            exp_fig = ff.create_choropleth(fips=fips, values=values,
+                                           simplify_county=1)
+
+            cache_dir = tempfile.mkdtemp()
+            try:
+                ff.create_choropleth(fips=fips, values=values,
+                                     simplify_county=1,
+                                     geometry_cache_dir=cache_dir)
+                self.assertTrue(os.path.exists(
+                    os.path.join(cache_dir, 'county_geometry_1.npz')
+                ))
+
+                # a fresh process only has the files on disk
+                _county_choropleth._geometry_cache.clear()
+                fig = ff.create_choropleth(fips=fips, values=values,
+                                           simplify_county=1,
+                                           geometry_cache_dir=cache_dir)
+                self.assertNotIn('dfs', _county_choropleth._geometry_cache)
+            finally:
+                shutil.rmtree(cache_dir)
+
+            for trace, exp_trace in zip(fig['data'], exp_fig['data']):
+                np.testing.assert_array_equal(trace['x'], exp_trace['x'])
+                np.testing.assert_array_equal(trace['y'], exp_trace['y'])
 
 class TestQuiver(TestCase):
 
@@ -30,3 +30,12 @@ class TestDataframeToGrid(TestCase):
 
         with self.assertRaisesRegexp(InputError, expected_message):
             Grid(df)
+
+    def test_columns_are_lists(self):
+        df = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}, columns=['a', 'b'])
+        grid = Grid(df)
+
+        self.assertEqual(grid[0].data, [1, 2])
+        self.assertIsInstance(grid[0].data, list)
+        grid[0].data.append(3)
+        self.assertEqual(df['a'].tolist(), [1, 2])
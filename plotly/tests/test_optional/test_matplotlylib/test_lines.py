@@ -11,6 +11,7 @@ matplotlylib = optional_imports.get_module('plotly.matplotlylib')
 
 if matplotlylib:
     import matplotlib
+    import numpy as np
 
     # Force matplotlib to not use any Xwindows backend.
     matplotlib.use('Agg')
@@ -50,3 +51,24 @@ def test_complicated_line():
     equivalent, msg = compare_dict(renderer.plotly_fig['layout'],
                                    COMPLICATED_LINE['layout'])
     assert equivalent, msg
+
+
+@attr('matplotlib')
+def test_scaled_up_line():
+    # the simple line fixture, repeated to 120k points
+    reps = 20000
+    fig, ax = plt.subplots()
+    ax.plot(np.tile(D['x1'], reps), np.tile(D['y1'], reps), label='simple')
+    # agg can't draw such long paths in one go
+    with matplotlib.rc_context({'agg.path.chunksize': 10000}):
+        renderer = run_fig(fig)
+    trace = renderer.plotly_fig['data'][0]
+    expected = SIMPLE_LINE['data'][0]
+
+    # coordinates are passed through as numpy arrays
+    assert isinstance(trace['x'], np.ndarray)
+    np.testing.assert_array_equal(trace['x'], np.tile(expected['x'], reps))
+    np.testing.assert_array_equal(trace['y'], np.tile(expected['y'], reps))
+    equivalent, msg = compare_dict(trace['line'].to_plotly_json(),
+                                   expected['line'].to_plotly_json())
+    assert equivalent, msg
@@ -11,6 +11,7 @@ matplotlylib = optional_imports.get_module('plotly.matplotlylib')
 
 if matplotlylib:
     import matplotlib
+    import numpy as np
 
     # Force matplotlib to not use any Xwindows backend.
     matplotlib.use('Agg')
@@ -24,10 +25,9 @@ def test_simple_scatter():
     renderer = run_fig(fig)
     for data_no, data_dict in enumerate(renderer.plotly_fig['data']):
         d1, d2 = strip_dict_params(data_dict, SIMPLE_SCATTER['data'][data_no], ignore=['uid'])
-        print(d1)
-        print('\n')
-        print(d2)
-        assert d1 == d2
+
+        equivalent, msg = compare_dict(d1, d2)
+        assert equivalent, msg
 
     equivalent, msg = compare_dict(renderer.plotly_fig['layout'],
                                    SIMPLE_SCATTER['layout'])
@@ -42,11 +42,43 @@ def test_double_scatter():
     renderer = run_fig(fig)
     for data_no, data_dict in enumerate(renderer.plotly_fig['data']):
         d1, d2 = strip_dict_params(data_dict, DOUBLE_SCATTER['data'][data_no], ignore=['uid'])
-        print(d1)
-        print('\n')
-        print(d2)
-        assert d1 == d2
+
+        equivalent, msg = compare_dict(d1, d2)
+        assert equivalent, msg
 
     equivalent, msg = compare_dict(renderer.plotly_fig['layout'],
                                    DOUBLE_SCATTER['layout'])
     assert equivalent, msg
+
+
+@attr('matplotlib')
+def test_scatter_with_point_colors_and_sizes():
+    fig, ax = plt.subplots()
+    ax.scatter([1, 2, 3, 4], [4, 3, 2, 1], c=['red', 'blue', 'red', 'blue'],
+               s=[4, 9, 16, 25])
+    renderer = run_fig(fig)
+    marker = renderer.plotly_fig['data'][0]['marker']
+    assert list(renderer.plotly_fig['data'][0]['x']) == [1., 2., 3., 4.]
+    assert list(renderer.plotly_fig['data'][0]['y']) == [4., 3., 2., 1.]
+    assert list(marker['color']) == ['rgba(255,0,0,1.0)', 'rgba(0,0,255,1.0)',
+                                     'rgba(255,0,0,1.0)', 'rgba(0,0,255,1.0)']
+    assert list(marker['size']) == [2., 3., 4., 5.]
+
+
+@attr('matplotlib')
+def test_scaled_up_scatter():
+    # the simple scatter fixture, repeated to 110k points
+    reps = 10000
+    fig, ax = plt.subplots()
+    ax.scatter(np.tile(D['x1'], reps), np.tile(D['y1'], reps))
+    renderer = run_fig(fig)
+    trace = renderer.plotly_fig['data'][0]
+    expected = SIMPLE_SCATTER['data'][0]
+
+    # coordinates are passed through as numpy arrays
+    assert isinstance(trace['x'], np.ndarray)
+    np.testing.assert_array_equal(trace['x'], np.tile(expected['x'], reps))
+    np.testing.assert_array_equal(trace['y'], np.tile(expected['y'], reps))
+    equivalent, msg = compare_dict(trace['marker'].to_plotly_json(),
+                                   expected['marker'].to_plotly_json())
+    assert equivalent, msg
@@ -2,8 +2,11 @@ import math
 from unittest import TestCase
 
 import datetime
+import json
+import numpy as np
 import plotly.figure_factory as ff
 
+from plotly import utils
 from plotly.exceptions import PlotlyError
 from plotly.tests.test_optional.optional_utils import NumpyTestUtilsMixin
 from plotly.graph_objs import graph_objs
@@ -252,8 +255,8 @@ class TestFinanceCharts(TestCase, NumpyTestUtilsMixin):
 
         expected_ohlc = {'layout': {'hovermode': 'closest',
                                     'xaxis': {'zeroline': False}},
-                         'data': [{'y': [33.0, 33.0, 33.2, 32.7,
-                                         33.1, 33.1, None],
+                         'data': [{'y': np.array([33.0, 33.0, 33.2, 32.7,
+                                                  33.1, 33.1, np.nan]),
                                    'line': {'width': 1,
                                             'color': '#3D9970'},
                                    'showlegend': False,
@@ -261,13 +264,14 @@ class TestFinanceCharts(TestCase, NumpyTestUtilsMixin):
                                    'text': ['Open', 'Open', 'High', 'Low',
                                             'Close', 'Close', ''],
                                    'mode': 'lines', 'type': 'scatter',
-                                   'x': [-0.2, 0, 0, 0, 0, 0.2, None]},
-                                  {'y': [], 'line': {'width': 1,
+                                   'x': np.array([-0.2, 0, 0, 0, 0, 0.2,
+                                                  np.nan])},
+                                  {'y': np.array([]), 'line': {'width': 1,
                                                      'color': '#FF4136'},
                                    'showlegend': False,
                                    'name': 'Decreasing', 'text': (),
                                    'mode': 'lines', 'type': 'scatter',
-                                   'x': []}]}
+                                   'x': np.array([])}]}
 
         self.assert_fig_equal(ohlc['data'][0],
                               expected_ohlc['data'][0],
@@ -298,9 +302,10 @@ class TestFinanceCharts(TestCase, NumpyTestUtilsMixin):
                                         'text': ['Open', 'Open', 'High',
                                                  'Low', 'Close', 'Close', ''],
                                         'type': 'scatter',
-                                        'x': [-0.2, 0, 0, 0, 0, 0.2, None],
-                                        'y': [33.0, 33.0, 33.2, 32.7, 33.1,
-                                              33.1, None]}],
+                                        'x': np.array([-0.2, 0, 0, 0, 0, 0.2,
+                                                       np.nan]),
+                                        'y': np.array([33.0, 33.0, 33.2, 32.7,
+                                                       33.1, 33.1, np.nan])}],
                               'layout': {'hovermode': 'closest',
                                          'xaxis': {'zeroline': False}}}
         self.assert_fig_equal(ohlc_incr['data'][0], expected_ohlc_incr['data'][0])
@@ -324,9 +329,10 @@ class TestFinanceCharts(TestCase, NumpyTestUtilsMixin):
                                         'text': ['Open', 'Open', 'High', 'Low',
                                                  'Close', 'Close', ''],
                                         'type': 'scatter',
-                                        'x': [-0.2, 0, 0, 0, 0, 0.2, None],
-                                        'y': [33.0, 33.0, 33.2, 30.7, 31.1,
-                                              31.1, None]}],
+                                        'x': np.array([-0.2, 0, 0, 0, 0, 0.2,
+                                                       np.nan]),
+                                        'y': np.array([33.0, 33.0, 33.2, 30.7,
+                                                       31.1, 31.1, np.nan])}],
                               'layout': {'hovermode': 'closest',
                                          'xaxis': {'zeroline': False}}}
 
@@ -570,6 +576,11 @@ class TestFinanceCharts(TestCase, NumpyTestUtilsMixin):
                                      None]}],
                      'layout': {'hovermode': 'closest',
                                 'xaxis': {'zeroline': False}}}
+        # gaps between the sticks are NaT and nan values
+        for trace in ex_ohlc_d['data']:
+            trace['x'] = np.array(trace['x'], dtype='datetime64[us]')
+            trace['y'] = np.array(trace['y'], dtype=float)
+
         self.assert_fig_equal(ohlc_d['data'][0], ex_ohlc_d['data'][0])
         self.assert_fig_equal(ohlc_d['data'][1], ex_ohlc_d['data'][1])
         self.assert_fig_equal(ohlc_d['layout'], ex_ohlc_d['layout'])
@@ -711,6 +722,51 @@ class TestFinanceCharts(TestCase, NumpyTestUtilsMixin):
         self.assert_fig_equal(candle['data'][1], exp_candle['data'][1])
         self.assert_fig_equal(candle['layout'], exp_candle['layout'])
 
+    def test_datetime64_ohlc_and_candlestick(self):
+
+        # Check datetime64 dates and ndarray values give the same charts as
+        # lists of datetime objects, and that missing close values are
+        # skipped by the ohlc chart
+
+        open_data = [33.01, 33.31, 33.50, 32.06, 34.12]
+        high_data = [34.20, 34.37, 33.62, 34.25, 35.18]
+        low_data = [31.70, 30.75, 32.87, 31.62, 30.81]
+        close_data = [34.10, 31.93, 33.37, 33.18, 31.18]
+        x = [datetime.datetime(year=2013, month=3, day=4),
+             datetime.datetime(year=2013, month=3, day=6),
+             datetime.datetime(year=2013, month=3, day=7),
+             datetime.datetime(year=2013, month=3, day=11),
+             datetime.datetime(year=2013, month=3, day=12)]
+        x64 = np.array(x, dtype='datetime64[ns]')
+
+        for create in (ff.create_ohlc, ff.create_candlestick):
+            fig = create(open_data, high_data, low_data, close_data,
+                         dates=x)
+            fig64 = create(np.array(open_data), np.array(high_data),
+                           np.array(low_data), np.array(close_data),
+                           dates=x64)
+            for trace, trace64 in zip(fig['data'], fig64['data']):
+                self.assert_fig_equal(trace, trace64)
+
+        ohlc = ff.create_ohlc(open_data, high_data, low_data,
+                              close_data[:3] + [np.nan, 31.18], dates=x64)
+        self.assertEqual(len(ohlc['data'][0]['x']), 7)
+        self.assertEqual(len(ohlc['data'][1]['x']), 21)
+        self.assertEqual(ohlc['data'][0]['x'][0],
+                         datetime.datetime(year=2013, month=3, day=3,
+                                           hour=19, minute=12))
+        self.assertEqual(ohlc['data'][1]['y'][-2], 31.18)
+
+        # the gaps are nan in float arrays (and NaT in dates), which are
+        # serialized as null
+        trace = ohlc['data'][0]
+        self.assertEqual(trace['y'].dtype, np.dtype(float))
+        trace_json = json.loads(json.dumps(trace,
+                                           cls=utils.PlotlyJSONEncoder))
+        self.assertEqual(trace_json['x'][0], '2013-03-03 19:12:00')
+        self.assertIsNone(trace_json['x'][6])
+        self.assertIsNone(trace_json['y'][6])
+
 
 class TestAnnotatedHeatmap(TestCase, NumpyTestUtilsMixin):
 
@@ -891,6 +947,24 @@ class TestAnnotatedHeatmap(TestCase, NumpyTestUtilsMixin):
         self.assert_fig_equal(a['layout'],
                               expected_a['layout'])
 
+    def test_annotated_heatmap_numpy_font_colors(self):
+
+        # check: numpy and list z pick the same contrast color per cell
+        # from the z mid value
+
+        import numpy as np
+        z = [[0, 1.5, 3], [4, 5.5, -2]]
+        a_list = ff.create_annotated_heatmap(z)
+        a_np = ff.create_annotated_heatmap(np.array(z))
+
+        expected_colors = ['#FFFFFF', '#FFFFFF', '#000000',
+                           '#000000', '#000000', '#FFFFFF']
+        for fig in (a_list, a_np):
+            colors = [ann['font']['color']
+                      for ann in fig['layout']['annotations']]
+            self.assertEqual(colors, expected_colors)
+        self.assertEqual(a_list['layout']['annotations'][1]['text'], '1.5')
+
 
 class TestTable(TestCase, NumpyTestUtilsMixin):
 
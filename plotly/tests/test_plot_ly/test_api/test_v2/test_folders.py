@@ -10,7 +10,7 @@ class FoldersTest(PlotlyApiTestCase):
         super(FoldersTest, self).setUp()
 
         # Mock the actual api call, we don't want to do network tests here.
-        self.request_mock = self.mock('plotly.api.v2.utils.requests.request')
+        self.request_mock = self.mock('plotly.api.v2.utils.requests.Session.request')
         self.request_mock.return_value = self.get_response()
 
         # Mock the validation function since we can test that elsewhere.
@@ -1,7 +1,11 @@
 from __future__ import absolute_import
 
+import threading
+from functools import partial
+
 from requests.compat import json as _json
 from requests.exceptions import ConnectionError
+from six.moves import BaseHTTPServer, socketserver
 
 from plotly import version
 from plotly.api.utils import to_native_utf8_string
@@ -191,7 +195,7 @@ class RequestTest(PlotlyApiTestCase):
         super(RequestTest, self).setUp()
 
         # Mock the actual api call, we don't want to do network tests here.
-        self.request_mock = self.mock('plotly.api.v2.utils.requests.request')
+        self.request_mock = self.mock('plotly.api.v2.utils.requests.Session.request')
         self.request_mock.return_value = self.get_response()
 
         # Mock the validation function since we can test that elsewhere.
@@ -250,3 +254,81 @@ class RequestTest(PlotlyApiTestCase):
 
         utils.request(self.method, self.url)
         assert self.request_mock.call_count == 1
+
+
+class _ThreadingServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class PooledRequestTest(PlotlyApiTestCase):
+
+    # Make real requests against a local server which counts the requests
+    # it gets and the connections they come in on.
+
+    def setUp(self):
+        super(PooledRequestTest, self).setUp()
+        utils._session = None
+        self.connections = []
+        self.paths = []
+        test = self
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+                test.connections.append(self.client_address)
+
+            def do_GET(self):
+                test.paths.append(self.path)
+                status = 404 if self.path == '/missing' else 200
+                content = _json.dumps({'path': self.path}).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = _ThreadingServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.url = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+
+    def tearDown(self):
+        utils.get_session().close()
+        utils._session = None
+        self.server.shutdown()
+        self.server.server_close()
+        super(PooledRequestTest, self).tearDown()
+
+    def test_connection_is_reused(self):
+        for i in range(5):
+            response = utils.request('get', '{}/{}'.format(self.url, i))
+            self.assertEqual(response.json(), {'path': '/{}'.format(i)})
+        self.assertEqual(len(self.paths), 5)
+        self.assertEqual(len(self.connections), 1)
+
+    def test_pool_size(self):
+        session = utils.get_session(2)
+        self.assertIs(utils.get_session(2), session)
+        self.assertIsNot(utils.get_session(3), session)
+
+    def test_request_all(self):
+        calls = [partial(utils.request, 'get', '{}/{}'.format(self.url, i))
+                 for i in range(20)]
+        responses = utils.request_all(calls, max_workers=4)
+        self.assertEqual([response.json()['path'] for response in responses],
+                         ['/{}'.format(i) for i in range(20)])
+        self.assertEqual(len(self.paths), 20)
+        self.assertTrue(len(self.connections) <= 4)
+
+    def test_request_all_error(self):
+        calls = [partial(utils.request, 'get', self.url + path)
+                 for path in ['/1', '/missing', '/2']]
+        self.assertRaises(PlotlyRequestError, utils.request_all, calls)
+        self.assertEqual(sorted(self.paths), ['/1', '/2', '/missing'])
+        self.assertEqual(utils.request_all([]), [])
@@ -0,0 +1,129 @@
+"""
+test_chunked_upload:
+====================
+
+Chunked grid uploads against a stand-in for the grids api.
+
+"""
+from __future__ import absolute_import
+
+from requests.compat import json as _json
+
+import plotly.plotly as py
+from plotly.exceptions import PlotlyError, PlotlyRequestError
+from plotly.grid_objs import Column, Grid
+from plotly.tests.test_plot_ly.test_api import PlotlyApiTestCase
+
+
+class ChunkedGridUploadTest(PlotlyApiTestCase):
+
+    def setUp(self):
+        super(ChunkedGridUploadTest, self).setUp()
+
+        # A stand-in for the grids api, keeping the uploaded grid around.
+        self.request_mock = self.mock('plotly.api.v2.utils.requests.Session.request')
+        self.request_mock.side_effect = self.serve
+        self.mock('plotly.plotly.plotly._open_url')
+        self.columns = {}
+        self.bodies = []
+        self.fail_on = set()
+        self.fail_status = 500
+
+    def serve(self, method, url, **kwargs):
+        self.bodies.append(kwargs['data'])
+        if len(self.bodies) in self.fail_on:
+            self.fail_on.remove(len(self.bodies))
+            return self.get_response(b'{"errors": []}',
+                                     status_code=self.fail_status)
+
+        body = _json.loads(kwargs['data'])
+        if url.endswith('/v2/grids'):
+            cols = body['data']['cols']
+            names = sorted(cols, key=lambda name: cols[name]['order'])
+            for name in names:
+                self.columns[name] = cols[name]['data']
+            content = {'file': {
+                'fid': 'foo:1', 'web_url': 'https://who.am.i/~foo/1',
+                'cols': [{'name': name, 'uid': name} for name in names]
+            }}
+        elif url.endswith('/row'):
+            for row in body['rows']:
+                for name, value in zip(sorted(self.columns), row):
+                    self.columns[name].append(value)
+            content = {}
+        else:
+            cols = _json.loads(body['cols'])
+            for col in cols:
+                self.columns[col['name']] = col['data']
+            content = {'cols': [{'name': col['name'], 'uid': col['name']}
+                                for col in cols]}
+        return self.get_response(self.to_bytes(_json.dumps(content)))
+
+    def get_grid(self, num_rows=200):
+        return Grid([Column(list(range(num_rows)), 'a'),
+                     Column(['x{}'.format(i) for i in range(num_rows)], 'b')])
+
+    def test_upload_in_chunks(self):
+        grid = self.get_grid()
+        progress = []
+        py.grid_ops.upload(grid, 'chunks', max_chunk_bytes=500,
+                           progress=lambda *args: progress.append(args))
+
+        self.assertEqual(self.columns, {'a': grid[0].data, 'b': grid[1].data})
+        self.assertTrue(len(self.bodies) > 2)
+        for body in self.bodies:
+            self.assertTrue(len(body) <= 500)
+        self.assertEqual(progress[-1], (200, 200))
+        self.assertEqual(len(progress), len(self.bodies))
+        self.assertEqual(grid[0].id, 'foo:1:a')
+
+    def test_only_failed_chunk_is_retried(self):
+        grid = self.get_grid()
+        self.fail_on.add(3)
+        py.grid_ops.upload(grid, 'chunks', max_chunk_bytes=500,
+                           auto_open=False)
+
+        self.assertEqual(self.columns, {'a': grid[0].data, 'b': grid[1].data})
+        self.assertEqual(self.bodies[2], self.bodies[3])
+        self.assertEqual(len(set(self.bodies)), len(self.bodies) - 1)
+
+    def test_resume_upload(self):
+        grid = self.get_grid()
+        # client errors are not retried, the upload stops at the second chunk
+        self.fail_status = 400
+        self.fail_on.add(2)
+        with self.assertRaises(PlotlyRequestError):
+            py.grid_ops.upload(grid, 'chunks', max_chunk_bytes=500,
+                               auto_open=False)
+        uploaded_rows = grid._uploaded_rows
+        self.assertTrue(0 < uploaded_rows < 200)
+
+        progress = []
+        py.grid_ops.resume_upload(grid, max_chunk_bytes=500,
+                                  progress=lambda *args: progress.append(args))
+        self.assertEqual(self.columns, {'a': grid[0].data, 'b': grid[1].data})
+        self.assertEqual(progress[-1], (200, 200))
+
+        grid = self.get_grid()
+        py.grid_ops.upload(grid, 'no chunks', auto_open=False)
+        with self.assertRaisesRegexp(PlotlyError, 'chunks'):
+            py.grid_ops.resume_upload(grid, max_chunk_bytes=500)
+
+    def test_append_rows_and_columns_in_chunks(self):
+        grid = self.get_grid(num_rows=2)
+        py.grid_ops.upload(grid, 'chunks', auto_open=False)
+        self.assertEqual(len(self.bodies), 1)
+
+        rows = [[i, 'y{}'.format(i)] for i in range(100)]
+        py.grid_ops.append_rows(rows, grid=grid, max_chunk_bytes=300)
+        self.assertTrue(len(self.bodies) > 3)
+        self.assertEqual(self.columns, {'a': grid[0].data, 'b': grid[1].data})
+        self.assertEqual(grid[0].data[-1], 99)
+
+        columns = [Column(list(range(102)), 'c{}'.format(i))
+                   for i in range(3)]
+        py.grid_ops.append_columns(columns, grid=grid, max_chunk_bytes=600)
+        self.assertEqual([column.id for column in columns],
+                         ['foo:1:c0', 'foo:1:c1', 'foo:1:c2'])
+        self.assertEqual(self.columns['c2'], list(range(102)))
+        self.assertEqual(len(grid), 5)
@@ -4,12 +4,17 @@ Streaming tests.
 """
 from __future__ import absolute_import
 
+import json
+import socket
+import threading
 import time
 
 from nose.plugins.attrib import attr
 
 import plotly.plotly as py
+from plotly.exceptions import PlotlyError
 from plotly.graph_objs import (Layout, Scatter, Stream)
+from plotly.session import sign_in
 from plotly.tests.utils import PlotlyTestCase
 
 un = 'PythonAPI'
@@ -164,3 +169,159 @@ class TestStreaming(PlotlyTestCase):
         }
         actual_streaming_specs = my_stream.get_streaming_specs()
         self.assertEqual(expected_streaming_specs, actual_streaming_specs)
+
+
+class ChunkedServer(object):
+
+    # A stand-in for the streaming server. It reads one chunked post and
+    # records the chunks and the newline separated JSON points it got.
+
+    def __init__(self):
+        self.chunks = []
+        self.points = []
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.bind(('127.0.0.1', 0))
+        self.socket.listen(1)
+        self.port = self.socket.getsockname()[1]
+        self.thread = threading.Thread(target=self.serve)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def serve(self):
+        conn, _ = self.socket.accept()
+        body = conn.makefile('rb')
+        while body.readline().strip():
+            pass  # request line and headers
+        while True:
+            size = body.readline().strip()
+            if not size:
+                continue  # the client ends with an extra blank line
+            size = int(size, 16)
+            if size == 0:
+                break
+            chunk = body.read(size).decode('utf-8')
+            body.readline()
+            self.chunks.append(chunk)
+            self.points.extend(json.loads(line)
+                               for line in chunk.splitlines() if line)
+        conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n')
+        conn.close()
+        self.socket.close()
+
+
+class TestBufferedStreaming(PlotlyTestCase):
+
+    def setUp(self):
+        super(TestBufferedStreaming, self).setUp()
+        sign_in(un, ak, plotly_streaming_domain='http://127.0.0.1')
+        self.server = ChunkedServer()
+
+    def open_stream(self, **kwargs):
+        my_stream = py.Stream(tk, **kwargs)
+        my_stream.HTTP_PORT = self.server.port
+        my_stream.open()
+        return my_stream
+
+    def test_unbuffered_writes(self):
+        my_stream = self.open_stream()
+        my_stream.write(Scatter(x=[1], y=[float('nan')]))
+        my_stream.write({'x': 2, 'y': 3, 'type': 'scatter'})
+        my_stream.close()
+        self.server.thread.join(5)
+        self.assertEqual(self.server.points,
+                         [{'x': [1], 'y': [None]}, {'x': 2, 'y': 3}])
+        self.assertEqual(len(self.server.chunks), 2)
+
+    def test_buffered_writes_are_batched(self):
+        my_stream = self.open_stream(buffered=True, max_batch_points=100)
+        for i in range(1000):
+            my_stream.write(dict(x=i, y=2 * i))
+        my_stream.close()
+        self.server.thread.join(5)
+
+        self.assertEqual(self.server.points,
+                         [{'x': i, 'y': 2 * i} for i in range(1000)])
+        self.assertTrue(10 <= len(self.server.chunks) < 100)
+        stats = my_stream.stats
+        self.assertEqual(stats['written'], 1000)
+        self.assertEqual(stats['sent'], 1000)
+        self.assertEqual(stats['dropped'], 0)
+        self.assertEqual(stats['buffered'], 0)
+        self.assertEqual(stats['chunks'], len(self.server.chunks))
+
+    def test_buffered_writes_drop_oldest_when_full(self):
+        my_stream = self.open_stream(buffered=True, flush_interval=60,
+                                     max_buffered_points=10)
+        for i in range(25):
+            my_stream.write(dict(x=i))
+        self.assertEqual(my_stream.stats['buffered'], 10)
+        self.assertEqual(my_stream.stats['dropped'], 15)
+
+        my_stream.flush()
+        self.assertEqual(my_stream.stats['buffered'], 0)
+        my_stream.close()
+        self.server.thread.join(5)
+        self.assertEqual(self.server.points, [{'x': i} for i in range(15, 25)])
+        self.assertEqual(len(self.server.chunks), 1)
+
+    def test_buffered_writes_continue_after_failed_batch(self):
+        my_stream = self.open_stream(buffered=True, flush_interval=0.01)
+        chunked_stream = my_stream._stream
+        write = chunked_stream.write
+        failures = []
+
+        def write_failing_once(*args, **kwargs):
+            if not failures:
+                failures.append(1)
+                raise IOError('connection reset')
+            return write(*args, **kwargs)
+
+        chunked_stream.write = write_failing_once
+        my_stream.write(dict(x=0))
+        while my_stream.stats['dropped'] == 0:
+            time.sleep(0.01)
+
+        # the error of the failed batch is raised once
+        self.assertRaisesRegexp(IOError, 'connection reset',
+                                my_stream.write, dict(x=1))
+        for i in range(2, 7):
+            my_stream.write(dict(x=i))
+        while my_stream.stats['buffered']:
+            time.sleep(0.01)
+        self.assertTrue(my_stream._flusher.is_alive())
+
+        my_stream.close()
+        self.server.thread.join(5)
+        self.assertEqual(self.server.points, [{'x': i} for i in range(2, 7)])
+        stats = my_stream.stats
+        self.assertEqual(stats['sent'], 5)
+        self.assertEqual(stats['dropped'], 1)
+        self.assertEqual(stats['buffered'], 0)
+
+    def test_buffered_stream_with_stopped_flusher(self):
+        my_stream = self.open_stream(buffered=True, flush_interval=0.01)
+        with my_stream._buffer_condition:
+            my_stream._flusher_stop = True
+            my_stream._buffer_condition.notify_all()
+        my_stream._flusher.join()
+
+        # every write fails while nothing sends the queued points
+        for i in range(2):
+            self.assertRaisesRegexp(PlotlyError,
+                                    'has stopped', my_stream.write,
+                                    dict(x=i))
+        self.assertEqual(my_stream.stats['buffered'], 0)
+        my_stream.close()
+
+    def test_close_closes_connection_after_flush_error(self):
+        my_stream = self.open_stream(buffered=True, flush_interval=60)
+        chunked_stream = my_stream._stream
+        my_stream.write(dict(x=0))
+
+        def write_failing(*args, **kwargs):
+            raise IOError('connection reset')
+
+        chunked_stream.write = write_failing
+        self.assertRaisesRegexp(IOError, 'connection reset', my_stream.close)
+        self.assertFalse(my_stream.connected)
+        self.assertEqual(my_stream.stats['dropped'], 1)
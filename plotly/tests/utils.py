@@ -60,29 +60,35 @@ def compare_dict(dict1, dict2, equivalent=True, msg='', tol=10e-8):
                     "{0} should be {1}".format(
                         list(dict1.keys()), list(dict2.keys())))
     for key in dict1:
-        if isinstance(dict1[key], dict):
-            equivalent, msg = compare_dict(dict1[key],
-                                           dict2[key],
+        # compare numpy arrays as lists
+        val1, val2 = array_to_list(dict1[key]), array_to_list(dict2[key])
+        if isinstance(val1, dict):
+            equivalent, msg = compare_dict(val1,
+                                           val2,
                                            tol=tol)
-        elif isinstance(dict1[key], Num) and isinstance(dict2[key], Num):
-            if not comp_nums(dict1[key], dict2[key], tol):
+        elif isinstance(val1, Num) and isinstance(val2, Num):
+            if not comp_nums(val1, val2, tol):
                 return False, "['{0}'] = {1} should be {2}".format(key,
-                                                                   dict1[key],
-                                                                   dict2[key])
-        elif is_num_list(dict1[key]) and is_num_list(dict2[key]):
-            if not comp_num_list(dict1[key], dict2[key], tol):
+                                                                   val1,
+                                                                   val2)
+        elif is_num_list(val1) and is_num_list(val2):
+            if not comp_num_list(val1, val2, tol):
                 return False, "['{0}'] = {1} should be {2}".format(key,
-                                                                   dict1[key],
-                                                                   dict2[key])
-        elif not (dict1[key] == dict2[key]):
+                                                                   val1,
+                                                                   val2)
+        elif not (val1 == val2):
                 return False, "['{0}'] = {1} should be {2}".format(key,
-                                                                   dict1[key],
-                                                                   dict2[key])
+                                                                   val1,
+                                                                   val2)
         if not equivalent:
             return False, "['{0}']".format(key) + msg
     return equivalent, msg
 
 
+def array_to_list(v):
+    return v.tolist() if hasattr(v, 'tolist') else v
+
+
 def strip_dict_params(d1, d2, ignore=['uid']):
     """
     Helper function for assert_dict_equal
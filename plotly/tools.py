@@ -177,7 +177,8 @@ def set_config_file(plotly_domain=None,
                     plotly_proxy_authorization=None,
                     world_readable=None,
                     sharing=None,
-                    auto_open=None):
+                    auto_open=None,
+                    plotly_api_pool_size=None):
     """Set the keyword-value pairs in `~/.plotly/.config`.
 
     :param (str) plotly_domain: ex - https://plot.ly
@@ -186,6 +187,7 @@ def set_config_file(plotly_domain=None,
     :param (bool) plotly_ssl_verification: True = verify, False = don't verify
     :param (bool) plotly_proxy_authorization: True = use plotly proxy auth creds
     :param (bool) world_readable: True = public, False = private
+    :param (int) plotly_api_pool_size: connections kept alive per api host
 
     """
     if not ensure_writable_plotly_dir():
@@ -216,6 +218,11 @@ def set_config_file(plotly_domain=None,
         settings['plotly_proxy_authorization'] = plotly_proxy_authorization
     elif plotly_proxy_authorization is not None:
         raise TypeError('plotly_proxy_authorization should be a boolean')
+    if (isinstance(plotly_api_pool_size, int) and
+            not isinstance(plotly_api_pool_size, bool)):
+        settings['plotly_api_pool_size'] = plotly_api_pool_size
+    elif plotly_api_pool_size is not None:
+        raise TypeError('plotly_api_pool_size should be an integer')
     if isinstance(auto_open, bool):
         settings['auto_open'] = auto_open
     elif auto_open is not None:
@@ -619,7 +619,15 @@ class ElidedWrapper(object):
                        edgeitems=3,
                        linewidth=80))
 
-            res = self.v.__repr__()
+            if self.v.size > self.threshold:
+                # Elided arrays are summarized by their shape and dtype
+                res = 'array({body}, shape={shape}, dtype={dtype})'.format(
+                    body=numpy.array2string(
+                        self.v, separator=', ', prefix='array('),
+                    shape=self.v.shape,
+                    dtype=self.v.dtype)
+            else:
+                res = self.v.__repr__()
 
             # Add indent to all but the first line
             res_lines = res.split('\n')
@@ -639,14 +647,90 @@ class ElidedWrapper(object):
             return self.v.__repr__()
 
 
+class _ElidedItems(object):
+    """
+    Placeholder for the elements removed from a list by _elide_for_repr
+    """
+    def __init__(self, num_items=None):
+        self.num_items = num_items
+
+    def __repr__(self):
+        if self.num_items is None:
+            return '...'
+        else:
+            return '... ({num_items} more)'.format(num_items=self.num_items)
+
+
+def _elide_for_repr(v, threshold=200, edgeitems=3, max_items=10):
+    """
+    Return a copy of a nested dict/list structure that is small enough to
+    be pretty printed at a cost that doesn't depend on the size of the
+    data in it
+
+    Lists with more than `threshold` elements keep their first and last
+    `edgeitems` elements, lists of dicts (e.g. traces or annotations) keep
+    their first `max_items` dicts, and long strings are elided. numpy
+    arrays are not copied, their repr is elided by numpy.
+
+    Parameters
+    ----------
+    v :
+        Input value
+    threshold : int
+        Maximum number of elements of a list to keep
+    edgeitems : int
+        Number of elements kept at each end of elided lists
+    max_items : int
+        Maximum number of dicts of a list of dicts to keep
+
+    Returns
+    -------
+    Elided copy of the input value
+    """
+    def elide(e):
+        return _elide_for_repr(e, threshold=threshold, edgeitems=edgeitems,
+                               max_items=max_items)
+
+    if isinstance(v, dict):
+        res = {}
+        for k, e in v.items():
+            if isinstance(e, str) and len(e) > 80:
+                res[k] = ElidedWrapper(e, threshold, 0)
+            else:
+                res[k] = elide(e)
+        return res
+    elif isinstance(v, (list, tuple)):
+        if len(v) > 0 and isinstance(v[0], dict):
+            res = [elide(e) for e in v[:max_items]]
+            if len(v) > max_items:
+                res.append(_ElidedItems(len(v) - max_items))
+        elif len(v) > threshold:
+            res = ([elide(e) for e in v[:edgeitems]] +
+                   [_ElidedItems()] +
+                   [elide(e) for e in v[-edgeitems:]])
+        else:
+            res = [elide(e) for e in v]
+        return tuple(res) if isinstance(v, tuple) else res
+    else:
+        return v
+
+
 class ElidedPrettyPrinter(PrettyPrinter):
     """
     PrettyPrinter subclass that elides long lists/arrays/strings
     """
     def __init__(self, *args, **kwargs):
         self.threshold = kwargs.pop('threshold', 200)
+        self.max_items = kwargs.pop('max_items', 10)
         PrettyPrinter.__init__(self, *args, **kwargs)
 
+    def pformat(self, val):
+        # Elide the input up front. The PrettyPrinter computes the repr of
+        # every container it formats, including all of its elements
+        elided_val = _elide_for_repr(
+            val, threshold=self.threshold, max_items=self.max_items)
+        return PrettyPrinter.pformat(self, elided_val)
+
     def _format(self, val, stream, indent, allowance, context, level):
         if ElidedWrapper.is_wrappable(val):
             elided_val = ElidedWrapper(